@@ -1,11 +1,16 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
+# Prebuilt template pack (python asset_pack.py); without it the app decodes the Base64 sources.
+# Calibrated thresholds (python calibrate_thresholds.py); without them every element uses its default.
+asset_datas = [(name, '.') for name in ('ui_assets.pack', 'element_thresholds.json') if os.path.exists(name)]
 
 
 a = Analysis(
     ['PetFactory.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=asset_datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,185 @@
+"""
+Asset Pack Module
+Builds and loads ui_assets.pack: every B64_* template of ui_assets_b64 decoded
+once at build time and stored as raw BGR arrays behind a small JSON index.
+The pack is memory-mapped and arrays are handed out as views on first use, so
+nothing is decoded (or even read from disk) until a template is searched for.
+
+The pack records the hash of the source module it was built from; a pack built
+from an older ui_assets_b64.py (or by an older format version) is reported as
+stale and ignored, and ui_assets falls back to decoding the Base64 strings.
+
+Usage:
+    python asset_pack.py            # (re)build ui_assets.pack
+    python asset_pack.py --check    # exit 1 if the pack is missing or stale
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from datetime import datetime
+
+import numpy as np
+
+PACK_MAGIC = b"PFASSETS"
+PACK_VERSION = 1  # Bump when the file layout changes
+PACK_ALIGNMENT = 64  # Arrays start on this boundary
+HEADER = struct.Struct("<8sIII")  # magic, version, index length, data offset
+
+SOURCE_MODULE = "ui_assets_b64"
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK_PATH = os.path.join(ASSET_DIR, "ui_assets.pack")
+DEFAULT_SOURCE_PATH = os.path.join(ASSET_DIR, f"{SOURCE_MODULE}.py")
+
+
+def _log(message):
+    print(f"[AssetPack] {message}")
+
+
+def source_hash(source_path=DEFAULT_SOURCE_PATH):
+    """SHA-256 of the asset source module (None if it is not available, e.g. in a frozen build)"""
+    if not source_path or not os.path.exists(source_path):
+        return None
+    with open(source_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class AssetPack:
+    """Read-only, memory-mapped asset pack"""
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, version, index_length, data_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("not an asset pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"pack format version {version}, expected {PACK_VERSION}")
+        
+        index = json.loads(self._mmap[HEADER.size:HEADER.size + index_length].decode("utf-8"))
+        self.source_hash = index['source_hash']
+        self.built = index['built']
+        self._assets = index['assets']  # name -> [offset into the data section, height, width]
+        self._data_offset = data_offset
+        self._views = {}
+    
+    def __contains__(self, name):
+        return name in self._assets
+    
+    def names(self):
+        return list(self._assets)
+    
+    def get(self, name):
+        """
+        BGR array of an asset as a read-only view into the mapped file.
+        The same view object is returned on every call.
+        """
+        view = self._views.get(name)
+        if view is None:
+            offset, height, width = self._assets[name]
+            view = np.frombuffer(self._mmap, dtype=np.uint8, count=height * width * 3,
+                                 offset=self._data_offset + offset)
+            view = self._views[name] = view.reshape(height, width, 3)
+        return view
+
+
+def load_pack(path=DEFAULT_PACK_PATH, source_path=DEFAULT_SOURCE_PATH):
+    """
+    Open the asset pack if it exists and matches the asset sources.
+    
+    Returns:
+        AssetPack or None if the pack is missing, unreadable or stale
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = AssetPack(path)
+    except Exception as e:
+        _log(f"Ignoring {path}: {e}")
+        return None
+    
+    expected = source_hash(source_path)
+    if expected is not None and pack.source_hash != expected:
+        _log(f"Ignoring stale {path} (built {pack.built}); rebuild it with: python asset_pack.py")
+        return None
+    return pack
+
+
+def build_pack(path=DEFAULT_PACK_PATH, source_path=DEFAULT_SOURCE_PATH):
+    """
+    Decode every B64_* constant of the asset source module and write the pack.
+    Constants that alias another constant share its data; ones that do not
+    decode (placeholders) are left out and keep resolving to their Base64 string.
+    
+    Returns:
+        dict: {'assets', 'skipped', 'bytes'}
+    """
+    import image_search
+    import ui_assets_b64
+    
+    arrays, assets, skipped = [], {}, []
+    offsets_by_source = {}
+    offset = 0
+    for name in sorted(vars(ui_assets_b64)):
+        value = getattr(ui_assets_b64, name)
+        if not name.startswith("B64_") or not isinstance(value, str):
+            continue
+        if value in offsets_by_source:
+            assets[name] = offsets_by_source[value]
+            continue
+        try:
+            bgr = image_search._decode_b64_template(value)
+        except Exception:
+            skipped.append(name)
+            continue
+        offset = -(-offset // PACK_ALIGNMENT) * PACK_ALIGNMENT
+        assets[name] = offsets_by_source[value] = [offset, bgr.shape[0], bgr.shape[1]]
+        arrays.append((offset, bgr))
+        offset += bgr.nbytes
+    
+    index = {
+        'source_hash': source_hash(source_path),
+        'built': datetime.now().isoformat(timespec="seconds"),
+        'assets': assets,
+    }
+    index_bytes = json.dumps(index).encode("utf-8")
+    data_offset = -(-(HEADER.size + len(index_bytes)) // PACK_ALIGNMENT) * PACK_ALIGNMENT
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes), data_offset))
+        f.write(index_bytes)
+        for array_offset, bgr in arrays:
+            f.seek(data_offset + array_offset)
+            f.write(bgr.tobytes())
+    os.replace(tmp_path, path)
+    return {'assets': len(assets), 'skipped': skipped, 'bytes': os.path.getsize(path)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the binary UI asset pack")
+    parser.add_argument("--output", default=DEFAULT_PACK_PATH, help="Pack file to write or check")
+    parser.add_argument("--check", action="store_true", help="Only check whether the pack is up to date")
+    args = parser.parse_args(argv)
+    
+    if args.check:
+        if load_pack(args.output) is None:
+            _log(f"{args.output} is missing or stale")
+            return 1
+        _log(f"{args.output} is up to date")
+        return 0
+    
+    result = build_pack(args.output)
+    _log(f"Wrote {args.output}: {result['assets']} assets, {result['bytes'] / 1024:.1f} KB")
+    for name in result['skipped']:
+        _log(f"Skipped {name} (could not be decoded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
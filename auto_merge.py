@@ -6,7 +6,9 @@ import time
 import pyautogui
 import pygetwindow as gw
 
-from ui_assets import get_ui_coord, get_pet_coord
+from image_search import invalidate_frame_cache
+from ui_assets import get_ui_coord, get_pet_coord, search_many, find_all, screen_visible
+from ui_assets import SCREEN_MERGE, SCREEN_BAG
 
 # =============================================================================
 # CONSTANTS
@@ -62,6 +64,7 @@ def click_at_window_position(window, rel_x, rel_y, delay=None, button='left'):
     
     # Click
     pyautogui.click(abs_x, abs_y, button=button)
+    invalidate_frame_cache(window)
     time.sleep(delay)  # Use configured delay
 
 
@@ -82,6 +85,7 @@ def drag_to_corner(window):
     time.sleep(0.1)
     pyautogui.moveTo(end_x, end_y, duration=0.5)
     pyautogui.mouseUp()
+    invalidate_frame_cache(window)
     time.sleep(0.3)
 
 
@@ -136,6 +140,7 @@ def drag_element_to_target(window, from_coord, to_coord):
     
     # Final release to be sure
     pyautogui.mouseUp()
+    invalidate_frame_cache(window)
     time.sleep(0.8)  # Increased final wait for UI to update
 
 
@@ -187,9 +192,15 @@ def portal_to_athens(window):
 def open_pet_manager(window):
     """
     Steps 2-4: Click Search -> Pet Manager -> Pet Tab
+    Skipped when the Merge button or the merge interface is already showing
+    (an open pet window alone does not mean the character is at the Pet Manager).
     Returns: True if successful, False otherwise
     """
     check_merge_stop()
+    found = search_many(window, ["MERGE", "SLOT_A", "MERGING_PETS"])
+    if any(coords for coords, _ in found.values()):
+        print("[AUTO_MERGE] Merge already available, skipping Pet Manager")
+        return True
     
     # Step 2: Click Search (retry until found)
     check_merge_stop()
@@ -268,10 +279,10 @@ def setup_merge_interface(window, receiver_slot):
             break
         time.sleep(0.5)
     
-    # Step 6: Click Merge button (retry until found)
+    # Step 6: Click Merge button (retry until found) unless the merge interface is already open
     check_merge_stop()
     print("[AUTO_MERGE] Searching for Merge button...")
-    while True:
+    while not screen_visible(window, SCREEN_MERGE):
         check_merge_stop()
         merge_coords = get_ui_coord(window, "MERGE")
         if merge_coords:
@@ -316,41 +327,31 @@ def perform_single_merge(window, receiver_slot, provider_slot, use_merged_spirit
     """
     check_merge_stop()
     
-    # Step 8: Find receiver pet and drag to Slot A (retry until found)
-    print(f"[AUTO_MERGE] Searching for receiver pet {receiver_slot + 1}...")
-    while True:
-        check_merge_stop()
-        receiver_coords = get_pet_coord(window, receiver_slot)
-        if receiver_coords:
-            break
-        time.sleep(0.5)
-    
-    print("[AUTO_MERGE] Searching for Slot A...")
+    # Step 8: Find receiver pet and drag to Slot A (retry until both found, one capture per try)
+    receiver_name = f"PET_{receiver_slot + 1}"
+    print(f"[AUTO_MERGE] Searching for receiver pet {receiver_slot + 1} and Slot A...")
     while True:
         check_merge_stop()
-        slot_a_coords = get_ui_coord(window, "SLOT_A")
-        if slot_a_coords:
+        found = search_many(window, [receiver_name, "SLOT_A"])
+        receiver_coords = found[receiver_name][0]
+        slot_a_coords = found["SLOT_A"][0]
+        if receiver_coords and slot_a_coords:
             break
         time.sleep(0.5)
     
     drag_element_to_target(window, receiver_coords, slot_a_coords)
     print(f"[AUTO_MERGE] Dragged pet {receiver_slot + 1} to Slot A")
     
-    # Step 9: Find provider pet and drag to Slot B (retry until found)
+    # Step 9: Find provider pet and drag to Slot B (retry until both found, one capture per try)
     check_merge_stop()
-    print(f"[AUTO_MERGE] Searching for provider pet {provider_slot + 1}...")
+    provider_name = f"PET_{provider_slot + 1}"
+    print(f"[AUTO_MERGE] Searching for provider pet {provider_slot + 1} and Slot B...")
     while True:
         check_merge_stop()
-        provider_coords = get_pet_coord(window, provider_slot)
-        if provider_coords:
-            break
-        time.sleep(0.5)
-    
-    print("[AUTO_MERGE] Searching for Slot B...")
-    while True:
-        check_merge_stop()
-        slot_b_coords = get_ui_coord(window, "SLOT_B")
-        if slot_b_coords:
+        found = search_many(window, [provider_name, "SLOT_B"])
+        provider_coords = found[provider_name][0]
+        slot_b_coords = found["SLOT_B"][0]
+        if provider_coords and slot_b_coords:
             break
         time.sleep(0.5)
     
@@ -398,7 +399,9 @@ def perform_single_merge(window, receiver_slot, provider_slot, use_merged_spirit
     
     # Step 13: Reopen merge interface (it closes after the 4 clicks)
     time.sleep(0.5)
-    merge_coords = get_ui_coord(window, "MERGE")
+    merge_coords = None
+    if not screen_visible(window, SCREEN_MERGE):
+        merge_coords = get_ui_coord(window, "MERGE")
     if merge_coords:
         click_at_window_position(window, merge_coords[0], merge_coords[1])
         print("[AUTO_MERGE] Reopened Merge interface")
@@ -424,14 +427,15 @@ def collect_new_pets(window, provider_slot):
     """
     check_merge_stop()
     
-    # Open main bag
+    # Open main bag (the button is still needed to close it when the bag is already open)
     print("[AUTO_MERGE] Searching for Bag button...")
     while True:
         check_merge_stop()
         bag_coords = get_ui_coord(window, "BAG")
         if bag_coords:
-            click_at_window_position(window, bag_coords[0], bag_coords[1])
-            time.sleep(0.5)
+            if not screen_visible(window, SCREEN_BAG):
+                click_at_window_position(window, bag_coords[0], bag_coords[1])
+                time.sleep(0.5)
             break
         time.sleep(0.5)
     
@@ -461,16 +465,21 @@ def collect_new_pets(window, provider_slot):
             consecutive_fails = 0
             print(f"[AUTO_MERGE] Continuing search in New Bag ({BAG_SEARCH_MAX_ATTEMPTS - attempts_made} attempts remaining)...")
         
-        pet_coords = get_ui_coord(window, "PET_IN_BAG")
-        if pet_coords:
-            click_at_window_position(window, pet_coords[0], pet_coords[1], 
-                                   delay=PET_BAG_DELAY, button='right')
-            pets_collected += 1
+        # Every pet visible in the bag from one capture. Click the last slot first
+        # so a bag that compacts after each removal does not shift the rest.
+        bag_pets = find_all(window, "PET_IN_BAG")
+        if bag_pets:
+            bag_pets.sort(key=lambda c: (c[1], c[0]), reverse=True)
+            for pet_coords in bag_pets[:BAG_SEARCH_MAX_ATTEMPTS - attempts_made]:
+                check_merge_stop()
+                click_at_window_position(window, pet_coords[0], pet_coords[1], 
+                                       delay=PET_BAG_DELAY, button='right')
+                pets_collected += 1
+                attempts_made += 1
             consecutive_fails = 0
         else:
             consecutive_fails += 1
-        
-        attempts_made += 1
+            attempts_made += 1
     
     # Close bag
     click_at_window_position(window, bag_coords[0], bag_coords[1])
@@ -485,16 +494,21 @@ def collect_new_pets(window, provider_slot):
 
 def close_all_interfaces(window):
     """
-    Step 15: Find and click close button up to 10 times
+    Step 15: Find and click close buttons (up to 10 clicks). All buttons visible
+    on one capture are clicked, then the window is checked again for any that
+    were hidden behind the closed interfaces.
     """
-    for i in range(CLOSE_INTERFACE_ATTEMPTS):
+    clicks = 0
+    while clicks < CLOSE_INTERFACE_ATTEMPTS:
         check_merge_stop()
         
-        close_coords = get_ui_coord(window, "CLOSE_INTERFACE")
-        if close_coords:
-            click_at_window_position(window, close_coords[0], close_coords[1], delay=0.3)
-        else:
+        close_buttons = find_all(window, "CLOSE_INTERFACE")
+        if not close_buttons:
             break
+        for close_coords in close_buttons[:CLOSE_INTERFACE_ATTEMPTS - clicks]:
+            check_merge_stop()
+            click_at_window_position(window, close_coords[0], close_coords[1], delay=0.3)
+            clicks += 1
     
     print("[AUTO_MERGE] Closed interfaces")
 
@@ -521,9 +535,9 @@ def apply_feather(window):
         check_merge_stop()
         pet_manager_coords = get_ui_coord(window, "PET_MANAGER_NPC")
         if pet_manager_coords:
-            # Click 290px below the found NPC position
+            # Click point is 290px below the found NPC position (offset set in ui_assets)
             target_x = pet_manager_coords[0]
-            target_y = pet_manager_coords[1] + 290
+            target_y = pet_manager_coords[1]
             
             # Calculate absolute screen coordinates
             abs_x = window.left + target_x
@@ -535,6 +549,7 @@ def apply_feather(window):
             
             # Click and wait for dialog
             pyautogui.click()
+            invalidate_frame_cache(window)
             time.sleep(2.5)
             print("[AUTO_MERGE] Clicked Pet Manager NPC")
             break
@@ -644,9 +659,9 @@ def travel_to_afk_spot(window, destination):
         check_merge_stop()
         transporter_coords = get_ui_coord(window, "TRANSPORTER_NPC")
         if transporter_coords:
-            # Offset: 0px left, 170px down from the fixed anchor stone (user adjustment)
+            # Click point is 170px down from the fixed anchor stone (offset set in ui_assets)
             target_x = transporter_coords[0]
-            target_y = transporter_coords[1] + 170
+            target_y = transporter_coords[1]
             
             # Calculate absolute screen coordinates (required for directly using moveTo)
             abs_x = window.left + target_x
@@ -658,6 +673,7 @@ def travel_to_afk_spot(window, destination):
             
             # Click and wait for dialog
             pyautogui.click()
+            invalidate_frame_cache(window)
             time.sleep(2.5)  # Wait for dialog to open
             print("[AUTO_MERGE] Clicked Transporter NPC")
             break
@@ -746,9 +762,7 @@ def _travel_larissa(window):
     print("[AUTO_MERGE] Searching for Mycenae Transporter in Thebes...")
     while True:
         check_merge_stop()
-        myc_trans_coords = get_ui_coord(window, "MYCENAE_TRANSPORTER")
-        if not myc_trans_coords:
-            myc_trans_coords = get_ui_coord(window, "TRANSPORTER_NPC")
+        myc_trans_coords = get_ui_coord(window, "MYCENAE_TRANSPORTER")  # Falls back to the generic NPC template
         if myc_trans_coords:
             break
         time.sleep(0.5)
@@ -762,6 +776,7 @@ def _travel_larissa(window):
     pyautogui.moveTo(abs_x, abs_y)
     time.sleep(1.0)
     pyautogui.click()
+    invalidate_frame_cache(window)
     
     # 5. Wait 3s
     time.sleep(3.0)
@@ -800,9 +815,7 @@ def _travel_larissa(window):
     print("[AUTO_MERGE] Searching for Inner Transporter in Mycenae...")
     while True:
         check_merge_stop()
-        myc_inner_trans_coords = get_ui_coord(window, "MYCENAE_INNER_TRANSPORTER")
-        if not myc_inner_trans_coords:
-            myc_inner_trans_coords = get_ui_coord(window, "TRANSPORTER_NPC")
+        myc_inner_trans_coords = get_ui_coord(window, "MYCENAE_INNER_TRANSPORTER")  # Falls back to the generic NPC template
         if myc_inner_trans_coords:
             break
         time.sleep(0.5)
@@ -816,6 +829,7 @@ def _travel_larissa(window):
     pyautogui.moveTo(abs_x, abs_y)
     time.sleep(1.0)
     pyautogui.click()
+    invalidate_frame_cache(window)
     time.sleep(5.0) 
     
     # 11. Click Transmit of Mycenae (retry until found)
@@ -823,8 +837,6 @@ def _travel_larissa(window):
     while True:
         check_merge_stop()
         transmit_myc_coords = get_ui_coord(window, "TRANSMIT_MYCENAE")
-        if not transmit_myc_coords:
-            transmit_myc_coords = get_ui_coord(window, "TRANSMIT")
         if transmit_myc_coords:
             click_at_window_position(window, transmit_myc_coords[0], transmit_myc_coords[1])
             break
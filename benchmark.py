@@ -0,0 +1,372 @@
+"""
+Benchmark Module
+Measures the template matching hot path (decode, capture, match, lookup) on
+recorded window screenshots through the replay capture backend, so it runs
+headless. Writes a JSON report that can be compared against a previous run.
+
+Usage:
+    python benchmark.py --frames recordings/ --output bench_report.json
+    python benchmark.py --frames recordings/ --baseline old_report.json
+    python benchmark.py --synthetic 1024x768
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+import image_search
+import ui_assets
+
+REPORT_VERSION = 1
+DEFAULT_ITERATIONS = 20
+DEFAULT_MAX_REGRESSION = 0.25  # Flag elements that got 25% slower than the baseline
+MIN_REGRESSION_MS = 0.5  # Ignore slowdowns smaller than this (timer noise)
+COMPARED_METRICS = ("match_ms", "lookup_ms")
+DEFAULT_THREAD_COUNTS = (1, 2, 4, 8)
+MERGE_INTERFACE_ELEMENTS = ("SLOT_A", "SLOT_B", "MERGING_PETS", "MERGE", "CLOSE_INTERFACE")
+
+
+def _median_ms(func, iterations):
+    """Run func iterations times and return the median duration in milliseconds"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def all_element_names():
+    """Every element name resolvable through ui_assets (UI elements and pet slots)"""
+    return ui_assets.element_names()
+
+
+def element_search_kwargs(name):
+    """Per-element search options as ui_assets applies them"""
+    element = ui_assets.get_element(name)
+    return {
+        'min_confidence': element.min_confidence,
+        'roi': element.roi,
+        'pyramid': element.pyramid,
+        'mode': element.mode,
+    }
+
+
+def build_synthetic_frame(width, height, seed=0):
+    """Noise background with every template pasted on a grid, for runs without recordings"""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 60, (height, width, 3), dtype=np.uint8)
+    x, y, row_h = 10, 10, 0
+    for name in all_element_names():
+        template = image_search.get_template(ui_assets.get_element(name).source, name).bgr
+        th, tw = template.shape[:2]
+        if x + tw > width:
+            x, y, row_h = 10, y + row_h + 10, 0
+        if y + th > height:
+            break
+        frame[y:y + th, x:x + tw] = template
+        x += tw + 10
+        row_h = max(row_h, th)
+    image_search.clear_template_cache()
+    return frame
+
+
+def _window_for(backend):
+    """StaticWindow sized like the backend's current frame"""
+    h, w = backend.frame().shape[:2]
+    return image_search.StaticWindow(0, 0, w, h, title=backend.frame_name())
+
+
+def bench_elements(backend, names, iterations):
+    """Per-element decode, capture, match and lookup latency (medians over all frames)"""
+    results = {}
+    for name in names:
+        source = ui_assets.get_element(name).source
+        kwargs = element_search_kwargs(name)
+        decode_ms = _median_ms(lambda: image_search._decode_template(source), iterations)
+        compiled = image_search.get_template(source, name)
+        
+        capture, match, lookup = [], [], []
+        best_confidence, best_frame = 0.0, None
+        for index in range(len(backend)):
+            backend.seek(index)
+            window = _window_for(backend)
+            region = (window.left, window.top, window.width, window.height)
+            image_search.invalidate_frame_cache(window)
+            frame = image_search.capture_frame(window)
+            
+            def cold_match():
+                image_search.reset_search_state()
+                return image_search._search_frame(frame, compiled, element_name=name, **kwargs)
+            
+            def lookup_once():
+                image_search.invalidate_frame_cache(window)
+                return image_search.search_image(source, window, element_name=name, return_confidence=True, **kwargs)
+            
+            capture.append(_median_ms(lambda: image_search._grab_region(region), iterations))
+            match.append(_median_ms(cold_match, iterations))
+            image_search.reset_search_state()
+            lookup.append(_median_ms(lookup_once, iterations))
+            
+            _, confidence = lookup_once()
+            if confidence > best_confidence:
+                best_confidence, best_frame = confidence, backend.frame_name()
+        
+        results[name] = {
+            'decode_ms': round(decode_ms, 4),
+            'capture_ms': round(statistics.median(capture), 4),
+            'match_ms': round(statistics.median(match), 4),
+            'lookup_ms': round(statistics.median(lookup), 4),
+            'best_confidence': round(best_confidence, 4),
+            'best_frame': best_frame,
+        }
+    return results
+
+
+def bench_throughput(backend, names, iterations):
+    """Repeated get_ui_coord-style lookups over every element and frame (after one warm-up pass)"""
+    def run_pass():
+        count = 0
+        for index in range(len(backend)):
+            backend.seek(index)
+            window = _window_for(backend)
+            for name in names:
+                image_search.invalidate_frame_cache(window)
+                image_search.search_image(ui_assets.get_element(name).source, window, element_name=name,
+                                          **element_search_kwargs(name))
+                count += 1
+        return count
+    
+    run_pass()
+    lookups = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        lookups += run_pass()
+    seconds = time.perf_counter() - start
+    return {
+        'lookups': lookups,
+        'seconds': round(seconds, 4),
+        'lookups_per_sec': round(lookups / seconds, 2) if seconds else 0.0,
+    }
+
+
+def bench_batches(backend, names, iterations, thread_counts=DEFAULT_THREAD_COUNTS):
+    """
+    Cold search_many batches matched serially (1 thread) and on the thread pool.
+    
+    Returns:
+        dict: {batch: {threads: median ms per batch}} plus a 'speedup' entry per batch
+    """
+    batches = {
+        'pet_slots': [f"PET_{i + 1}" for i in range(ui_assets.PET_SLOT_COUNT)],
+        'merge_interface': list(MERGE_INTERFACE_ELEMENTS),
+        'all_elements': list(names),
+    }
+    previous_threads = image_search.MATCH_THREADS
+    results = {}
+    try:
+        for batch, batch_names in batches.items():
+            templates = [(name, ui_assets.get_element(name).source) for name in batch_names]
+            kwargs = {key: {name: element_search_kwargs(name)[key] for name in batch_names}
+                      for key in ('min_confidence', 'pyramid', 'mode')}
+            kwargs['rois'] = {name: element_search_kwargs(name)['roi'] for name in batch_names}
+            timings = {}
+            for threads in thread_counts:
+                image_search.set_match_threads(threads)
+                medians = []
+                for index in range(len(backend)):
+                    backend.seek(index)
+                    window = _window_for(backend)
+                    image_search.invalidate_frame_cache(window)
+                    image_search.capture_frame(window)
+                    
+                    def cold_batch():
+                        image_search.reset_search_state()
+                        image_search.search_many(templates, window, kwargs['min_confidence'], kwargs['rois'],
+                                                 kwargs['pyramid'], kwargs['mode'])
+                    
+                    cold_batch()
+                    medians.append(_median_ms(cold_batch, iterations))
+                timings[str(threads)] = round(statistics.median(medians), 4)
+            serial = timings[str(thread_counts[0])]
+            timings['speedup'] = {threads: round(serial / ms, 2) if ms else None
+                                  for threads, ms in timings.items() if threads != str(thread_counts[0])}
+            results[batch] = timings
+    finally:
+        image_search.set_match_threads(previous_threads)
+    return results
+
+
+def bench_exact(backend, iterations):
+    """
+    Cold match time of every "exact" element in exact mode versus plain BGR matching.
+    
+    Returns:
+        dict: {name: {'exact_ms', 'bgr_ms', 'speedup', 'same_result'}} (medians over all frames)
+    """
+    results = {}
+    for name in all_element_names():
+        kwargs = element_search_kwargs(name)
+        if kwargs['mode'] != "exact":
+            continue
+        compiled = image_search.get_template(ui_assets.get_element(name).source, name)
+        timings = {'exact': [], 'bgr': []}
+        same_result = True
+        for index in range(len(backend)):
+            backend.seek(index)
+            window = _window_for(backend)
+            image_search.invalidate_frame_cache(window)
+            frame = image_search.capture_frame(window)
+            found = {}
+            for mode in timings:
+                kwargs['mode'] = mode
+                
+                def cold_match():
+                    image_search.reset_search_state()
+                    return image_search._search_frame(frame, compiled, element_name=name, **kwargs)
+                
+                found[mode] = cold_match()[0]
+                timings[mode].append(_median_ms(cold_match, iterations))
+            same_result = same_result and found['exact'] == found['bgr']
+        exact_ms, bgr_ms = statistics.median(timings['exact']), statistics.median(timings['bgr'])
+        results[name] = {
+            'exact_ms': round(exact_ms, 4),
+            'bgr_ms': round(bgr_ms, 4),
+            'speedup': round(bgr_ms / exact_ms, 2) if exact_ms else None,
+            'same_result': same_result,
+        }
+    return results
+
+
+def run_benchmark(backend, iterations=DEFAULT_ITERATIONS, names=None, thread_counts=DEFAULT_THREAD_COUNTS):
+    """Run the whole suite against a replay backend and return the report dictionary"""
+    names = names or all_element_names()
+    previous_backend = image_search.get_capture_backend()
+    image_search.set_capture_backend(backend)
+    image_search.clear_template_cache()
+    image_search.reset_search_state()
+    
+    tracemalloc.start()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            elements = bench_elements(backend, names, iterations)
+            throughput = bench_throughput(backend, names, iterations)
+            batches = bench_batches(backend, names, iterations, thread_counts)
+            exact = bench_exact(backend, iterations)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        image_search.set_capture_backend(previous_backend)
+    
+    return {
+        'version': REPORT_VERSION,
+        'timestamp': datetime.now().isoformat(timespec="seconds"),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'opencv': cv2.__version__,
+        'frames': [backend.frame_name(i) for i in range(len(backend))],
+        'iterations': iterations,
+        'elements': elements,
+        'throughput': throughput,
+        'cpu_count': os.cpu_count(),
+        'batches': batches,
+        'exact': exact,
+        'peak_memory_mb': round(peak / (1024 * 1024), 2),
+    }
+
+
+def compare_reports(report, baseline, max_regression=DEFAULT_MAX_REGRESSION):
+    """
+    Compare a report against a baseline report.
+    
+    Returns:
+        list: (element, metric, baseline_ms, current_ms) for every regression
+    """
+    regressions = []
+    for name, current in report['elements'].items():
+        previous = baseline.get('elements', {}).get(name)
+        if not previous:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + max_regression) and new - old > MIN_REGRESSION_MS:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def print_summary(report):
+    """Print the per-element table and totals"""
+    print(f"{'ELEMENT':<28}{'decode':>9}{'capture':>9}{'match':>9}{'lookup':>9}{'conf':>8}")
+    for name, row in report['elements'].items():
+        print(f"{name:<28}{row['decode_ms']:>9.2f}{row['capture_ms']:>9.2f}{row['match_ms']:>9.2f}"
+              f"{row['lookup_ms']:>9.2f}{row['best_confidence']:>8.2f}")
+    throughput = report['throughput']
+    print(f"\nThroughput: {throughput['lookups_per_sec']} lookups/s ({throughput['lookups']} lookups)")
+    print(f"Peak memory: {report['peak_memory_mb']} MB")
+    print(f"\nBatch matching on {report['cpu_count']} CPUs (ms per cold search_many by thread count):")
+    for batch, timings in report['batches'].items():
+        columns = "  ".join(f"{threads}t={ms:.2f}" for threads, ms in timings.items() if threads != 'speedup')
+        speedups = "  ".join(f"{threads}t x{value}" for threads, value in timings['speedup'].items())
+        print(f"  {batch:<18}{columns}   speedup: {speedups}")
+    if report['exact']:
+        print("\nExact-pixel matching vs BGR (ms per cold match):")
+        for name, row in report['exact'].items():
+            note = "" if row['same_result'] else "   (results differ)"
+            print(f"  {name:<18}exact={row['exact_ms']:.2f}  bgr={row['bgr_ms']:.2f}  x{row['speedup']}{note}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the template matching hot path")
+    parser.add_argument("--frames", help="Directory of recorded window screenshots")
+    parser.add_argument("--synthetic", metavar="WxH", help="Use a generated frame instead of recordings")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--elements", nargs="*", help="Only benchmark these elements")
+    parser.add_argument("--threads", type=int, nargs="*", default=list(DEFAULT_THREAD_COUNTS),
+                        help="Thread counts compared for batch matching (the first is the baseline)")
+    parser.add_argument("--output", default="bench_report.json", help="Where to write the JSON report")
+    parser.add_argument("--baseline", help="Previous report to check for regressions")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Allowed slowdown as a fraction (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+    image_search.TELEMETRY_DUMP_PATH = None  # Benchmark lookups are not real session telemetry
+    
+    if args.frames:
+        backend = image_search.ReplayBackend(args.frames)
+    elif args.synthetic:
+        width, height = (int(v) for v in args.synthetic.lower().split("x"))
+        backend = image_search.ReplayBackend([build_synthetic_frame(width, height)])
+    else:
+        parser.error("pass --frames DIR or --synthetic WxH")
+    
+    report = run_benchmark(backend, args.iterations, args.elements, tuple(args.threads))
+    print_summary(report)
+    
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.max_regression)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old:.2f}ms -> {new:.2f}ms")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Threshold Calibration Module
+Finds a match threshold for every ui_assets element from labeled recordings.
+
+Each element is matched (at its configured match mode) against every recorded
+frame by the same whole-window stage lookups run for it: coarse-to-fine for
+elements with a pyramid, exact-pixel first for "exact" elements. Its best
+confidence on frames where it is visible and on frames where it is not gives
+the threshold: halfway between the weakest true match and the strongest false
+one. The distance between the two is the separation margin; a negative margin
+means no threshold separates them and the one with the fewest wrong answers is
+used.
+
+Labels are a JSON file mapping frame file names to the elements visible in them:
+    {"pet_window.png": ["PET_1", "PET_TAB", "CLOSE_PET"],
+     "bag.png": {"present": ["PET_IN_BAG"], "absent": ["OK"]}}
+A plain list means every other element is absent from that frame; the
+present/absent form only labels the elements it names.
+
+Usage:
+    python calibrate_thresholds.py --frames recordings/ --labels recordings/labels.json
+    python calibrate_thresholds.py --frames recordings/ --labels labels.json --dry-run
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+from datetime import datetime
+
+import image_search
+import ui_assets
+
+THRESHOLDS_VERSION = 1
+MIN_THRESHOLD = 0.5  # Never calibrate below this
+MAX_THRESHOLD = 0.99
+PRESENT_ONLY_SAFETY = 0.05  # Without absent samples, stay this far below the weakest true match
+
+
+def load_labels(path, names):
+    """
+    Read a labels file.
+    
+    Returns:
+        dict: {frame_name: {element_name: True (present) or False (absent)}}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    
+    labels = {}
+    for frame_name, entry in raw.items():
+        if isinstance(entry, dict):
+            frame_labels = {name: True for name in entry.get('present', [])}
+            frame_labels.update({name: False for name in entry.get('absent', [])})
+        else:
+            frame_labels = {name: name in entry for name in names}
+        unknown = [name for name in frame_labels if ui_assets.get_element(name) is None]
+        for name in unknown:
+            print(f"[Calibrate] {frame_name}: unknown element {name} ignored")
+            del frame_labels[name]
+        labels[frame_name] = frame_labels
+    return labels
+
+
+def score_frames(backend, labels, names):
+    """
+    Best match confidence of every labeled element on every labeled frame.
+    
+    Returns:
+        dict: {element_name: {'present': [confidences], 'absent': [confidences]}}
+    """
+    scores = {name: {'present': [], 'absent': []} for name in names}
+    for index in range(len(backend)):
+        frame_labels = labels.get(backend.frame_name(index))
+        if not frame_labels:
+            continue
+        backend.seek(index)
+        h, w = backend.frame().shape[:2]
+        window = image_search.StaticWindow(0, 0, w, h, title=backend.frame_name())
+        image_search.invalidate_frame_cache(window)
+        frame = image_search.capture_frame(window)
+        for name, present in frame_labels.items():
+            if name not in scores:
+                continue
+            element = ui_assets.get_element(name)
+            compiled = image_search.get_template(element.source, element.name)
+            if compiled.width > frame.width or compiled.height > frame.height:
+                continue
+            # Same whole-window stage as image_search._search_frame, so scores match what lookups compare
+            if element.pyramid:
+                confidence, _ = image_search._match_pyramid(frame, compiled, element.pyramid, element.mode)
+            else:
+                confidence, _ = image_search._match_stage(frame, compiled, element.mode)
+            scores[name]['present' if present else 'absent'].append(confidence)
+    return scores
+
+
+def choose_threshold(present, absent):
+    """
+    Threshold and separation margin for one element.
+    
+    Returns:
+        tuple: (threshold, margin) - margin is None without absent samples
+    """
+    weakest_hit = min(present)
+    if not absent:
+        return max(MIN_THRESHOLD, min(MAX_THRESHOLD, weakest_hit - PRESENT_ONLY_SAFETY)), None
+    
+    strongest_miss = max(absent)
+    margin = weakest_hit - strongest_miss
+    if margin > 0:
+        threshold = (weakest_hit + strongest_miss) / 2
+    else:
+        # Overlap: the candidate just above some sample that misclassifies the fewest frames
+        candidates = sorted(set(present) | set(absent))
+        def errors(t):
+            return sum(1 for v in present if v < t) + sum(1 for v in absent if v >= t)
+        threshold = min((v + 1e-6 for v in candidates), key=lambda t: (errors(t), -t))
+    return max(MIN_THRESHOLD, min(MAX_THRESHOLD, threshold)), margin
+
+
+def calibrate(backend, labels, names):
+    """Run the calibration and return the thresholds document"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        previous_backend = image_search.get_capture_backend()
+        image_search.set_capture_backend(backend)
+        try:
+            scores = score_frames(backend, labels, names)
+        finally:
+            image_search.set_capture_backend(previous_backend)
+    
+    elements = {}
+    for name, samples in scores.items():
+        if not samples['present']:
+            continue
+        threshold, margin = choose_threshold(samples['present'], samples['absent'])
+        elements[name] = {
+            'threshold': round(threshold, 4),
+            'margin': round(margin, 4) if margin is not None else None,
+            'weakest_hit': round(min(samples['present']), 4),
+            'strongest_miss': round(max(samples['absent']), 4) if samples['absent'] else None,
+            'present_frames': len(samples['present']),
+            'absent_frames': len(samples['absent']),
+        }
+    return {
+        'version': THRESHOLDS_VERSION,
+        'generated': datetime.now().isoformat(timespec="seconds"),
+        'frames': len(labels),
+        'elements': elements,
+    }
+
+
+def print_summary(document):
+    print(f"{'ELEMENT':<28}{'current':>9}{'new':>8}{'margin':>9}{'hits':>6}{'misses':>8}")
+    for name, row in document['elements'].items():
+        margin = f"{row['margin']:.3f}" if row['margin'] is not None else "-"
+        flag = "  OVERLAP" if row['margin'] is not None and row['margin'] <= 0 else ""
+        print(f"{name:<28}{ui_assets.get_element(name).min_confidence:>9.2f}{row['threshold']:>8.3f}{margin:>9}"
+              f"{row['present_frames']:>6}{row['absent_frames']:>8}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate per-element match thresholds from labeled recordings")
+    parser.add_argument("--frames", required=True, help="Directory of recorded window screenshots")
+    parser.add_argument("--labels", required=True, help="JSON file of visible elements per frame")
+    parser.add_argument("--elements", nargs="*", help="Only calibrate these elements")
+    parser.add_argument("--output", default=ui_assets.THRESHOLDS_PATH, help="Thresholds file read by ui_assets")
+    parser.add_argument("--dry-run", action="store_true", help="Print the thresholds without writing them")
+    args = parser.parse_args(argv)
+    image_search.TELEMETRY_DUMP_PATH = None
+    
+    names = args.elements or ui_assets.element_names()
+    labels = load_labels(args.labels, names)
+    document = calibrate(image_search.ReplayBackend(args.frames), labels, names)
+    print_summary(document)
+    
+    if args.dry_run:
+        return 0
+    # Keep thresholds of elements this run had no samples for
+    if os.path.exists(args.output):
+        with open(args.output, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous.get('version') == THRESHOLDS_VERSION:
+            document['elements'] = {**previous.get('elements', {}), **document['elements']}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    print(f"Thresholds written to {args.output} (loaded by ui_assets at import)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,67 +3,1934 @@ Image Search Module
 Searches for Base64 images on screen and returns coordinates
 Enhanced with debugging capabilities and detailed logging
 """
+import atexit
 import base64
+import bisect
+import csv
+import hashlib
 import io
+import json
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import numpy as np
 from PIL import Image
-import pyautogui
 import cv2
 from datetime import datetime
 
+try:
+    import mss
+except ImportError:  # Optional fast capture backend
+    mss = None
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+DEBUG_MODE = True  # Set to True to enable detailed logging
+LOG_THRESHOLD = 0.95  # Only log if confidence is below this (0.95 = 95%)
+SAVE_FAILED_SCREENSHOTS = False  # Set to True to save screenshots when search fails
+FAILED_SCREENSHOT_DIR = "debug_screenshots"  # Directory to save failed screenshots
+DEBUG_SCREENSHOT_QUEUE_SIZE = 8  # Failed searches waiting to be written; more are dropped while the writer catches up
+DEBUG_SCREENSHOT_MIN_INTERVAL = 10.0  # Seconds between saved failures of the same element
+DEBUG_SCREENSHOT_MAX_BYTES = 200 * 1024 * 1024  # Disk quota for FAILED_SCREENSHOT_DIR (oldest files removed first)
+TEMPLATE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Memory budget for decoded templates (LRU eviction)
+CAPTURE_BACKEND = "auto"  # "auto" (mss if installed, else pyautogui), "mss", "pyautogui" or a CaptureBackend
+FRAME_CACHE_TTL = 0.2  # Seconds a captured frame can be reused by later lookups on the same window
+FRAME_BUFFER_POOL = True  # Convert captures into preallocated per-window arrays instead of new ones
+FRAME_BUFFER_DEPTH = 2  # Buffer sets per window in rotation: a frame's arrays are reused this many captures later
+ROI_ANCHORS = ("top_left", "top_right", "bottom_left", "bottom_right")
+REGION_CAPTURE_ENABLED = True  # Capture only the union of the ROIs when every pending lookup has one
+REGION_CAPTURE_MAX_FRACTION = 0.5  # Capture the whole window instead when that union covers more of it
+HINT_MARGIN = 16  # Pixels around the last hit searched before anything else
+HINT_CONFIDENCE_DROP = 0.05  # Re-search everywhere if the hint match is this much worse than last time
+PYRAMID_CANDIDATES = 3  # Coarse peaks refined at full resolution in pyramid mode
+PYRAMID_MIN_TEMPLATE_SIZE = 6  # Smallest template side allowed at a coarse level
+FINGERPRINT_SCALE = 4  # Frames are downsampled by this factor before hashing for change detection
+DIRTY_THRESHOLD = 3  # Downsampled pixel difference (0-255) that counts as a change
+MATCH_MODES = ("bgr", "gray", "b", "g", "r", "exact")  # Color planes ("exact": pixel search on BGR, see _match_exact)
+EXACT_ANCHORS = 3  # Rare template pixels considered as the candidate index for exact matching
+EXACT_SAMPLES = 24  # Template pixels compared at every candidate before the full check
+EXACT_TOLERANCE = 12  # Per-channel difference allowed on anchor and sample pixels
+EXACT_MAX_MEAN_DIFF = 6.0  # Mean absolute difference (0-255) accepted by the full check
+EXACT_MAX_CANDIDATES = 5000  # Give up on exact matching (use TM_CCOEFF_NORMED) above this many candidates
+SCALE_RANGE = (0.75, 2.0)  # Client UI scales tried when detecting a window's scale
+SCALE_STEP = 0.05
+SCALE_MIN_CONFIDENCE = 0.8  # An anchor must match at least this well for a scale to be accepted
+SCALE_ACCEPT_CONFIDENCE = 0.99  # Stop trying scales once an anchor matches this well
+SCALE_MARGIN = 0.05  # A scale other than 1.0 must beat the best anchor match at 1.0 by this much
+SCALE_DETECT_RETRY_INTERVAL = 30.0  # Seconds before retrying detection on a window where it failed
+SCALE_RECHECK_MISSES = 10  # Consecutive lookup misses on a window before its cached scale is checked again
+FIND_ALL_MAX_RESULTS = 50  # Most instances find_all returns for one template
+FIND_ALL_SUPPRESS = 0.5  # find_all: weaker peaks within this fraction of the template size of a hit are dropped
+MATCH_THREADS = min(4, os.cpu_count() or 1)  # Worker threads for batch matching (1 = match serially)
+PARALLEL_MIN_TEMPLATES = 2  # Batches smaller than this are matched on the calling thread
+TELEMETRY_ENABLED = True  # Record per-element call counts, timings and confidences
+TELEMETRY_DUMP_PATH = "search_telemetry.json"  # Telemetry written here at exit (.json or .csv, None to disable)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500)  # Upper bounds of the latency histogram buckets
+CONFIDENCE_BUCKETS = tuple(round(0.05 * i, 2) for i in range(1, 21))  # Upper bounds of the confidence buckets
+AMBIGUITY_MARGIN = 0.1  # Calibration: best match must beat the runner-up by this much
+
+
+def _log(message, force=False):
+    """Internal logging function that respects DEBUG_MODE"""
+    if DEBUG_MODE or force:
+        print(f"[ImageSearch] {message}")
+
+
+# =============================================================================
+# COMPILED TEMPLATE REGISTRY
+# =============================================================================
+
+def _convert_mode(bgr, mode, dst=None):
+    """Convert a BGR image to the plane used by a match mode (into dst if given)"""
+    if mode in ("bgr", "exact"):
+        return bgr
+    if mode == "gray":
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY, dst=dst)
+    if mode in ("b", "g", "r"):
+        return cv2.extractChannel(bgr, "bgr".index(mode), dst=dst)
+    raise ValueError(f"Unknown match mode: {mode}")
+
+
+class _ImageVariants:
+    """Lazily derived versions of one BGR image (match mode plane, pyramid level)"""
+    
+    def _init_variants(self, bgr):
+        self.bgr = bgr
+        self.height, self.width = bgr.shape[:2]
+        self._variants = {}
+    
+    def image(self, mode="bgr", level=0):
+        """Image in the given match mode, downscaled by 2**level (built on first use)"""
+        if mode == "exact":
+            mode = "bgr"
+        if mode == "bgr" and level == 0:
+            return self.bgr
+        key = (mode, level)
+        variant = self._variants.get(key)
+        if variant is None:
+            if level == 0:
+                variant = _convert_mode(self.bgr, mode, self._variant_buffer(key, (self.height, self.width)))
+            else:
+                source = self.image(mode, level - 1)
+                shape = ((source.shape[0] + 1) // 2, (source.shape[1] + 1) // 2) + source.shape[2:]
+                variant = cv2.pyrDown(source, dst=self._variant_buffer(key, shape))
+            self._variants[key] = variant
+        return variant
+    
+    def _variant_buffer(self, key, shape):
+        """Preallocated array a derived version is written into (None: allocate a new one)"""
+        return None
+    
+    @property
+    def gray(self):
+        """Single-channel version, built on first use"""
+        return self.image("gray")
+    
+    def pyramid(self, level, mode="bgr"):
+        """Image downscaled by 2**level (built on first use)"""
+        return self.image(mode, level)
+    
+    @property
+    def nbytes(self):
+        """Memory held by the image and every derived version"""
+        return self.bgr.nbytes + sum(variant.nbytes for variant in self._variants.values())
+
+
+def _resize_image(image, scale):
+    """Resize an image by scale (area interpolation when shrinking, linear when growing)"""
+    h, w = image.shape[:2]
+    size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    return cv2.resize(image, size, interpolation=interpolation)
+
+
+class CompiledTemplate(_ImageVariants):
+    """A decoded template ready for matching (BGR plus lazily built gray/channel/pyramid versions)"""
+    
+    def __init__(self, name, source, bgr):
+        self.name = name
+        self.source = source
+        self._init_variants(bgr)
+        self._scaled = {}
+        self._exact_probe = None
+    
+    def scaled(self, scale):
+        """This template resized for a client running at another UI scale (built on first use)"""
+        if scale == 1.0:
+            return self
+        key = round(scale, 3)
+        if key not in self._scaled:
+            self._scaled[key] = CompiledTemplate(self.name, self.source, _resize_image(self.bgr, key))
+        return self._scaled[key]
+    
+    @property
+    def exact_probe(self):
+        """Anchor and sample pixels used by exact matching (built on first use)"""
+        if self._exact_probe is None:
+            self._exact_probe = _build_exact_probe(self.bgr)
+        return self._exact_probe
+    
+    @property
+    def nbytes(self):
+        """Memory held by the template, its derived versions and its rescaled copies"""
+        return _ImageVariants.nbytes.fget(self) + sum(t.nbytes for t in self._scaled.values())
+
+
+class TemplateRegistry:
+    """Process-wide cache of compiled templates keyed by element name, with LRU eviction"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, source, element_name):
+        """Return the compiled template for key, decoding source on first use"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.source is source or (isinstance(source, str) and entry.source == source)):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        
+        entry = CompiledTemplate(element_name, source, _decode_template(source))
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+        return entry
+    
+    def _evict(self):
+        """Drop least recently used templates until the memory budget is met"""
+        while len(self._entries) > 1 and self.total_bytes() > self.max_bytes:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def total_bytes(self):
+        """Memory held by all cached templates"""
+        return sum(entry.nbytes for entry in self._entries.values())
+    
+    def clear(self):
+        """Forget every compiled template"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """Return cache counters as a dictionary"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes(),
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+_template_registry = TemplateRegistry(TEMPLATE_CACHE_MAX_BYTES)
+
+
+def _decode_b64_template(b64_string):
+    """Decode a Base64 PNG into a contiguous BGR array"""
+    image_bytes = base64.b64decode(b64_string)
+    pil_image = Image.open(io.BytesIO(image_bytes))
+    
+    if pil_image.mode != 'RGB':
+        pil_image = pil_image.convert('RGB')
+    
+    return np.ascontiguousarray(cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR))
+
+
+def _decode_template(source):
+    """Template source to a BGR array: Base64 PNGs are decoded, BGR arrays (e.g. asset pack views) used as is"""
+    if isinstance(source, np.ndarray):
+        return source
+    return _decode_b64_template(source)
+
+
+def get_template(b64_string, element_name="UNKNOWN"):
+    """
+    Get the compiled template for a Base64 image, decoding it only once per process.
+    
+    Templates are keyed by element name; unnamed searches are keyed by the string itself.
+    b64_string may also be a BGR numpy array (such as a view into the asset pack),
+    which is used without decoding.
+    
+    Returns:
+        CompiledTemplate: decoded template with .bgr, .gray, .width and .height
+    """
+    key = element_name if element_name != "UNKNOWN" or not isinstance(b64_string, str) else b64_string
+    return _template_registry.get(key, b64_string, element_name)
+
+
+def get_template_cache_stats():
+    """Return hit/miss/eviction counters of the compiled template registry"""
+    return _template_registry.stats()
+
+
+def clear_template_cache():
+    """Drop all compiled templates (they are re-decoded on next use)"""
+    _template_registry.clear()
+
+
+def set_template_cache_budget(max_bytes):
+    """Change the memory budget of the compiled template registry"""
+    global TEMPLATE_CACHE_MAX_BYTES
+    TEMPLATE_CACHE_MAX_BYTES = max_bytes
+    with _template_registry._lock:
+        _template_registry.max_bytes = max_bytes
+        _template_registry._evict()
+
+
+# =============================================================================
+# CAPTURE BACKENDS
+# =============================================================================
+
+class CaptureBackend:
+    """Source of screen pixels: grab(region) returns a BGR or BGRA numpy array (RGB if channel_order is "rgb")"""
+    
+    name = "base"
+    channel_order = "bgr"
+    
+    def grab(self, region):
+        """Capture (left, top, width, height) in screen coordinates"""
+        raise NotImplementedError
+    
+    def grab_rect(self, region, rect):
+        """Capture the (x0, y0, x1, y1) part of the window covering region"""
+        x0, y0, x1, y1 = rect
+        return self.grab((region[0] + x0, region[1] + y0, x1 - x0, y1 - y0))
+    
+    def close(self):
+        """Release any resources held by the backend"""
+        pass
+
+
+class PyAutoGuiBackend(CaptureBackend):
+    """Capture through pyautogui (PIL screenshot, RGB: converted to BGR by the frame cache)"""
+    
+    name = "pyautogui"
+    channel_order = "rgb"
+    
+    def __init__(self):
+        import pyautogui  # Imported lazily: it needs a display, replay runs do not
+        self._pyautogui = pyautogui
+    
+    def grab(self, region):
+        return np.asarray(self._pyautogui.screenshot(region=region))
+
+
+class MssBackend(CaptureBackend):
+    """Capture through mss: the BGRA buffer is wrapped as a numpy view without any PIL object"""
+    
+    name = "mss"
+    
+    def __init__(self):
+        if mss is None:
+            raise RuntimeError("mss is not installed")
+        self._local = threading.local()  # mss handles must stay on the thread that created them
+    
+    def grab(self, region):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        left, top, width, height = region
+        shot = sct.grab({'left': left, 'top': top, 'width': width, 'height': height})
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+    
+    def close(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
+
+
+class ReplayBackend(CaptureBackend):
+    """
+    Serve recorded frames instead of the screen, so searches can run headless.
+    
+    Args:
+        source: directory of images, list of image paths, or list of BGR arrays
+        window_relative: if True every frame is one window capture and the region's
+                         left/top are ignored; if False frames are desktop captures
+                         cropped at the region's screen position
+        advance_on_grab: move to the next frame after every grab (loops at the end)
+    """
+    
+    name = "replay"
+    IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+    
+    def __init__(self, source, window_relative=True, advance_on_grab=False):
+        if isinstance(source, str):
+            source = [os.path.join(source, f) for f in sorted(os.listdir(source))
+                      if f.lower().endswith(self.IMAGE_EXTENSIONS)]
+        if not source:
+            raise ValueError("ReplayBackend needs at least one frame")
+        self._frames = list(source)
+        self._names = [os.path.basename(f) if isinstance(f, str) else str(i) for i, f in enumerate(self._frames)]
+        self.window_relative = window_relative
+        self.advance_on_grab = advance_on_grab
+        self.index = 0
+    
+    def __len__(self):
+        return len(self._frames)
+    
+    def frame(self, index=None):
+        """Recorded frame as a BGR array (image files are loaded on first use)"""
+        index = self.index if index is None else index
+        frame = self._frames[index]
+        if isinstance(frame, str):
+            path = frame
+            frame = cv2.imread(path, cv2.IMREAD_COLOR)
+            if frame is None:
+                raise IOError(f"Could not read replay frame {path}")
+            self._frames[index] = frame
+        return frame
+    
+    def frame_name(self, index=None):
+        """File name of a recorded frame (or its index for in-memory frames)"""
+        return self._names[self.index if index is None else index]
+    
+    def seek(self, index):
+        """Serve the frame at index from now on"""
+        self.index = index % len(self._frames)
+    
+    def advance(self):
+        """Serve the next frame (loops at the end)"""
+        self.seek(self.index + 1)
+    
+    def grab(self, region):
+        frame = self.frame()
+        if self.advance_on_grab:
+            self.advance()
+        left, top, width, height = region
+        if self.window_relative:
+            left, top = 0, 0
+        return frame[top:top + height, left:left + width]
+    
+    def grab_rect(self, region, rect):
+        if not self.window_relative:
+            return super().grab_rect(region, rect)
+        frame = self.frame()
+        if self.advance_on_grab:
+            self.advance()
+        x0, y0, x1, y1 = rect
+        return frame[y0:y1, x0:x1]
+
+
+class StaticWindow:
+    """Minimal stand-in for a pygetwindow Window (e.g. a recorded window with ReplayBackend)"""
+    
+    def __init__(self, left, top, width, height, title="static", hwnd=None):
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.title = title
+        self._hWnd = hwnd if hwnd is not None else title  # Identity used for per-window state
+
+
+_capture_backend = None
+_capture_backend_lock = threading.Lock()
+
+
+def _create_backend(name):
+    """Instantiate a capture backend by name"""
+    if name == "auto":
+        name = "mss" if mss is not None else "pyautogui"
+    if name == "mss":
+        return MssBackend()
+    if name == "pyautogui":
+        return PyAutoGuiBackend()
+    raise ValueError(f"Unknown capture backend: {name}")
+
+
+def get_capture_backend():
+    """Return the active capture backend, creating it from CAPTURE_BACKEND on first use"""
+    global _capture_backend
+    with _capture_backend_lock:
+        if _capture_backend is None:
+            if isinstance(CAPTURE_BACKEND, CaptureBackend):
+                _capture_backend = CAPTURE_BACKEND
+            else:
+                _capture_backend = _create_backend(CAPTURE_BACKEND)
+            _log(f"Capture backend: {_capture_backend.name}")
+        return _capture_backend
+
+
+def set_capture_backend(backend):
+    """
+    Switch the capture backend at runtime.
+    
+    Args:
+        backend: "auto", "mss", "pyautogui" or a CaptureBackend instance (e.g. ReplayBackend)
+    """
+    global CAPTURE_BACKEND, _capture_backend
+    new_backend = backend if isinstance(backend, CaptureBackend) else _create_backend(backend)
+    with _capture_backend_lock:
+        old_backend = _capture_backend
+        CAPTURE_BACKEND = backend
+        _capture_backend = new_backend
+    if old_backend is not None and old_backend is not new_backend:
+        old_backend.close()
+    invalidate_frame_cache()
+    _log(f"Capture backend set to {new_backend.name}", force=True)
+
+
+def _to_bgr(pixels, channel_order="bgr", buffers=None):
+    """Turn a backend capture (BGR, BGRA or RGB) into a BGR array, written into a pooled array if buffers is given"""
+    if channel_order == "rgb":
+        code = cv2.COLOR_RGB2BGR
+    elif pixels.ndim == 3 and pixels.shape[2] == 4:
+        code = cv2.COLOR_BGRA2BGR
+    else:
+        return pixels
+    dst = buffers.get("capture", pixels.shape[:2] + (3,)) if buffers is not None else None
+    return cv2.cvtColor(pixels, code, dst=dst)
+
+
+# =============================================================================
+# FRAME CACHE
+# =============================================================================
+
+class Frame(_ImageVariants):
+    """
+    A single BGR capture of a window region, shared by every lookup made on it.
+    
+    Region captures (see capture_region) hold only part of the window: origin is
+    the window position of their top-left pixel, (0, 0) for whole-window frames.
+    """
+    
+    def __init__(self, bgr, region, captured_at, window_key=None, origin=(0, 0), buffers=None):
+        self.region = region
+        self.captured_at = captured_at
+        self.window_key = window_key
+        self.origin = origin
+        self._buffers = buffers
+        self._init_variants(bgr)
+        self._thumbnail = None
+        self._fingerprint = None
+        self._changed_regions = {}
+    
+    @property
+    def thumbnail(self):
+        """Frame downsampled by FINGERPRINT_SCALE, used for change detection"""
+        if self._thumbnail is None:
+            size = (max(1, self.width // FINGERPRINT_SCALE), max(1, self.height // FINGERPRINT_SCALE))
+            self._thumbnail = np.ascontiguousarray(cv2.resize(self.bgr, size, interpolation=cv2.INTER_AREA))
+        return self._thumbnail
+    
+    @property
+    def fingerprint(self):
+        """Cheap hash of the downsampled frame: equal fingerprints mean an unchanged screen"""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.blake2b(self.thumbnail.data, digest_size=16).digest()
+        return self._fingerprint
+    
+    def _variant_buffer(self, key, shape):
+        if self._buffers is None:
+            return None
+        return self._buffers.get(key, shape)
+    
+    def covers(self, rect):
+        """Check whether the (x0, y0, x1, y1) window rectangle lies inside this frame"""
+        ox, oy = self.origin
+        return ox <= rect[0] and oy <= rect[1] and rect[2] <= ox + self.width and rect[3] <= oy + self.height
+    
+    def changed_regions_since(self, previous_thumbnail):
+        """Changed rectangles between an earlier thumbnail of this window and this frame (cached)"""
+        key = id(previous_thumbnail)
+        if key not in self._changed_regions:
+            self._changed_regions[key] = changed_regions(previous_thumbnail, self.thumbnail)
+        return self._changed_regions[key]
+
+
+_frame_cache = {}
+_region_frame_cache = {}  # Window region -> last region capture of that window
+_frame_cache_lock = threading.Lock()
+_frame_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def _window_key(window):
+    """Stable identity of a window (its HWND when available)"""
+    return getattr(window, "_hWnd", None) or id(window)
+
+
+def _window_region(window):
+    """Screen region (left, top, width, height) covered by a window"""
+    return (window.left, window.top, window.width, window.height)
+
+
+def _grab_region(region):
+    """Capture a screen region as a BGR array through the active backend"""
+    backend = get_capture_backend()
+    return _to_bgr(backend.grab(region), backend.channel_order)
+
+
+def _fresh_frame(cache, region, now):
+    """Cached frame for a window region if it is younger than FRAME_CACHE_TTL (call with the lock held)"""
+    frame = cache.get(region)
+    if frame is not None and now - frame.captured_at <= FRAME_CACHE_TTL:
+        return frame
+    return None
+
+
+def capture_frame(window):
+    """
+    Capture a window, reusing the previous capture if it is younger than FRAME_CACHE_TTL.
+    
+    Frames are keyed by window geometry, so a moved or resized window is always recaptured.
+    Windows registered with set_shared_capture are cut from one shared grab instead.
+    
+    Returns:
+        Frame: the capture (frame.bgr is the BGR array)
+    """
+    region = _window_region(window)
+    now = time.monotonic()
+    with _frame_cache_lock:
+        frame = _fresh_frame(_frame_cache, region, now)
+        if frame is not None:
+            _frame_cache_stats['hits'] += 1
+            return frame
+    
+    window_key = _window_key(window)
+    buffers = _next_frame_buffers(window_key, "window")
+    shared = _grab_shared(region)
+    if shared is not None:
+        bgr, captured_at = shared
+    else:
+        backend = get_capture_backend()
+        bgr = _to_bgr(backend.grab(region), backend.channel_order, buffers)
+        captured_at = time.monotonic()
+    frame = Frame(bgr, region, captured_at, window_key, buffers=buffers)
+    with _frame_cache_lock:
+        _frame_cache_stats['misses'] += 1
+        _frame_cache[region] = frame
+    return frame
+
+
+def invalidate_frame_cache(window=None):
+    """
+    Drop cached captures so the next lookup sees the screen after our own input.
+    Called by the click/drag helpers; pass a window to only drop that window's frame
+    (the shared grab, if any, is always dropped).
+    """
+    _drop_shared_grab()
+    with _frame_cache_lock:
+        if window is None:
+            _frame_cache.clear()
+            _region_frame_cache.clear()
+        else:
+            try:
+                region = _window_region(window)
+                _frame_cache.pop(region, None)
+                _region_frame_cache.pop(region, None)
+            except Exception:
+                _frame_cache.clear()
+                _region_frame_cache.clear()
+        _frame_cache_stats['invalidations'] += 1
+
+
+def get_frame_cache_stats():
+    """Return frame cache counters (hits are captures saved this session)"""
+    with _frame_cache_lock:
+        return dict(_frame_cache_stats)
+
+
+def reset_frame_cache_stats():
+    """Reset frame cache counters to zero"""
+    with _frame_cache_lock:
+        for key in _frame_cache_stats:
+            _frame_cache_stats[key] = 0
+
+
+# =============================================================================
+# FRAME BUFFER POOL
+# =============================================================================
+# Captures are converted to BGR, and frames to their gray/channel/pyramid planes,
+# inside arrays kept per window instead of fresh ones, so retry loops stop
+# allocating full-window buffers on every lookup. Each window rotates through
+# FRAME_BUFFER_DEPTH buffer sets: a frame stays valid until that many newer
+# captures of its window were taken, which the frame cache TTL keeps well clear
+# of. Anything kept longer must be copied (the debug screenshot writer does).
+# Thumbnails are not pooled: change detection compares them across captures.
+
+_buffer_pools = {}  # (window_key, "window" or "region") -> [next index, [_FrameBuffers, ...]]
+_buffer_pool_lock = threading.Lock()
+_buffer_stats = {'allocations': 0, 'reuses': 0, 'allocated_bytes': 0}
+
+
+class _FrameBuffers:
+    """One set of reusable arrays for a capture, reallocated only when the frame size changes"""
+    
+    def __init__(self):
+        self._arrays = {}
+    
+    def get(self, key, shape):
+        """uint8 array of the given shape for key, reused when the shape is unchanged"""
+        array = self._arrays.get(key)
+        with _buffer_pool_lock:
+            if array is not None and array.shape == shape:
+                _buffer_stats['reuses'] += 1
+                return array
+            array = np.empty(shape, np.uint8)
+            _buffer_stats['allocations'] += 1
+            _buffer_stats['allocated_bytes'] += array.nbytes
+        self._arrays[key] = array
+        return array
+    
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self._arrays.values())
+
+
+def _next_frame_buffers(window_key, kind):
+    """Next buffer set in the window's rotation (None if pooling is off)"""
+    if not FRAME_BUFFER_POOL:
+        return None
+    with _buffer_pool_lock:
+        pool = _buffer_pools.get((window_key, kind))
+        if pool is None or len(pool[1]) != FRAME_BUFFER_DEPTH:
+            pool = _buffer_pools[(window_key, kind)] = [0, [_FrameBuffers() for _ in range(FRAME_BUFFER_DEPTH)]]
+        index, slots = pool
+        pool[0] = (index + 1) % len(slots)
+        return slots[index]
+
+
+def get_frame_buffer_stats():
+    """
+    Return buffer pool counters.
+    
+    Returns:
+        dict: {'allocations', 'reuses', 'allocated_bytes'} since the last reset, plus
+              'windows' and 'pooled_bytes' currently held
+    """
+    with _buffer_pool_lock:
+        stats = dict(_buffer_stats)
+        stats['windows'] = len({window_key for window_key, _ in _buffer_pools})
+        pools = list(_buffer_pools.values())
+    stats['pooled_bytes'] = sum(slot.nbytes for _, slots in pools for slot in slots)
+    return stats
+
+
+def clear_frame_buffers(window=None):
+    """Release pooled arrays (of one window, or all); frames captured before must no longer be used"""
+    with _buffer_pool_lock:
+        if window is None:
+            _buffer_pools.clear()
+        else:
+            window_key = _window_key(window)
+            for key in [key for key in _buffer_pools if key[0] == window_key]:
+                del _buffer_pools[key]
+
+
+# =============================================================================
+# SHARED DESKTOP CAPTURE
+# =============================================================================
+# With many clients tiled on one desktop, capturing each window separately
+# costs one grab per client per poll. set_shared_capture() registers the
+# monitored windows: capture_frame then grabs their bounding box once per
+# FRAME_CACHE_TTL and hands every window inside it a cropped view of that grab
+# (no copy). The grab is not taken from the frame buffer pool: frames handed
+# out earlier keep viewing their own grab while other windows trigger new ones.
+# Needs a backend that captures screen coordinates: mss, pyautogui, or a
+# ReplayBackend serving desktop recordings (window_relative=False).
+
+_shared_windows = []
+_shared_grab = None  # (bbox, captured_at, bgr) of the last bounding-box grab
+_shared_lock = threading.Lock()
+_shared_stats = {'desktop_grabs': 0, 'shared_frames': 0}
+
+
+def set_shared_capture(windows):
+    """
+    Capture several windows with one grab of their bounding box per tick.
+    
+    Args:
+        windows: pygetwindow Window objects to monitor (None or empty: one capture per window again)
+    """
+    global _shared_windows, _shared_grab
+    with _shared_lock:
+        _shared_windows = list(windows or [])
+        _shared_grab = None
+    invalidate_frame_cache()
+    _log(f"Shared capture {'over ' + str(len(_shared_windows)) + ' windows' if _shared_windows else 'disabled'}",
+         force=True)
+
+
+def _region_inside(region, bbox):
+    """Check whether a (left, top, width, height) region lies inside another"""
+    return (bbox[0] <= region[0] and bbox[1] <= region[1] and
+            region[0] + region[2] <= bbox[0] + bbox[2] and region[1] + region[3] <= bbox[1] + bbox[3])
+
+
+def _shared_bbox():
+    """Screen region around every monitored window that can be captured (None if there is none)"""
+    regions = []
+    for window in _shared_windows:
+        try:
+            if getattr(window, "isMinimized", False) or window.width <= 0 or window.height <= 0:
+                continue
+            regions.append(_window_region(window))
+        except Exception:
+            continue  # Closed window
+    if not regions:
+        return None
+    left, top = min(r[0] for r in regions), min(r[1] for r in regions)
+    right, bottom = max(r[0] + r[2] for r in regions), max(r[1] + r[3] for r in regions)
+    return left, top, right - left, bottom - top
+
+
+def _in_shared_capture(region):
+    """Check whether a window region is served from the shared grab"""
+    if not _shared_windows or getattr(get_capture_backend(), "window_relative", False):
+        return False
+    bbox = _shared_bbox()
+    return bbox is not None and _region_inside(region, bbox)
+
+
+def _grab_shared(region):
+    """
+    Cut a window region out of the shared bounding-box grab, grabbing it again if it is stale.
+    
+    Returns:
+        tuple: (bgr view, captured_at), or None if the region is not in the monitored area
+    """
+    global _shared_grab
+    if not _in_shared_capture(region):
+        return None
+    with _shared_lock:
+        grab = _shared_grab
+        if grab is None or time.monotonic() - grab[1] > FRAME_CACHE_TTL or not _region_inside(region, grab[0]):
+            bbox = _shared_bbox()
+            if bbox is None or not _region_inside(region, bbox):
+                return None
+            backend = get_capture_backend()
+            bgr = _to_bgr(backend.grab(bbox), backend.channel_order)
+            grab = _shared_grab = (bbox, time.monotonic(), bgr)
+            _shared_stats['desktop_grabs'] += 1
+            with _frame_cache_lock:  # Frames cut from the previous grab would mix ticks
+                for cached in [r for r in _frame_cache if _region_inside(r, bbox)]:
+                    del _frame_cache[cached]
+        _shared_stats['shared_frames'] += 1
+    bbox, captured_at, bgr = grab
+    x, y = region[0] - bbox[0], region[1] - bbox[1]
+    return bgr[y:y + region[3], x:x + region[2]], captured_at
+
+
+def _drop_shared_grab():
+    """Forget the shared grab so the next capture of any monitored window grabs again"""
+    global _shared_grab
+    with _shared_lock:
+        _shared_grab = None
+
+
+def get_shared_capture_stats():
+    """Return shared capture counters (bounding-box grabs, window frames cut from them)"""
+    with _shared_lock:
+        return dict(_shared_stats)
+
+
+# =============================================================================
+# SEARCH TELEMETRY
+# =============================================================================
+# Per-element aggregates recorded by the public search functions: call count,
+# hits, and histograms of capture time, match time and best confidence. Capture
+# time includes frames served from the frame cache; search_many records its one
+# shared capture under the "BATCH" element.
+
+class _Histogram:
+    """Fixed-bucket histogram (values above the last bound go to an overflow bucket)"""
+    
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.min = None
+        self.max = None
+    
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def percentile(self, fraction):
+        """
+        Estimate of the value below which the given fraction of values fall.
+        
+        Interpolated linearly inside the bucket that holds it, with the bucket's
+        edges narrowed to the observed min and max so the estimate stays in range.
+        """
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                lower = max(self.min, self.bounds[index - 1] if index > 0 else self.min)
+                upper = min(self.max, self.bounds[index] if index < len(self.bounds) else self.max)
+                position = max(0.0, target - seen) / count
+                return round(lower + (upper - lower) * position, 4)
+            seen += count
+        return self.max
+    
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 4) if self.count else None,
+            'min': round(self.min, 4) if self.count else None,
+            'max': round(self.max, 4) if self.count else None,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'buckets': {f"<={bound}": count for bound, count in zip(self.bounds, self.counts)},
+            'overflow': self.counts[-1],
+        }
+
+
+class _ElementTelemetry:
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.capture_ms = _Histogram(LATENCY_BUCKETS_MS)
+        self.match_ms = _Histogram(LATENCY_BUCKETS_MS)
+        self.confidence = _Histogram(CONFIDENCE_BUCKETS)
+
+
+_telemetry = {}  # element_name -> _ElementTelemetry
+_telemetry_lock = threading.Lock()
+
+
+def _record_capture(element_name, seconds):
+    if not TELEMETRY_ENABLED:
+        return
+    with _telemetry_lock:
+        entry = _telemetry.setdefault(element_name, _ElementTelemetry())
+        entry.capture_ms.add(seconds * 1000)
+
+
+def _record_match(element_name, seconds, found, confidence):
+    if not TELEMETRY_ENABLED:
+        return
+    with _telemetry_lock:
+        entry = _telemetry.setdefault(element_name, _ElementTelemetry())
+        entry.calls += 1
+        entry.hits += 1 if found else 0
+        entry.match_ms.add(seconds * 1000)
+        if confidence is not None:
+            entry.confidence.add(max(0.0, float(confidence)))
+
+
+def get_search_telemetry():
+    """
+    Per-element search telemetry collected this session.
+    
+    Returns:
+        dict: {element_name: {'calls', 'hits', 'hit_rate', 'capture_ms', 'match_ms', 'confidence'}}
+              where the last three are histogram summaries (count, mean, min, max, p50, p95, buckets)
+    """
+    with _telemetry_lock:
+        return {
+            name: {
+                'calls': entry.calls,
+                'hits': entry.hits,
+                'hit_rate': round(entry.hits / entry.calls, 4) if entry.calls else None,
+                'capture_ms': entry.capture_ms.to_dict(),
+                'match_ms': entry.match_ms.to_dict(),
+                'confidence': entry.confidence.to_dict(),
+            }
+            for name, entry in sorted(_telemetry.items())
+        }
+
+
+def dump_search_telemetry(path=None):
+    """
+    Write the search telemetry to a file, as JSON (full histograms) or CSV (one summary row per element)
+    depending on the extension.
+    
+    Args:
+        path: Output file (default TELEMETRY_DUMP_PATH)
+    
+    Returns:
+        str: the path written, or None if there was nothing to write
+    """
+    path = path or TELEMETRY_DUMP_PATH
+    telemetry = get_search_telemetry()
+    if not path or not telemetry:
+        return None
+    
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["element", "calls", "hits", "hit_rate",
+                             "capture_ms_mean", "capture_ms_p95", "match_ms_mean", "match_ms_p50", "match_ms_p95",
+                             "confidence_mean", "confidence_min", "confidence_max"])
+            for name, row in telemetry.items():
+                capture, match, confidence = row['capture_ms'], row['match_ms'], row['confidence']
+                writer.writerow([name, row['calls'], row['hits'], row['hit_rate'],
+                                 capture['mean'], capture['p95'], match['mean'], match['p50'], match['p95'],
+                                 confidence['mean'], confidence['min'], confidence['max']])
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({'generated': datetime.now().isoformat(timespec="seconds"), 'elements': telemetry,
+                       'frame_buffers': get_frame_buffer_stats()}, f, indent=2)
+    return path
+
+
+def reset_search_telemetry():
+    """Clear all recorded search telemetry (and the frame buffer allocation counters)"""
+    with _telemetry_lock:
+        _telemetry.clear()
+    with _buffer_pool_lock:
+        for key in _buffer_stats:
+            _buffer_stats[key] = 0
+
+
+def set_telemetry_enabled(enabled):
+    """Enable or disable search telemetry recording"""
+    global TELEMETRY_ENABLED
+    TELEMETRY_ENABLED = enabled
+    _log(f"Search telemetry {'enabled' if enabled else 'disabled'}", force=True)
+
+
+def _dump_telemetry_at_exit():
+    try:
+        path = dump_search_telemetry()
+        if path:
+            _log(f"Search telemetry written to {path}", force=True)
+    except Exception as e:
+        _log(f"ERROR writing search telemetry - {e}", force=True)
+
+
+atexit.register(_dump_telemetry_at_exit)
+
+
+# =============================================================================
+# DEBUG SCREENSHOT WRITER
+# =============================================================================
+# Failed searches are handed to a background thread instead of being written
+# inside the search path. Per element, a failure is saved at most every
+# DEBUG_SCREENSHOT_MIN_INTERVAL seconds and never twice for the same frame;
+# when the queue is full the failure is dropped rather than waited on.
+
+_DEBUG_DEDUPE_SIZE = 256  # (element, frame fingerprint) pairs remembered for deduplication
+
+_debug_queue = queue.Queue(maxsize=DEBUG_SCREENSHOT_QUEUE_SIZE)
+_debug_writer_thread = None
+_debug_lock = threading.Lock()
+_debug_last_saved = {}  # element_name -> monotonic time of the last queued failure
+_debug_saved_frames = OrderedDict()  # (element_name, fingerprint) -> None, oldest first
+_debug_writer_stats = {'queued': 0, 'written': 0, 'rate_limited': 0, 'duplicates': 0, 'dropped': 0,
+                       'evicted_files': 0, 'errors': 0}
+
+
+def _save_debug_screenshot(frame, template, element_name, confidence):
+    """Queue the frame and template of a failed search for the background writer"""
+    if not SAVE_FAILED_SCREENSHOTS:
+        return
+    
+    now = time.monotonic()
+    dedupe_key = (element_name, frame.fingerprint)
+    with _debug_lock:
+        if dedupe_key in _debug_saved_frames:
+            _debug_writer_stats['duplicates'] += 1
+            return
+        if now - _debug_last_saved.get(element_name, -DEBUG_SCREENSHOT_MIN_INTERVAL) < DEBUG_SCREENSHOT_MIN_INTERVAL:
+            _debug_writer_stats['rate_limited'] += 1
+            return
+        if _debug_queue.full():
+            _debug_writer_stats['dropped'] += 1
+            return
+        _debug_last_saved[element_name] = now
+        _debug_saved_frames[dedupe_key] = None
+        if len(_debug_saved_frames) > _DEBUG_DEDUPE_SIZE:
+            _debug_saved_frames.popitem(last=False)
+        _debug_writer_stats['queued'] += 1
+        _start_debug_writer()
+    
+    # Copies: the frame buffer may be reused by the capture path once the search returns
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+    try:
+        _debug_queue.put_nowait((timestamp, element_name, frame.bgr.copy(), template.copy(), confidence))
+    except queue.Full:
+        with _debug_lock:
+            _debug_writer_stats['dropped'] += 1
+
+
+def _start_debug_writer():
+    global _debug_writer_thread
+    if _debug_writer_thread is None or not _debug_writer_thread.is_alive():
+        _debug_writer_thread = threading.Thread(target=_debug_writer_loop, name="debug-screenshot-writer", daemon=True)
+        _debug_writer_thread.start()
+
+
+def _debug_writer_loop():
+    while True:
+        timestamp, element_name, screenshot, template, confidence = _debug_queue.get()
+        try:
+            os.makedirs(FAILED_SCREENSHOT_DIR, exist_ok=True)
+            
+            # Save screenshot
+            screenshot_path = os.path.join(FAILED_SCREENSHOT_DIR, f"{timestamp}_{element_name}_screenshot.png")
+            cv2.imwrite(screenshot_path, screenshot)
+            
+            # Save template
+            template_path = os.path.join(FAILED_SCREENSHOT_DIR, f"{timestamp}_{element_name}_template.png")
+            cv2.imwrite(template_path, template)
+            
+            with _debug_lock:
+                _debug_writer_stats['written'] += 1
+            _log(f"Saved debug images: {screenshot_path} (confidence={confidence:.2%})", force=True)
+            _enforce_debug_quota()
+        except Exception as e:
+            with _debug_lock:
+                _debug_writer_stats['errors'] += 1
+            _log(f"Failed to save debug screenshot: {e}", force=True)
+        finally:
+            _debug_queue.task_done()
+
+
+def _enforce_debug_quota():
+    """Delete the oldest files in FAILED_SCREENSHOT_DIR until it fits DEBUG_SCREENSHOT_MAX_BYTES"""
+    files = []
+    for entry in os.scandir(FAILED_SCREENSHOT_DIR):
+        if entry.is_file():
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= DEBUG_SCREENSHOT_MAX_BYTES:
+            break
+        os.remove(path)
+        total -= size
+        with _debug_lock:
+            _debug_writer_stats['evicted_files'] += 1
+
+
+def flush_debug_screenshots(timeout=5.0):
+    """
+    Wait for queued debug screenshots to be written.
+    
+    Returns:
+        bool: True if the queue drained within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while _debug_queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def get_debug_writer_stats():
+    """Return debug screenshot writer counters"""
+    with _debug_lock:
+        stats = dict(_debug_writer_stats)
+    stats['pending'] = _debug_queue.qsize()
+    return stats
+
+
+atexit.register(flush_debug_screenshots)
+
+
+def _load_template(b64_string, element_name):
+    """Return the compiled template for a search, or None if it cannot be used"""
+    if b64_string is None or (isinstance(b64_string, str) and b64_string in ("", "#")):
+        _log(f"{element_name}: SKIPPED (empty or placeholder B64)")
+        return None
+    
+    try:
+        return get_template(b64_string, element_name)
+    except Exception as e:
+        _log(f"{element_name}: ERROR decoding B64 - {e}", force=True)
+        return None
+
+
+def _window_is_valid(window, element_name):
+    """Check the window can be captured, logging why not"""
+    try:
+        if window.width <= 0 or window.height <= 0:
+            _log(f"{element_name}: ERROR window has invalid dimensions {window.width}x{window.height}", force=True)
+            return False
+    except Exception as e:
+        _log(f"{element_name}: ERROR accessing window - {e}", force=True)
+        return False
+    return True
+
+
+# =============================================================================
+# SHARED SEARCH STATE
+# =============================================================================
+# search_many matches on MATCH_THREADS workers and pollers search from their
+# own threads, so the remembered per-element results and the match counters
+# below are updated concurrently. Counters are bumped through _count, and the
+# remembered-result dicts are written and iterated under _search_state_lock.
+
+_search_state_lock = threading.Lock()
+
+
+def _count(stats, key, amount=1):
+    """Add to one of the search counters without losing concurrent updates"""
+    with _search_state_lock:
+        stats[key] += amount
+
+
+def _snapshot(stats):
+    """Consistent copy of one of the search counter dicts"""
+    with _search_state_lock:
+        return dict(stats)
+
+
+# =============================================================================
+# REGIONS OF INTEREST
+# =============================================================================
+
+_roi_stats = {'roi_hits': 0, 'roi_fallbacks': 0}
+
+
+def roi_to_rect(roi, width, height, min_w=1, min_h=1):
+    """
+    Convert a relative ROI into a pixel rectangle inside a window.
+    
+    Args:
+        roi: (anchor, x, y, w, h) where anchor is one of ROI_ANCHORS and x, y, w, h are
+             fractions of the window size measured from that corner (e.g.
+             ("bottom_right", 0.0, 0.0, 0.5, 0.2) is the bottom-right half-width strip)
+        width, height: window size in pixels
+        min_w, min_h: minimum rectangle size (the template size), grown around the ROI
+    
+    Returns:
+        tuple: (x0, y0, x1, y1) clamped to the window
+    """
+    anchor, rx, ry, rw, rh = roi
+    if anchor not in ROI_ANCHORS:
+        raise ValueError(f"Unknown ROI anchor: {anchor}")
+    
+    w = int(round(rw * width))
+    h = int(round(rh * height))
+    x0 = int(round(rx * width))
+    y0 = int(round(ry * height))
+    if anchor.endswith("right"):
+        x0 = width - x0 - w
+    if anchor.startswith("bottom"):
+        y0 = height - y0 - h
+    return _clamp_rect((x0, y0, x0 + w, y0 + h), width, height, min_w, min_h)
+
+
+def _clamp_rect(rect, width, height, min_w=1, min_h=1):
+    """Grow a rectangle to at least min_w x min_h, then clamp it inside width x height"""
+    x0, y0, x1, y1 = rect
+    if x1 - x0 < min_w:
+        x0 -= (min_w - (x1 - x0)) // 2
+        x1 = x0 + min_w
+    if y1 - y0 < min_h:
+        y0 -= (min_h - (y1 - y0)) // 2
+        y1 = y0 + min_h
+    x0 = max(0, min(x0, width - min_w))
+    y0 = max(0, min(y0, height - min_h))
+    return x0, y0, min(width, max(x1, x0 + min_w)), min(height, max(y1, y0 + min_h))
+
+
+def get_roi_stats():
+    """Return how often ROI-restricted searches hit versus fell back to the full window"""
+    return _snapshot(_roi_stats)
+
+
+def _match_in_rect(image, template, rect=None):
+    """
+    Run TM_CCOEFF_NORMED over image (or only the rect part of it).
+    
+    Returns:
+        tuple: (best_confidence, (x, y)) with the top-left position in image coordinates
+    """
+    if rect is not None:
+        x0, y0, x1, y1 = rect
+        image = image[y0:y1, x0:x1]
+    else:
+        x0, y0 = 0, 0
+    _count(_dirty_stats, 'area_searched_px', image.shape[0] * image.shape[1])
+    result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return max_val, (max_loc[0] + x0, max_loc[1] + y0)
+
+
+# =============================================================================
+# REGION CAPTURE
+# =============================================================================
+# When every pending lookup has an ROI, only the bounding box of those ROIs is
+# grabbed and converted instead of the whole client. Lookups that miss inside
+# their ROI fall back to a whole-window capture and the usual staged search,
+# so region capture never finds less. Elements whose last lookup on the window
+# missed skip the region grab: a retry loop waiting for them needs the whole
+# window (and its unchanged-frame short circuit) anyway. Results stay in
+# window coordinates: region frames carry their origin inside the window.
+
+_region_stats = {'region_captures': 0, 'region_hits': 0, 'region_fallbacks': 0, 'pixels_saved': 0}
+
+
+def _region_capture_rect(window, lookups):
+    """
+    Window rectangle to capture for a set of lookups, or None to capture the whole window.
+    
+    Args:
+        lookups: list of (compiled, roi, element_name)
+    
+    Returns:
+        tuple: (x0, y0, x1, y1) union of the lookups' ROI rectangles, or None if region
+               capture is off, a lookup has no ROI, the last lookup of an element on this
+               window missed, the union is larger than REGION_CAPTURE_MAX_FRACTION of the
+               window, a whole-window frame is still fresh or the window is served by the
+               shared grab
+    """
+    if not REGION_CAPTURE_ENABLED or not lookups or any(roi is None for _, roi, _ in lookups):
+        return None
+    window_key = _window_key(window)
+    if any((window_key, name) in _known_misses for _, _, name in lookups):
+        return None
+    region = _window_region(window)
+    if _in_shared_capture(region):
+        return None  # The shared grab already covers every monitored window
+    width, height = region[2], region[3]
+    if any(compiled.width > width or compiled.height > height for compiled, _, _ in lookups):
+        return None
+    with _frame_cache_lock:
+        if _fresh_frame(_frame_cache, region, time.monotonic()) is not None:
+            return None
+    
+    rects = [roi_to_rect(roi, width, height, compiled.width, compiled.height) for compiled, roi, _ in lookups]
+    x0, y0 = min(r[0] for r in rects), min(r[1] for r in rects)
+    x1, y1 = max(r[2] for r in rects), max(r[3] for r in rects)
+    if (x1 - x0) * (y1 - y0) > REGION_CAPTURE_MAX_FRACTION * width * height:
+        return None
+    return x0, y0, x1, y1
+
+
+def capture_region(window, rect):
+    """
+    Capture part of a window, reusing a fresh frame of that window that already covers it.
+    
+    Args:
+        window: pygetwindow Window object
+        rect: (x0, y0, x1, y1) in window coordinates
+    
+    Returns:
+        Frame: the capture, with frame.origin its top-left position in the window
+    """
+    region = _window_region(window)
+    now = time.monotonic()
+    with _frame_cache_lock:
+        for cache in (_frame_cache, _region_frame_cache):
+            frame = _fresh_frame(cache, region, now)
+            if frame is not None and frame.covers(rect):
+                _frame_cache_stats['hits'] += 1
+                return frame
+    
+    window_key = _window_key(window)
+    backend = get_capture_backend()
+    buffers = _next_frame_buffers(window_key, "region")
+    bgr = _to_bgr(backend.grab_rect(region, rect), backend.channel_order, buffers)
+    frame = Frame(bgr, region, time.monotonic(), window_key, origin=rect[:2], buffers=buffers)
+    with _frame_cache_lock:
+        _frame_cache_stats['misses'] += 1
+        _region_frame_cache[region] = frame
+    _count(_region_stats, 'region_captures')
+    return frame
+
+
+def _search_region(frame, compiled, min_confidence, element_name, roi, mode="bgr"):
+    """
+    Match a template inside its ROI on a region frame.
+    
+    Only hits are final: a miss here says nothing about the rest of the window,
+    so it is not remembered and the caller searches a whole-window frame next.
+    
+    Returns:
+        tuple: ((rel_x, rel_y), confidence) in window coordinates, or (None, confidence)
+    """
+    ox, oy = frame.origin
+    x0, y0, x1, y1 = roi_to_rect(roi, frame.region[2], frame.region[3], compiled.width, compiled.height)
+    max_val, max_loc = _match_stage(frame, compiled, mode, (x0 - ox, y0 - oy, x1 - ox, y1 - oy))
+    if max_val < min_confidence:
+        _count(_region_stats, 'region_fallbacks')
+        return None, max_val
+    
+    _count(_region_stats, 'region_hits')
+    x, y = max_loc[0] + ox, max_loc[1] + oy
+    result_key = (frame.window_key, element_name)
+    with _search_state_lock:
+        _last_hits[result_key] = (x, y, max_val)
+        _known_misses.pop(result_key, None)
+        _last_results.pop(result_key, None)
+    if max_val < LOG_THRESHOLD:
+        _log(f"{element_name}: FOUND at ({x + compiled.width // 2}, {y + compiled.height // 2}) "
+             f"confidence={max_val:.2%} ⚠️")
+    return (x + compiled.width // 2, y + compiled.height // 2), max_val
+
+
+def get_region_capture_stats():
+    """Return region capture counters (captures, lookups answered from them, fallbacks, pixels not captured)"""
+    return _snapshot(_region_stats)
+
 
 # =============================================================================
-# CONFIGURATION
+# EXACT-PIXEL MATCHING
 # =============================================================================
-DEBUG_MODE = True  # Set to True to enable detailed logging
-LOG_THRESHOLD = 0.95  # Only log if confidence is below this (0.95 = 95%)
-SAVE_FAILED_SCREENSHOTS = False  # Set to True to save screenshots when search fails
-FAILED_SCREENSHOT_DIR = "debug_screenshots"  # Directory to save failed screenshots
+# Static UI chrome appears on screen pixel for pixel as it was cropped, so a
+# normalized cross-correlation over the whole window is not needed to find it.
+# "exact" mode indexes the frame by the color of a rare template pixel, drops
+# candidates as soon as one of a few sample pixels differs, and verifies the
+# survivors with a mean absolute difference. When that finds nothing the stage
+# falls back to TM_CCOEFF_NORMED on the BGR plane.
 
+_exact_stats = {'exact_hits': 0, 'fallbacks': 0, 'crowded': 0}
 
-def _log(message, force=False):
-    """Internal logging function that respects DEBUG_MODE"""
-    if DEBUG_MODE or force:
-        print(f"[ImageSearch] {message}")
+
+def _build_exact_probe(bgr):
+    """
+    Pick anchor and sample pixels of a template for exact matching.
+    
+    Anchors are pixels whose (coarsely quantized) color is rarest in the template,
+    preferring saturated ones and skipping the 1px border, which is often background.
+    
+    Returns:
+        tuple: (anchors, samples), each a list of (dy, dx, color) with color an int16 BGR array
+    """
+    h, w = bgr.shape[:2]
+    pixels = bgr.reshape(-1, 3).astype(np.int16)
+    quantized = (pixels[:, 0] // 32) * 64 + (pixels[:, 1] // 32) * 8 + pixels[:, 2] // 32
+    rarity = np.bincount(quantized, minlength=512)[quantized]
+    saturation = pixels.max(axis=1) - pixels.min(axis=1)
+    ys, xs = np.divmod(np.arange(h * w), w)
+    interior = (ys > 0) & (ys < h - 1) & (xs > 0) & (xs < w - 1) if h > 2 and w > 2 else np.ones(h * w, bool)
+    
+    anchors, used_colors = [], set()
+    for index in np.lexsort((-saturation, rarity, ~interior)):
+        if quantized[index] in used_colors:
+            continue
+        used_colors.add(quantized[index])
+        anchors.append((int(ys[index]), int(xs[index]), pixels[index]))
+        if len(anchors) == EXACT_ANCHORS:
+            break
+    
+    sample_indices = np.unique(np.linspace(0, h * w - 1, min(EXACT_SAMPLES, h * w)).astype(int))
+    samples = [(int(ys[i]), int(xs[i]), pixels[i]) for i in sample_indices]
+    return anchors, samples
 
 
-def _save_debug_screenshot(screenshot, template, element_name, confidence):
-    """Save screenshot and template for debugging failed searches"""
-    if not SAVE_FAILED_SCREENSHOTS:
-        return
+def _match_exact(image, compiled, rect=None):
+    """
+    Exact-pixel search of a BGR template in a BGR image (or only the rect part of it).
     
-    try:
-        os.makedirs(FAILED_SCREENSHOT_DIR, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save screenshot
-        screenshot_path = os.path.join(FAILED_SCREENSHOT_DIR, f"{timestamp}_{element_name}_screenshot.png")
-        cv2.imwrite(screenshot_path, screenshot)
+    Returns:
+        tuple: (confidence, (x, y)) of the closest match with confidence = 1 - mean difference / 255,
+               or None if there is no match (or too many candidates to check cheaply)
+    """
+    if rect is not None:
+        x0, y0, x1, y1 = rect
+        image = image[y0:y1, x0:x1]
+    else:
+        x0, y0 = 0, 0
+    h, w = image.shape[:2]
+    th, tw = compiled.height, compiled.width
+    if th > h or tw > w:
+        return None
+    _count(_dirty_stats, 'area_searched_px', h * w)
+    anchors, samples = compiled.exact_probe
+    
+    # Top-left positions where an anchor pixel has the right color; keep the rarest anchor
+    mask = None
+    for dy, dx, color in anchors:
+        lower = np.clip(color - EXACT_TOLERANCE, 0, 255).astype(np.uint8)
+        upper = np.clip(color + EXACT_TOLERANCE, 0, 255).astype(np.uint8)
+        anchor_mask = cv2.inRange(image[dy:h - th + dy + 1, dx:w - tw + dx + 1], lower, upper)
+        count = cv2.countNonZero(anchor_mask)
+        if count == 0:
+            return None
+        if mask is None or count < mask_count:
+            mask, mask_count = anchor_mask, count
+    if mask_count > EXACT_MAX_CANDIDATES:
+        _count(_exact_stats, 'crowded')
+        return None
+    ys, xs = np.nonzero(mask)
+    
+    # Drop candidates at the first sample pixel that differs
+    for dy, dx, color in samples:
+        diff = np.abs(image[ys + dy, xs + dx].astype(np.int16) - color).max(axis=1)
+        keep = diff <= EXACT_TOLERANCE
+        ys, xs = ys[keep], xs[keep]
+        if not len(ys):
+            return None
+    
+    template = compiled.bgr
+    best_diff, best_loc = None, None
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        mean_diff = cv2.norm(image[y:y + th, x:x + tw], template, cv2.NORM_L1) / template.size
+        if best_diff is None or mean_diff < best_diff:
+            best_diff, best_loc = mean_diff, (x + x0, y + y0)
+    if best_diff > EXACT_MAX_MEAN_DIFF:
+        return None
+    return 1.0 - best_diff / 255.0, best_loc
+
+
+def _match_stage(frame, compiled, mode, rect=None):
+    """
+    One stage of _search_frame: exact-pixel search first in "exact" mode,
+    TM_CCOEFF_NORMED on the mode's plane otherwise or when that finds nothing.
+    
+    Returns:
+        tuple: (best_confidence, (x, y)) like _match_in_rect
+    """
+    if mode == "exact":
+        found = _match_exact(frame.bgr, compiled, rect)
+        if found is not None:
+            _count(_exact_stats, 'exact_hits')
+            return found
+        _count(_exact_stats, 'fallbacks')
+    return _match_in_rect(frame.image(mode), compiled.image(mode), rect)
+
+
+def get_exact_match_stats():
+    """Return exact-mode counters (stages answered exactly, fallbacks to TM_CCOEFF_NORMED, crowded frames)"""
+    return _snapshot(_exact_stats)
+
+
+def _match_pyramid(frame, compiled, levels, mode="bgr"):
+    """
+    Coarse-to-fine match: find candidate peaks at 1/2**levels scale, then refine
+    each at full resolution in a small window around it.
+    
+    Returns:
+        tuple: (best_confidence, (x, y)) like _match_in_rect on the full frame
+    """
+    # Do not shrink the template below a usable size
+    while levels > 0 and min(compiled.width, compiled.height) >> levels < PYRAMID_MIN_TEMPLATE_SIZE:
+        levels -= 1
+    if levels == 0:
+        return _match_in_rect(frame.image(mode), compiled.image(mode))
+    
+    coarse_frame = frame.image(mode, levels)
+    coarse_template = compiled.image(mode, levels)
+    th, tw = coarse_template.shape[:2]
+    if tw > coarse_frame.shape[1] or th > coarse_frame.shape[0]:
+        return _match_in_rect(frame.image(mode), compiled.image(mode))
+    
+    result = cv2.matchTemplate(coarse_frame, coarse_template, cv2.TM_CCOEFF_NORMED)
+    scale = 1 << levels
+    margin = 2 * scale
+    best_val, best_loc = -1.0, (0, 0)
+    for _ in range(PYRAMID_CANDIDATES):
+        _, coarse_val, _, (cx, cy) = cv2.minMaxLoc(result)
+        if coarse_val <= -1.0:
+            break
+        # Suppress this peak so the next iteration finds a different candidate
+        cv2.rectangle(result, (cx - tw // 2, cy - th // 2), (cx + tw // 2, cy + th // 2), -1.0, -1)
         
-        # Save template
-        template_path = os.path.join(FAILED_SCREENSHOT_DIR, f"{timestamp}_{element_name}_template.png")
-        cv2.imwrite(template_path, template)
+        rect = _clamp_rect((cx * scale - margin, cy * scale - margin,
+                            cx * scale + compiled.width + margin, cy * scale + compiled.height + margin),
+                           frame.width, frame.height, compiled.width, compiled.height)
+        val, loc = _match_in_rect(frame.image(mode), compiled.image(mode), rect)
+        if val > best_val:
+            best_val, best_loc = val, loc
+    return best_val, best_loc
+
+
+# =============================================================================
+# UNCHANGED-FRAME SHORT CIRCUIT
+# =============================================================================
+
+_known_misses = {}  # (window_key, element_name) -> (fingerprint, min_confidence, mode, pyramid, roi, best_confidence)
+_short_circuit_stats = {'cached_misses': 0}
+
+
+def reset_search_state():
+    """Forget remembered positions, known misses and reusable results (every next lookup does a full search)"""
+    with _search_state_lock:
+        _last_hits.clear()
+        _known_misses.clear()
+        _last_results.clear()
+
+
+def get_short_circuit_stats():
+    """Return how many matches were skipped because the frame had not changed since a miss"""
+    return _snapshot(_short_circuit_stats)
+
+
+# =============================================================================
+# DIRTY-RECTANGLE CHANGE DETECTION
+# =============================================================================
+
+_last_results = {}  # (window_key, element_name) -> (thumbnail, hit_rect, result, min_confidence, mode, pyramid, roi)
+_dirty_stats = {'reused_results': 0, 'rematched': 0, 'area_skipped_px': 0, 'area_searched_px': 0}
+
+
+def changed_regions(previous_thumbnail, thumbnail):
+    """
+    Rectangles that changed between two downsampled captures of the same window.
+    
+    Returns:
+        list: [(x0, y0, x1, y1), ...] in full-resolution window coordinates
+              (the whole frame if the window size changed)
+    """
+    if previous_thumbnail.shape != thumbnail.shape:
+        h, w = thumbnail.shape[:2]
+        return [(0, 0, w * FINGERPRINT_SCALE, h * FINGERPRINT_SCALE)]
+    
+    diff = cv2.absdiff(previous_thumbnail, thumbnail)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    mask = (diff > DIRTY_THRESHOLD).astype(np.uint8)
+    if not mask.any():
+        return []
+    
+    mask = cv2.dilate(mask, np.ones((3, 3), np.uint8))
+    count, _, boxes, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    return [(x * FINGERPRINT_SCALE, y * FINGERPRINT_SCALE, (x + w) * FINGERPRINT_SCALE, (y + h) * FINGERPRINT_SCALE)
+            for x, y, w, h, _ in boxes[1:count]]
+
+
+def _rects_intersect(a, b):
+    """Check whether two (x0, y0, x1, y1) rectangles overlap"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def get_dirty_rect_stats():
+    """
+    Return change-detection counters: results reused because their area did not change,
+    lookups that had to match again, and the match area skipped vs. actually searched (pixels).
+    """
+    stats = _snapshot(_dirty_stats)
+    total = stats['area_skipped_px'] + stats['area_searched_px']
+    stats['skipped_fraction'] = stats['area_skipped_px'] / total if total else 0.0
+    return stats
+
+
+# =============================================================================
+# LAST-KNOWN-LOCATION HINTS
+# =============================================================================
+
+_last_hits = {}  # (window_key, element_name) -> (x, y, confidence) of the last match
+_hint_stats = {'hint_hits': 0, 'hint_misses': 0}
+
+
+def get_hint_stats():
+    """Return how often the last-known-location neighborhood found the element"""
+    return _snapshot(_hint_stats)
+
+
+def clear_location_hints():
+    """Forget every remembered element position"""
+    with _search_state_lock:
+        _last_hits.clear()
+
+
+# =============================================================================
+# MULTI-SCALE MATCHING
+# =============================================================================
+
+_window_scales = {}  # window_key -> (scale, (width, height)) detected for that window
+_scale_detect_attempts = {}  # window_key -> monotonic time of the last failed detection
+_scale_misses = {}  # window_key -> consecutive lookup misses since the scale was last confirmed
+
+
+def _scale_candidates():
+    """Scales in SCALE_RANGE, nearest to 1.0 first"""
+    low, high = SCALE_RANGE
+    count = int(round((high - low) / SCALE_STEP)) + 1
+    scales = {round(low + i * SCALE_STEP, 3) for i in range(count)}
+    scales.add(1.0)
+    return sorted(scales, key=lambda scale: (abs(scale - 1.0), scale))
+
+
+def detect_window_scale(window, anchors):
+    """
+    Find the UI scale of a client by matching anchor elements across SCALE_RANGE.
+    
+    All scales are tried on one capture (on the gray plane, to keep it cheap),
+    nearest to 1.0 first, stopping once an anchor matches SCALE_ACCEPT_CONFIDENCE.
+    A scale other than 1.0 is only chosen if it beats 1.0 by SCALE_MARGIN, and the
+    winning anchor must match at that scale in BGR as well.
+    
+    Args:
+        window: pygetwindow Window object
+        anchors: list of (element_name, b64_string) expected to be on screen
+    
+    Returns:
+        tuple: (scale, confidence) or (None, best_confidence) if no anchor matched well enough
+    """
+    frame = capture_frame(window)
+    frame_gray = frame.image("gray")
+    compiled_anchors = [c for c in (_load_template(b64, name) for name, b64 in anchors) if c is not None]
+    
+    best_by_scale = {}  # scale -> (best gray confidence, anchor that reached it)
+    for scale in _scale_candidates():
+        for compiled in compiled_anchors:
+            template = _resize_image(compiled.gray, scale)
+            if template.shape[0] > frame.height or template.shape[1] > frame.width:
+                continue
+            val, _ = _match_in_rect(frame_gray, template)
+            if val > best_by_scale.get(scale, (0.0, None))[0]:
+                best_by_scale[scale] = (val, compiled)
+        if best_by_scale.get(scale, (0.0, None))[0] >= SCALE_ACCEPT_CONFIDENCE:
+            break
+    if not best_by_scale:
+        return None, 0.0
+    
+    best_scale = max(best_by_scale, key=lambda scale: best_by_scale[scale][0])
+    best_val, anchor = best_by_scale[best_scale]
+    unscaled_val = best_by_scale.get(1.0, (0.0, None))[0]
+    if best_scale != 1.0 and best_val < unscaled_val + SCALE_MARGIN:
+        if 1.0 not in best_by_scale:
+            return None, best_val
+        best_scale, (best_val, anchor) = 1.0, best_by_scale[1.0]
+    if best_val < SCALE_MIN_CONFIDENCE:
+        return None, best_val
+    
+    # Confirm on the color image: gray alone can line up with the wrong element
+    template = _resize_image(anchor.bgr, best_scale)
+    confirmed, _ = _match_in_rect(frame.bgr, template)
+    if confirmed < SCALE_MIN_CONFIDENCE:
+        return None, confirmed
+    return best_scale, best_val
+
+
+def _scale_still_matches(window, anchors, scale):
+    """Check that at least one anchor still matches in BGR at a window's cached scale"""
+    frame = capture_frame(window)
+    for name, b64 in anchors:
+        compiled = _load_template(b64, name)
+        if compiled is None:
+            continue
+        template = _resize_image(compiled.bgr, scale)
+        if template.shape[0] > frame.height or template.shape[1] > frame.width:
+            continue
+        if _match_in_rect(frame.bgr, template)[0] >= SCALE_MIN_CONFIDENCE:
+            return True
+    return False
+
+
+def _count_scale_miss(window, found):
+    """Track consecutive lookup misses on a window with a cached scale (see SCALE_RECHECK_MISSES)"""
+    key = _window_key(window)
+    if key not in _window_scales:
+        return
+    with _search_state_lock:
+        if found:
+            _scale_misses.pop(key, None)
+        else:
+            _scale_misses[key] = _scale_misses.get(key, 0) + 1
+
+
+def ensure_window_scale(window, anchors):
+    """
+    Detect and cache the window's UI scale the first time the window is seen (or resized).
+    Failed detections are retried at most every SCALE_DETECT_RETRY_INTERVAL seconds.
+    After SCALE_RECHECK_MISSES lookups in a row missed on the window, the cached scale
+    is checked against the anchors again and detected anew if none matches at it; it
+    is only replaced by a different detected scale, so a loading screen or blank frame
+    keeps it.
+    
+    Returns:
+        float: the cached scale, or 1.0 while it is unknown
+    """
+    key = _window_key(window)
+    size = (window.width, window.height)
+    cached = _window_scales.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[1] == size:
+        if _scale_misses.get(key, 0) < SCALE_RECHECK_MISSES:
+            return cached[0]
+        _scale_misses.pop(key, None)
+        if _scale_still_matches(window, anchors, cached[0]):
+            return cached[0]
+        if now - _scale_detect_attempts.get(key, -SCALE_DETECT_RETRY_INTERVAL) < SCALE_DETECT_RETRY_INTERVAL:
+            return cached[0]
         
-        _log(f"Saved debug images: {screenshot_path}", force=True)
-    except Exception as e:
-        _log(f"Failed to save debug screenshot: {e}", force=True)
+        scale, confidence = detect_window_scale(window, anchors)
+        if scale is None:
+            _scale_detect_attempts[key] = now
+            _log(f"No anchor matches at scale {cached[0]:.2f} (best anchor confidence={confidence:.2%}), "
+                 f"keeping it")
+            return cached[0]
+        _scale_detect_attempts.pop(key, None)
+        if scale != cached[0]:
+            set_window_scale(window, scale)
+            _log(f"Client UI scale changed from {cached[0]:.2f} to {scale:.2f} "
+                 f"(anchor confidence={confidence:.2%})", force=True)
+        return scale
+    
+    if now - _scale_detect_attempts.get(key, -SCALE_DETECT_RETRY_INTERVAL) < SCALE_DETECT_RETRY_INTERVAL:
+        return 1.0
+    
+    scale, confidence = detect_window_scale(window, anchors)
+    if scale is None:
+        _scale_detect_attempts[key] = now
+        _log(f"Scale detection failed (best anchor confidence={confidence:.2%}), using 1.0", force=True)
+        return 1.0
+    
+    _scale_detect_attempts.pop(key, None)
+    set_window_scale(window, scale)
+    if scale != 1.0:
+        _log(f"Detected client UI scale {scale:.2f} (anchor confidence={confidence:.2%})", force=True)
+    return scale
+
+
+def get_window_scale(window):
+    """Cached UI scale of a window (1.0 if not detected)"""
+    cached = _window_scales.get(_window_key(window))
+    return cached[0] if cached is not None else 1.0
+
+
+def set_window_scale(window, scale):
+    """Force the UI scale used for a window's lookups"""
+    key = _window_key(window)
+    _window_scales[key] = (scale, (window.width, window.height))
+    # Results remembered at the old scale no longer apply
+    with _search_state_lock:
+        _scale_misses.pop(key, None)
+        for state in (_last_hits, _known_misses, _last_results):
+            for state_key in [k for k in state if k[0] == key]:
+                del state[state_key]
+
+
+def _search_frame(frame, compiled, min_confidence, element_name, roi=None, pyramid=0, mode="bgr"):
+    """
+    Match one compiled template against an already captured frame.
+    
+    The search is narrowed in stages: first a small neighborhood around where
+    the element was last found in this window, then its ROI (if given), and
+    only then the whole frame. With pyramid > 0 the whole-frame stage runs
+    coarse-to-fine (see _match_pyramid) instead of at native resolution.
+    Matching runs on the color plane selected by mode (see MATCH_MODES); the
+    frame's plane is converted once per capture and shared across lookups.
+    In "exact" mode every stage tries an exact-pixel search first (see _match_exact).
+    
+    Before any matching, a previous result for this element and window is
+    reused when the screen has not changed where it matters: a miss when the
+    whole frame is unchanged, a hit when no changed region touches it. Misses
+    need the whole frame because they were searched over the whole frame.
+    
+    Returns:
+        tuple: ((rel_x, rel_y), confidence) or (None, best_confidence) if not found
+    """
+    # Same screen as the last time this element was missing: report the miss again without matching
+    result_key = (frame.window_key, element_name)
+    known_miss = _known_misses.get(result_key)
+    if known_miss is not None and known_miss[:5] == (frame.fingerprint, min_confidence, mode, pyramid, roi):
+        _count(_short_circuit_stats, 'cached_misses')
+        _count(_dirty_stats, 'area_skipped_px', frame.width * frame.height)
+        _log(f"{element_name}: NOT FOUND (unchanged frame) - best confidence={known_miss[5]:.2%}")
+        return None, known_miss[5]
+    
+    # Previous hit whose area did not change since it was matched: reuse it
+    previous = _last_results.get(result_key)
+    if previous is not None and previous[3:] == (min_confidence, mode, pyramid, roi):
+        previous_thumbnail, hit_rect, result = previous[:3]
+        changes = frame.changed_regions_since(previous_thumbnail)
+        if not any(_rects_intersect(hit_rect, change) for change in changes):
+            _count(_dirty_stats, 'reused_results')
+            _count(_dirty_stats, 'area_skipped_px', frame.width * frame.height)
+            return result
+        _count(_dirty_stats, 'rematched')
+    
+    template_h, template_w = compiled.height, compiled.width
+    
+    # Check template fits in screenshot
+    screenshot_h, screenshot_w = frame.height, frame.width
+    if template_w > screenshot_w or template_h > screenshot_h:
+        _log(f"{element_name}: Template ({template_w}x{template_h}) larger than window ({screenshot_w}x{screenshot_h})", force=True)
+        return None, 0.0
+    
+    max_val = None
+    hint_key = (frame.window_key, element_name)
+    hint = _last_hits.get(hint_key)
+    if hint is not None:
+        hint_x, hint_y, hint_confidence = hint
+        rect = _clamp_rect((hint_x - HINT_MARGIN, hint_y - HINT_MARGIN,
+                            hint_x + template_w + HINT_MARGIN, hint_y + template_h + HINT_MARGIN),
+                           screenshot_w, screenshot_h, template_w, template_h)
+        max_val, max_loc = _match_stage(frame, compiled, mode, rect)
+        if max_val >= min_confidence and max_val >= hint_confidence - HINT_CONFIDENCE_DROP:
+            _count(_hint_stats, 'hint_hits')
+        else:
+            _count(_hint_stats, 'hint_misses')
+            max_val = None
+    
+    if max_val is None and roi is not None:
+        rect = roi_to_rect(roi, screenshot_w, screenshot_h, template_w, template_h)
+        max_val, max_loc = _match_stage(frame, compiled, mode, rect)
+        if max_val >= min_confidence:
+            _count(_roi_stats, 'roi_hits')
+        else:
+            _count(_roi_stats, 'roi_fallbacks')
+            max_val = None
+    
+    # Search for template - find the best match in a single pass
+    if max_val is None:
+        if pyramid:
+            max_val, max_loc = _match_pyramid(frame, compiled, pyramid, mode)
+        else:
+            max_val, max_loc = _match_stage(frame, compiled, mode)
+    
+    # Return best match if it meets minimum confidence threshold
+    if max_val >= min_confidence:
+        rel_x = max_loc[0] + template_w // 2
+        rel_y = max_loc[1] + template_h // 2
+        hit_rect = (max_loc[0], max_loc[1], max_loc[0] + template_w, max_loc[1] + template_h)
+        with _search_state_lock:
+            _last_hits[hint_key] = (max_loc[0], max_loc[1], max_val)
+            _known_misses.pop(result_key, None)
+            _last_results[result_key] = (frame.thumbnail, hit_rect, ((rel_x, rel_y), max_val), min_confidence, mode,
+                                         pyramid, roi)
+        # Only log if confidence is below LOG_THRESHOLD
+        if max_val < LOG_THRESHOLD:
+            _log(f"{element_name}: FOUND at ({rel_x}, {rel_y}) confidence={max_val:.2%} ⚠️")
+        return (rel_x, rel_y), max_val
+    
+    # NOT FOUND - log detailed information
+    _log(f"{element_name}: NOT FOUND - best confidence={max_val:.2%} (threshold={min_confidence:.0%})", force=True)
+    _log(f"{element_name}: Best match position was ({max_loc[0]}, {max_loc[1]})")
+    with _search_state_lock:
+        _known_misses[result_key] = (frame.fingerprint, min_confidence, mode, pyramid, roi, max_val)
+        _last_results.pop(result_key, None)
+    
+    # Save debug screenshots if enabled
+    _save_debug_screenshot(frame, compiled.bgr, element_name, max_val)
+    
+    return None, max_val
 
 
-def search_image(b64_string, window, min_confidence=0.7, return_confidence=False, element_name="UNKNOWN"):
+def search_image(b64_string, window, min_confidence=0.7, return_confidence=False, element_name="UNKNOWN",
+                 roi=None, pyramid=0, mode="bgr", scale=None):
     """
     Search for a Base64 image within a window and return the best match coordinates.
     
     Uses a single screenshot capture and returns the best match found as long as
     it meets the minimum confidence threshold. This approach ensures finding the
-    image if it exists with any confidence >= min_confidence.
+    image if it exists with any confidence >= min_confidence. With an ROI only
+    that part of the window is captured first (see capture_region).
     
     Args:
-        b64_string: Base64 string of the image to search for
+        b64_string: Base64 string of the image to search for (or its BGR array)
         window: pygetwindow Window object
         min_confidence: Minimum match threshold (0.0 to 1.0), default 0.7
         return_confidence: If True, returns (coords, confidence) tuple instead of just coords
         element_name: Name of element being searched (for logging)
+        roi: Optional (anchor, x, y, w, h) relative region searched first (see roi_to_rect)
+        pyramid: Coarse-to-fine levels for the full-window search (0 = off, 1 = 1/2, 2 = 1/4)
+        mode: Color plane to match on, one of MATCH_MODES (default "bgr")
+        scale: UI scale to rescale the template to (default: the window's cached scale)
     
     Returns:
         If return_confidence=False:
@@ -71,71 +1938,349 @@ def search_image(b64_string, window, min_confidence=0.7, return_confidence=False
         If return_confidence=True:
             tuple: ((rel_x, rel_y), confidence_value) or (None, 0.0) if not found
     """
-    # Validate input
-    if not b64_string or b64_string == "#":
-        _log(f"{element_name}: SKIPPED (empty or placeholder B64)")
+    # Get compiled template (decoded once per process)
+    compiled = _load_template(b64_string, element_name)
+    if compiled is None or not _window_is_valid(window, element_name):
         return (None, 0.0) if return_confidence else None
+    if scale is None:
+        scale = get_window_scale(window)
+    compiled = compiled.scaled(scale)
     
-    # Decode b64 to OpenCV image
+    # Only the ROI first, when nothing fresher covers it
+    rect = _region_capture_rect(window, [(compiled, roi, element_name)])
+    region_seconds = 0.0
+    if rect is not None:
+        found, region_seconds = _search_region_capture(window, rect,
+                                                       [(compiled, min_confidence, element_name, roi, mode)])
+        if element_name in found:
+            _record_capture(element_name, region_seconds)
+            _count_scale_miss(window, True)
+            coords, confidence = found[element_name]
+            return (coords, confidence) if return_confidence else coords
+    
+    # Capture window region (shared with other lookups while the frame is fresh)
+    start = time.perf_counter()
     try:
-        image_bytes = base64.b64decode(b64_string)
-        pil_image = Image.open(io.BytesIO(image_bytes))
-        
-        if pil_image.mode == 'RGBA':
-            pil_image = pil_image.convert('RGB')
-        
-        template = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        template_h, template_w = template.shape[:2]
+        frame = capture_frame(window)
     except Exception as e:
-        _log(f"{element_name}: ERROR decoding B64 - {e}", force=True)
+        _log(f"{element_name}: ERROR capturing screenshot - {e}", force=True)
         return (None, 0.0) if return_confidence else None
+    _record_capture(element_name, region_seconds + time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    coords, confidence = _search_frame(frame, compiled, min_confidence, element_name, roi, pyramid, mode)
+    _record_match(element_name, time.perf_counter() - start, coords is not None, confidence)
+    _count_scale_miss(window, coords is not None)
+    return (coords, confidence) if return_confidence else coords
+
+
+def search_many(templates, window, min_confidence=0.7, rois=None, pyramids=None, modes=None):
+    """
+    Search for several Base64 images on a single capture of the window.
+    
+    The window is captured and converted once, then every template is matched
+    against that same frame, spread over MATCH_THREADS worker threads. When
+    every template has an ROI, only the union of the ROIs is captured first
+    and just the templates missing there go on to a whole-window capture.
+    
+    Args:
+        templates: dict of {element_name: b64_string} (or list of (name, b64) pairs)
+        window: pygetwindow Window object
+        min_confidence: Minimum match threshold, or dict of {element_name: threshold}
+        rois: Optional dict of {element_name: roi} searched first (see roi_to_rect)
+        pyramids: Optional dict of {element_name: pyramid levels} (see search_image)
+        modes: Optional dict of {element_name: match mode} (see search_image)
+    
+    Returns:
+        dict: {element_name: ((rel_x, rel_y), confidence)} with (None, confidence) for misses
+    """
+    items = list(templates.items()) if isinstance(templates, dict) else list(templates)
+    results = {name: (None, 0.0) for name, _ in items}
+    
+    compiled_items = []
+    for name, b64_string in items:
+        compiled = _load_template(b64_string, name)
+        if compiled is not None:
+            compiled_items.append((name, compiled))
+    
+    if not compiled_items or not _window_is_valid(window, "BATCH"):
+        return results
     
-    # Validate window
+    scale = get_window_scale(window)
+    jobs = []
+    for name, compiled in compiled_items:
+        compiled = compiled.scaled(scale)
+        threshold = min_confidence.get(name, 0.7) if isinstance(min_confidence, dict) else min_confidence
+        roi = rois.get(name) if rois else None
+        pyramid = pyramids.get(name, 0) if pyramids else 0
+        mode = modes.get(name, "bgr") if modes else "bgr"
+        jobs.append((compiled, threshold, name, roi, pyramid, mode))
+    
+    rect = _region_capture_rect(window, [(job[0], job[3], job[2]) for job in jobs])
+    region_seconds = 0.0
+    if rect is not None:
+        found, region_seconds = _search_region_capture(window, rect,
+                                                       [(job[0], job[1], job[2], job[3], job[5]) for job in jobs])
+        results.update(found)
+        jobs = [job for job in jobs if job[2] not in found]
+        if not jobs:
+            _record_capture("BATCH", region_seconds)
+            _count_scale_miss(window, True)
+            return results
+    
+    start = time.perf_counter()
     try:
-        if window.width <= 0 or window.height <= 0:
-            _log(f"{element_name}: ERROR window has invalid dimensions {window.width}x{window.height}", force=True)
-            return (None, 0.0) if return_confidence else None
+        frame = capture_frame(window)
     except Exception as e:
-        _log(f"{element_name}: ERROR accessing window - {e}", force=True)
-        return (None, 0.0) if return_confidence else None
+        _log(f"BATCH: ERROR capturing screenshot - {e}", force=True)
+        return results
+    _record_capture("BATCH", region_seconds + time.perf_counter() - start)
+    
+    pool = _get_match_pool() if len(jobs) >= PARALLEL_MIN_TEMPLATES else None
+    if pool is None:
+        for job in jobs:
+            results[job[2]] = _timed_search(frame, *job)
+        _count_scale_miss(window, any(coords is not None for coords, _ in results.values()))
+        return results
+    
+    # Color planes and the change fingerprint are computed lazily; do it once here
+    # instead of letting the workers race to convert the same frame
+    for compiled, _, _, _, _, mode in jobs:
+        frame.image(mode)
+        compiled.image(mode)
+    frame.fingerprint  # Also builds the thumbnail the dirty-rectangle check compares
+    
+    # Workers share the frame read-only; results are collected in input order
+    futures = [pool.submit(_timed_search, frame, *job) for job in jobs]
+    for job, future in zip(jobs, futures):
+        results[job[2]] = future.result()
+    _count_scale_miss(window, any(coords is not None for coords, _ in results.values()))
+    return results
+
+
+def _search_region_capture(window, rect, lookups):
+    """
+    Capture rect of the window and match lookups inside their ROIs on it.
+    
+    Args:
+        lookups: list of (compiled, min_confidence, element_name, roi, mode)
+    
+    Returns:
+        tuple: ({element_name: ((rel_x, rel_y), confidence)} for the hits only (empty if the
+               capture failed), capture time in seconds for the caller's telemetry)
+    """
+    start = time.perf_counter()
+    grabbed_after = time.monotonic()
+    try:
+        frame = capture_region(window, rect)
+    except Exception as e:
+        _log(f"REGION: ERROR capturing screenshot - {e}", force=True)
+        return {}, time.perf_counter() - start
+    capture_seconds = time.perf_counter() - start
+    
+    found = {}
+    for compiled, min_confidence, element_name, roi, mode in lookups:
+        start = time.perf_counter()
+        coords, confidence = _search_region(frame, compiled, min_confidence, element_name, roi, mode)
+        if coords is not None:
+            _record_match(element_name, time.perf_counter() - start, True, confidence)
+            found[element_name] = (coords, confidence)
     
-    # Capture window region (single capture for best performance)
+    # Pixels are only saved by a new region grab that no whole-window capture follows
+    if len(found) == len(lookups) and frame.captured_at >= grabbed_after:
+        _count(_region_stats, 'pixels_saved', frame.region[2] * frame.region[3] - frame.width * frame.height)
+    return found, capture_seconds
+
+
+def _timed_search(frame, compiled, min_confidence, element_name, roi, pyramid, mode):
+    """_search_frame with its match time recorded in the telemetry"""
+    start = time.perf_counter()
+    result = _search_frame(frame, compiled, min_confidence, element_name, roi, pyramid, mode)
+    _record_match(element_name, time.perf_counter() - start, result[0] is not None, result[1])
+    return result
+
+
+# =============================================================================
+# PARALLEL MATCHING
+# =============================================================================
+# cv2.matchTemplate releases the GIL, so the templates of one search_many batch
+# are matched concurrently against the shared frame on a small thread pool.
+
+_match_pool = None
+_match_pool_lock = threading.Lock()
+
+
+def _get_match_pool():
+    """The batch matching thread pool, created on first use (None when MATCH_THREADS <= 1)"""
+    global _match_pool
+    if MATCH_THREADS <= 1:
+        return None
+    with _match_pool_lock:
+        if _match_pool is None:
+            _match_pool = ThreadPoolExecutor(max_workers=MATCH_THREADS, thread_name_prefix="match")
+        return _match_pool
+
+
+def set_match_threads(count):
+    """Change the number of batch matching threads (1 matches serially on the calling thread)"""
+    global MATCH_THREADS, _match_pool
+    with _match_pool_lock:
+        MATCH_THREADS = max(1, int(count))
+        if _match_pool is not None:
+            _match_pool.shutdown(wait=False)
+            _match_pool = None
+    _log(f"Batch matching threads set to {MATCH_THREADS}", force=True)
+
+
+# =============================================================================
+# MULTI-INSTANCE MATCHING
+# =============================================================================
+
+def _suppressed_peaks(result, template_w, template_h, min_confidence, max_results):
+    """
+    Non-maximum suppression on a match result: take the best peak, blank out the
+    area around it (FIND_ALL_SUPPRESS of the template size on each side), repeat.
+    Modifies result in place.
+    
+    Returns:
+        list: [((x, y), confidence)] top-left positions, best first
+    """
+    radius_x = max(1, int(template_w * FIND_ALL_SUPPRESS))
+    radius_y = max(1, int(template_h * FIND_ALL_SUPPRESS))
+    peaks = []
+    while len(peaks) < max_results:
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val < min_confidence:
+            break
+        peaks.append((max_loc, max_val))
+        cv2.rectangle(result, (max_loc[0] - radius_x, max_loc[1] - radius_y),
+                      (max_loc[0] + radius_x, max_loc[1] + radius_y), -1.0, -1)
+    return peaks
+
+
+def _find_all_in_rect(image, template, rect, min_confidence, max_results):
+    if rect is not None:
+        x0, y0, x1, y1 = rect
+        image = image[y0:y1, x0:x1]
+    else:
+        x0, y0 = 0, 0
+    _count(_dirty_stats, 'area_searched_px', image.shape[0] * image.shape[1])
+    result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+    peaks = _suppressed_peaks(result, template.shape[1], template.shape[0], min_confidence, max_results)
+    return [((x + x0, y + y0), val) for (x, y), val in peaks]
+
+
+def find_all(b64_string, window, min_confidence=0.7, element_name="UNKNOWN", roi=None, mode="bgr",
+             scale=None, max_results=FIND_ALL_MAX_RESULTS):
+    """
+    Find every instance of a Base64 image in a window from a single capture.
+    
+    Every match above min_confidence is kept, with overlapping detections of the
+    same instance merged by non-maximum suppression. If roi is given it is
+    searched first and the whole window only when nothing matched inside it.
+    
+    Args:
+        b64_string: Base64 string of the image to search for
+        window: pygetwindow Window object
+        min_confidence: Minimum match threshold (0.0 to 1.0)
+        element_name: Name of element being searched (for logging)
+        roi: Optional (anchor, x, y, w, h) relative region (see roi_to_rect)
+        mode: Color plane to match on, one of MATCH_MODES
+        scale: UI scale to rescale the template to (default: the window's cached scale)
+        max_results: Stop after this many instances
+    
+    Returns:
+        list: [((rel_x, rel_y), confidence)] centers relative to the window, best match first
+    """
+    compiled = _load_template(b64_string, element_name)
+    if compiled is None or not _window_is_valid(window, element_name):
+        return []
+    
+    start = time.perf_counter()
     try:
-        region = (window.left, window.top, window.width, window.height)
-        screenshot = pyautogui.screenshot(region=region)
-        screenshot_bgr = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+        frame = capture_frame(window)
     except Exception as e:
         _log(f"{element_name}: ERROR capturing screenshot - {e}", force=True)
-        return (None, 0.0) if return_confidence else None
+        return []
+    _record_capture(element_name, time.perf_counter() - start)
     
-    # Check template fits in screenshot
-    screenshot_h, screenshot_w = screenshot_bgr.shape[:2]
-    if template_w > screenshot_w or template_h > screenshot_h:
-        _log(f"{element_name}: Template ({template_w}x{template_h}) larger than window ({screenshot_w}x{screenshot_h})", force=True)
-        return (None, 0.0) if return_confidence else None
+    if scale is None:
+        scale = get_window_scale(window)
+    compiled = compiled.scaled(scale)
+    template_w, template_h = compiled.width, compiled.height
+    if template_w > frame.width or template_h > frame.height:
+        _log(f"{element_name}: Template ({template_w}x{template_h}) larger than window ({frame.width}x{frame.height})", force=True)
+        return []
     
-    # Search for template - find the best match in a single pass
-    result = cv2.matchTemplate(screenshot_bgr, template, cv2.TM_CCOEFF_NORMED)
-    min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+    start = time.perf_counter()
+    screenshot = frame.image(mode)
+    template = compiled.image(mode)
+    hits = []
+    if roi is not None:
+        rect = roi_to_rect(roi, frame.width, frame.height, template_w, template_h)
+        hits = _find_all_in_rect(screenshot, template, rect, min_confidence, max_results)
+    if not hits:
+        hits = _find_all_in_rect(screenshot, template, None, min_confidence, max_results)
+    _record_match(element_name, time.perf_counter() - start, bool(hits), hits[0][1] if hits else None)
     
-    # Return best match if it meets minimum confidence threshold
-    if max_val >= min_confidence:
-        rel_x = max_loc[0] + template_w // 2
-        rel_y = max_loc[1] + template_h // 2
-        coords = (rel_x, rel_y)
-        # Only log if confidence is below LOG_THRESHOLD
-        if max_val < LOG_THRESHOLD:
-            _log(f"{element_name}: FOUND at ({rel_x}, {rel_y}) confidence={max_val:.2%} ⚠️")
-        return (coords, max_val) if return_confidence else coords
+    _log(f"{element_name}: {len(hits)} instance(s) found (threshold={min_confidence:.0%})")
+    return [((x + template_w // 2, y + template_h // 2), val) for (x, y), val in hits]
+
+
+# =============================================================================
+# MATCH MODE CALIBRATION
+# =============================================================================
+
+def _top_two_peaks(result, template_w, template_h):
+    """Best and runner-up scores of a match result, the runner-up taken outside the best peak"""
+    _, best_val, _, best_loc = cv2.minMaxLoc(result)
+    suppressed = result.copy()
+    cv2.rectangle(suppressed, (best_loc[0] - template_w // 2, best_loc[1] - template_h // 2),
+                  (best_loc[0] + template_w // 2, best_loc[1] + template_h // 2), -1.0, -1)
+    _, second_val, _, _ = cv2.minMaxLoc(suppressed)
+    return best_val, best_loc, second_val
+
+
+def check_match_mode(frame, compiled, mode, min_confidence=0.7, margin=AMBIGUITY_MARGIN):
+    """
+    Check that matching a template in a reduced color mode stays unambiguous on a frame.
     
-    # NOT FOUND - log detailed information
-    _log(f"{element_name}: NOT FOUND - best confidence={max_val:.2%} (threshold={min_confidence:.0%})", force=True)
-    _log(f"{element_name}: Best match position was ({max_loc[0]}, {max_loc[1]})")
+    The frame should show the element. The reduced mode is flagged as ambiguous if
+    it picks a different location than BGR, if its runner-up peak clears the
+    threshold, or if the best match beats the runner-up by less than margin.
     
-    # Save debug screenshots if enabled
-    _save_debug_screenshot(screenshot_bgr, template, element_name, max_val)
+    Returns:
+        dict: {'visible', 'ambiguous', 'reason', 'bgr_confidence', 'mode_confidence', 'runner_up'}
+    """
+    report = {'visible': False, 'ambiguous': False, 'reason': '',
+              'bgr_confidence': 0.0, 'mode_confidence': 0.0, 'runner_up': 0.0}
+    if compiled.width > frame.width or compiled.height > frame.height:
+        report['reason'] = 'template larger than frame'
+        return report
+    
+    bgr_result = cv2.matchTemplate(frame.bgr, compiled.bgr, cv2.TM_CCOEFF_NORMED)
+    _, bgr_val, _, bgr_loc = cv2.minMaxLoc(bgr_result)
+    report['bgr_confidence'] = bgr_val
+    if bgr_val < min_confidence:
+        report['reason'] = 'element not visible in frame'
+        return report
+    report['visible'] = True
+    
+    result = cv2.matchTemplate(frame.image(mode), compiled.image(mode), cv2.TM_CCOEFF_NORMED)
+    best_val, best_loc, second_val = _top_two_peaks(result, compiled.width, compiled.height)
+    report['mode_confidence'] = best_val
+    report['runner_up'] = second_val
     
-    return (None, max_val) if return_confidence else None
+    if abs(best_loc[0] - bgr_loc[0]) > 2 or abs(best_loc[1] - bgr_loc[1]) > 2:
+        report['ambiguous'] = True
+        report['reason'] = f'{mode} best match at {best_loc}, BGR at {bgr_loc}'
+    elif second_val >= min_confidence:
+        report['ambiguous'] = True
+        report['reason'] = f'{mode} runner-up {second_val:.2%} clears threshold'
+    elif best_val - second_val < margin:
+        report['ambiguous'] = True
+        report['reason'] = f'{mode} separation {best_val - second_val:.2%} below margin'
+    return report
 
 
 def set_debug_mode(enabled):
@@ -14,7 +14,8 @@ from pathlib import Path
 import keyboard
 from file_cleaner import clean_pet_files
 from pet_data import get_exp_for_level
-from ui_assets import get_pet_coord, get_ui_coord
+from image_search import invalidate_frame_cache
+from ui_assets import get_pet_coord, get_ui_coord, pet_window_open
 
 # Disable PyAutoGUI fail-safe
 pyautogui.FAILSAFE = False
@@ -138,6 +139,7 @@ def click_at_window_position(window, rel_x, rel_y):
     pyautogui.moveTo(screen_x, screen_y, duration=0.1)
     time.sleep(0.1)
     pyautogui.click(screen_x, screen_y)
+    invalidate_frame_cache(window)
     time.sleep(CLICK_DELAY)
     return True
 
@@ -194,6 +196,7 @@ def upgrade_pet_levels(window, pet_index, current_level, objective_level):
         pyautogui.moveTo(screen_x, screen_y, duration=0.1)
         time.sleep(0.1)
         pyautogui.click(screen_x, screen_y)
+        invalidate_frame_cache(window)
         time.sleep(UPGRADE_CLICK_DELAY)
     
     # Close pet
@@ -421,18 +424,19 @@ def analyze_pets(tracked_accounts, accounts_info, objective_level=None,
             }
             continue
         
-        # Click on Pet tab
+        # Click on Pet tab (it toggles, so not when the pet window is already open)
         if gui_callback:
             gui_callback.update_account_status(pid, status="Opening Pet tab")
-        pet_tab_coords = get_ui_coord(window, "PET_TAB")
-        if not pet_tab_coords or not click_at_window_position(window, *pet_tab_coords):
-            results[pid] = {
-                'name': account_name,
-                'pets': [],
-                'status': 'Stopped by user',
-                'error': True
-            }
-            break
+        if not pet_window_open(window):
+            pet_tab_coords = get_ui_coord(window, "PET_TAB")
+            if not pet_tab_coords or not click_at_window_position(window, *pet_tab_coords):
+                results[pid] = {
+                    'name': account_name,
+                    'pets': [],
+                    'status': 'Stopped by user',
+                    'error': True
+                }
+                break
         
         # Get ignored pet indices for this account
         account_ignored = ignored_pets.get(account_name, [])
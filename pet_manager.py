@@ -14,7 +14,8 @@ import keyboard
 import threading
 from file_cleaner import clean_pet_files
 from pet_data import get_exp_for_level
-from ui_assets import get_pet_coord, get_ui_coord
+from image_search import invalidate_frame_cache
+from ui_assets import get_pet_coord, get_ui_coord, pet_window_open
 
 # Disable PyAutoGUI fail-safe
 pyautogui.FAILSAFE = False
@@ -110,6 +111,7 @@ def click_at_window_position(window, rel_x, rel_y, delay=None, button='left'):
     pyautogui.moveTo(screen_x, screen_y, duration=0.1)
     time.sleep(0.1)
     pyautogui.click(screen_x, screen_y, button=button)
+    invalidate_frame_cache(window)
     time.sleep(delay if delay else CLICK_DELAY)
     return True
 
@@ -175,10 +177,11 @@ def set_carry_for_pet(window, pet_index):
     Returns:
         bool: Success status
     """
-    # Open pet tab
-    pet_tab_coords = get_ui_coord(window, "PET_TAB")
-    if not pet_tab_coords or not click_at_window_position(window, *pet_tab_coords):
-        return False
+    # Open pet tab (it toggles, so not when the pet window is already open)
+    if not pet_window_open(window):
+        pet_tab_coords = get_ui_coord(window, "PET_TAB")
+        if not pet_tab_coords or not click_at_window_position(window, *pet_tab_coords):
+            return False
     
     # Click on pet
     pet_coords = get_pet_coord(window, pet_index)
@@ -0,0 +1,89 @@
+"""
+UI Asset Sources
+Base64 PNG sources of every UI template. ui_assets matches against the prebuilt
+binary pack (see asset_pack.py) and only imports this module when the pack is
+missing or out of date, or when a B64_* constant is accessed directly.
+"""
+
+# =============================================================================
+# B64 IMAGE CONSTANTS
+# =============================================================================
+
+# Pet slots (8 pets in the pet window)
+B64_PET_1 = "iVBORw0KGgoAAAANSUhEUgAAAAcAAAALCAYAAACzkJeoAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAC9SURBVChTXY9BDoIwEEXHhYalUNpCdW8IMRSoutCoZ/AkHEAu4FU8gUfyDJp8x4o1cfEzi/f/zB9yqxbnvgfRBLnJYWYmiNzaBai0gs50MNGiLDwUDK9RhAcRFBski6rG4tJ1uNMIN4ZPhn4tp8m2NXpO7miMg0w/0BjoPAMVyzLc3MZTD4WSiNlIVW0DPA5JwTNOBbfdrAP8rk14vkWN+/25F4mHkl/ybW1TezjnQqfhpuWU5buhEEf/RHgBRO97+iaKyk8AAAAASUVORK5CYII="  # Pet 1 slot
+B64_PET_2 = "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAKCAYAAAB4zEQNAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAADLSURBVChTLU87CsJAFNyQDySRbPYfQew8hY1nsBCv4gU8gwhewDNY24kIgp3XEKtxdmMxPPbNm8+KrpeQWkM7BxtCghvGKbS1MN6PxHQY5/8tIrFRCs+iwDfL8OBc0sl6ko4Xp6bBuu8xo/WxrnEtSyg6Cj8MiAfJilhR9aGDtAYiLgwVMTteb7sO7zxPBYUyGpKZEZ6qOzN37YQCDyG1Qk9oEueqwoV51jr+gIWUMcnywCI3quaGX6MqtY15+7bFi8SCCsdlJFwI+AHAUmA4CuKu7gAAAABJRU5ErkJggg=="  # Pet 2 slot
+B64_PET_3 = "iVBORw0KGgoAAAANSUhEUgAAAAYAAAANCAYAAACKCx+LAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAADCSURBVChTbU47CsJQEHyRBEJ+5ftbiBjxEmIlFt7N0kawsFEPIJ5DbL2DCFYi40SjSWEx7O7MzuwK2/X4h0bwHoZoBA6LosC108FDCJyiCHMpP8JESQytQd85LPMclzCEMN4xgiCpWWfcvtFNR006ix5dmzTFOstqgTjGMcAb1a2xUq0oYkDXittnPiA0Y75C1U954x4ElWBRWgtHcmQM9kmCA2PfwpbDs87fsS+1hpD8RNGhWH89l4WkvU1UCdpZvAAboXHie0kmugAAAABJRU5ErkJggg=="  # Pet 3 slot
+B64_PET_4 = "iVBORw0KGgoAAAANSUhEUgAAAAUAAAAJCAYAAAD6reaeAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAACYSURBVBhXY1BQUfivqKrwXwmIldUUwZhBRkHmv6yi7H8lIP2AleX/HwaG/wxS8tL/QbhRiP//VTZWiKCkvNR/LVnJ/y+Ymf/HiAvDVEr9n83L/X8iP+9/JykxiKC1tPj/JyzM/1XlpICC4hDBbVyc/0tEBP9LAy2CC/4HEu+ZmP6/A+KPQAziMxgBtRvLSIBxuIQIUCXDfwAF20kNbSTFwQAAAABJRU5ErkJggg=="  # Pet 4 slot
+B64_PET_5 = "iVBORw0KGgoAAAANSUhEUgAAAAcAAAALCAYAAACzkJeoAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAC3SURBVChTVZA9DoJQEIQXEgwxSEVB5D08Ayo/8hcsPQmHQOIhrOz1Gt7Ck9CajAsIeRTTzLe7s7uUZAWubQuiFYTvQ8hechCFaa7A3ai+gAspylQ4mjNM8wL3ugbThR62DcrKaoBfNuQ08p9LeXVeQKkulHDmBCdzkBCgfRguMjtdx9s0UbouKDge5m094SFg87Ve42MYfEoSK1Bg63m4OA46TeMnxBFuTYMNQ18KnLizH/u0LPwA/0l+iZL5GyQAAAAASUVORK5CYII="  # Pet 5 slot
+B64_PET_6 = "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAJCAYAAAAVb42gAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAB+SURBVBhXY5CSkfsvLSMLxwzSsnL/3cUl/u/g5Pz/jonpP4OPmPj/hyws/zOFhP9rS0n/ZzjGzv4/VFTsvwxMyx8Ghv+bOLnAyn8yMv5n+A8UKBAQ/K8uKQXRAhKQl5RG2PIXKOAMNFhKGiqwh4Pj/04Ozv8aElL/9SQk/wMAoec4ViJHMJcAAAAASUVORK5CYII="  # Pet 6 slot
+B64_PET_7 = "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAJCAYAAAD+WDajAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAACnSURBVChTbY4tEsIwEIUzbVGkZUiTJt3dojgUVwCBw8H9OAICg2Cw3OCxybQO8dT3/gyJgFUkjEQJQxrggkMfehhiBoz5KzMyoYhGxBThY8DVrnFfNZrUOlKYZkjB41NVOLR2hmVvLHsXa/GoazjvMpRSmyFp8qXgpKntApfkedPhXVeIWu28vuUpQ4Go4dk0uHUtgjaEOMDIbkLWUZ1fPbKf3ycm/ADF2FtMblgRjgAAAABJRU5ErkJggg=="  # Pet 7 slot
+B64_PET_8 = "iVBORw0KGgoAAAANSUhEUgAAAAYAAAALCAYAAABcUvyWAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAADoSURBVChTZY67SgNRFEXPTDLJmIcG0RhGh7nzEkRFxMLCwl8QbNLrH9hYCPoZVn6CjZ0gNnamshBsBDtBOwkqCss92AgWGy6Xs9falmQJLnd/kuKKFNtdiLgNQz48j3dlpPdOPI+9+T4Hgz4rZcqGGqfTPZ6CAMOMLeHKxYxC2YsGvNRq2EW3w3O9zkl/hmPlVZ+Hc7PYWuF4aDb4Fr9qX7dbLFXym9YEl502m3nCMI54bAScT3Z/HasSV/y8zBhq5dj3sE8hjsReVn1dq856U9yFTWxfK+7l+NLBWNOv5Nh2MVbV/yfjB6YFbZSH/g5hAAAAAElFTkSuQmCC"  # Pet 8 slot
+
+B64_PETS = [B64_PET_1, B64_PET_2, B64_PET_3, B64_PET_4, B64_PET_5, B64_PET_6, B64_PET_7, B64_PET_8]
+
+# UI Buttons
+B64_PET_TAB = "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAMCAYAAABSgIzaAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAHcSURBVChTTZJNaxNhFIUHRJf+AUHowoUK7qQ/oNRNXfoDXCi6cqMIbnRTEFcuCsVITR1S0mqotbE0ZTJIkgqpiY0xceJHGk3EJMaPIqjQYs3juZ2KDRwuvO99zj3vnTjs+nmXzjM6dJxe9jF01qH5AepNmF2A29NsjcVZv+HSvhbhP9jpUrx3F2f/PtzL5+DLZ1irQ60MM9OQllljDTLLbFyfErjZ34a+JRPUKk85dPgAsQunofdJjQLrb6AloK3pXelJFqIPBYqj/ZHxM6cYPHqQgb17CKKRbTNeBfBaar4LDd7L4EUHiumdqD82uXhiEMdxuHLsCL8DNbf0tkoJAkWtvZR0ZmoUZDon8Ksife9TmriJOzJMJzEnSJGCqtwFmirPVQWX39LvXmXr50mBvybDBbS1xVYrjFO1RoNWd8HqKevNjZjAEZxe4SzkU5DK60KNFs3qsxXY0AJy2mZBd0Xpn4G3qokrY/AgA0t+eFFTxJIge9efHdBLQ3JRfUmYV03MC8yq+ZEHi0vhJNukRa3q3KZ7ShPTd4xKd+JhnbHl5LUlT64GZ3LhVAPLOi8u61xTJqf0z4nBhGRg3MCUIF8f1VdcqznBJl/RfZnNassRAbekcVcGmure5y89lz3QdhqrtAAAAABJRU5ErkJggg=="           # Pet tab in skill bar
+B64_CARRY = "iVBORw0KGgoAAAANSUhEUgAAADIAAAAQCAYAAABUWyyMAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAALOSURBVEhL3dN7SFNRHAfw+0fhK23R1KYrdS21TCeab6elCYoPjDJppilSoYiClUpgZE7LBHuYZaBFoiARVPTQoH9Vgh5LVliKuaFZzncwt6n7du+BjWWXbf2leeED53e+v7tztrND7YzLwXpAuQcnYT2gXP1iYCqroBwy+QC0Wh1m53+h/dGzP/K1inL2CYdB1ukzmJ6dQ3ZhGdz9xfCNSISEnjPtWasozg4/GMg/f0Fx2QVjvVL2qRIMfB2CVqfDHH1a9zsewlkgIllEQjpGx8ZxNLcAytExTE3PIDOv0GL29kM/6q7fNq7BFQRgemYWGScKjHPWoDbY2IHhynMH82xz45OaTWR0DEIjIuHgxIFA6A2Z7CNy8/JJJgoKhkajQW9fHzwFQpwrr4Bc/sliVlRcgsHBQeMaScmpUE1OwtbB0ThnDfqL2NMDe/gFBEKv15OxtWpqr6CqWkrGoqB95H0PLyGpffb442VXt8XMhf4BtVotwqPEpG5pvYc7zXfJ+F9QG+0cwfAU+pITceFtJzWbSPF+9PT2Qa1Wk17muSStJVlgcBiWlpb+esdSxnj85CluNDbBdhMHEyoVYuMSWPvMoWwct8JgfPwHcvJOGuuVFEolXnS9gitfQOrq2jqCGQeFRZPNmvYbmMsYhzOzyNqJqYcwolDA1onL2mcO5cDlw6Cisgo/J1RIy5Bgi5sX+Lv2IvXIMWM+T1/wBx2dJGN6hkcUqLnaQLIQcTzZrKHXlLmMweF5knvxXtaP+muNrD2WUJv5u2GqrFKKoeER6BYX6Q+fQmtbpzErLD1PH/0UFuiL+7z7NepvNuNywy2Shcenkc0aek2ZywzutLSRv2rYgRTW3BKK6x2KtaCptR09b96xZtageKKDWE0+0enIL70I9YIGyceLWHusQfFDUrCalpf1+Kb8jvyzUtbcWpRHVAbWA8orVoL/nwS/AZh2Viog6QgsAAAAAElFTkSuQmCC"             # "Carry" button in pet window
+B64_DETAILS = "iVBORw0KGgoAAAANSUhEUgAAAC0AAAATCAYAAAAEaoRHAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAMASURBVEhL1ZVbSFRRFIb3QyEqpuKNyclbNqmTaY4z493UpJTJJJJg8BZGUJSKFYgRYV4qBUmTiF60B8mkeohCCxETtIgIM5GQiDTKvNaMlxwd+Tt7N2c6x0bxwZez4eOs/f9r7b3OZc+QvMZeSA0SkV8DqUGCdOcgNcjO5FxIDeKtSsNmEpKUZVPfCOr0XMz8MqCkvM6qRablgB/mlRWmES9lAiiJmXkWC/i9uIh3A0PIL7zEvI0Sq8vG0tKSTW8jKOOPYGBo2Oa+tD/aNI2Jx+4oUOJ1epjNKyz225eEgqIyzM7N4/jJYqZtBOEam41wbeLiowQlOjWTifycUlnbgK6ePhbLgzVoffQEc9yNTM/8xK27TXDzD7XmrjV4P+dUET4Of4KJexMG4yyaWtrgERDGvBBtsiWb+wRW9cAj7I9ssbMHJSxCxYlmFvMkpaRicmqKxfdbH6CpuRmu7p5QabT4MT6OkgsXRfm21uCJiUuAJjoGjttcEBCoQH//e+SfKBDlrFcv9LimHbjAgRMjLeLfOSVCrYXJZGKNUs9LJrd6N+sb0P2yR5Rva421qKq+jvKKSpG2Xr3QI1vtnUAJV2mZyM8pB9MP4/vYGPaEqywvTzw+DA6K8m2twRMTvx+9fa+wsLBgqQauVlaLctarF3rEzskNlAhtHBP5OaW+8TbaHj6Gt7+CbeIu8xX5qwlXx2CFO+H2zh7/eSOjo3jW/hxe8gA2r6i+wRDm2OrBlkcc3eWgqONTmEhj70AlzpdehsFgZDrVXr95i3strfALCoeTpw92hUZihyKUeTyygGDuJ28ZBacL4SLzg2Kv2uoZucNH6123+yMjS4/PX0ZQVVMnqhf2sBqhR5zlwaBEpWSwp0mHwWhER2c3EtOOMY+i5E54+4suzM8vYHnZjNGv33DoaLbV5ykuvYKx8Qn2xOmV18+UlGFicpr9Bzzt6ERtwx1cq2tknr7grGXnf4P2sJZH3BUaSA0iCzsAqUHkah2kBvGNzYLUIP6JekgLPf4AvWJoeO1svHUAAAAASUVORK5CYII="           # "Details" button in pet window
+B64_UPGRADE = "iVBORw0KGgoAAAANSUhEUgAAACUAAAAQCAYAAACRKbYdAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAOTSURBVEhLzZRrTJNnFMffD/NCELthQcFSa+uFirXSFgvrBWkF1FYsqAhNtEPdFA2GLdtIXLZkC5uXqFEHIxFR4xU/GY0I6qYmRKoGjVcmCQGhdiRCsSpYmC3/9Tlm7xboNz7Ak/ySc/I/z3n/z3mevNzxGy0YS5Scug/OUXYLY4mC8gZwqs/2YKzBTU0wYrRJtTngDwT4nIuam4zRxmC1w+8PUCycswjcx+IEjDYp6TYyxWKBKB7cC7cbmwu3oqu7G62trViQqMJHE8IIc3ommpqaMDg4iP+vieERUKrU6HC5kGXLxvP2dnR7PFiZncPvXbM2j/YODAzA632NyiNVCJs0mddjRWJcqrmM/v5+0v1+P69xLLl46TKmiqSoOnYCNbVXMCFiCiYLY+Dp6UFhUTEEUbE4VF6BV14vaQyVVh9sOADn7TuQxitQsuN7PHnaxOv6tAykGEzUZ5ZciQcPH6Pg80JeZ9+prDqOT6JFsNpWk6nx4QKMC4sAF2APTBKPcKEImVmr4fH0UKzUGmkqgmkSyvXmZfAFT8ViRpLBTBOcrdBQrkjSo+7aH7w+lF37DuLn3fsojpHKaa8sQUW5RmciUxMF0RDGiD9Mit2jQCSHLsOG/uC4WRw5Yz6e/tmM7d/+gGipEhVVJ1HfcIc0RrI5ixr9mw/FZM2F8+49+Hw+OhxbO/eXkZa02EKmPtTGI9lkoV7hwjgs1BqYqQC9eEb+F1+i3eWmOGquFtfrnWhuacPf79/jduMDqM3ZfK3Bkh9s9N/eoXS4O3Hlej1kGjPle36tJFi8wGglk5LExZTnbiiiXsygRK5i1zcIdWY+5hlz4Gx8hLKj1YhRLkGyZR2eu/6CVGuhfChpqzbRvyWUxnjT24ez52sh1ixF3pYS6rW34gSvuztfoqT0AD5d4cCTZy1kasosNRnjmOO3fe/Q986H6gtXIdPlQJRkRdyiFbjR0EgnYouNu/1FJwp37CbdnLeNTLE4FF/9dABdPV56DnU3nTh09Bz2Hz7D647iH+F59RqtHW7Yt31HvaLlOkTOVAavL5jM0K0Zxrz09egNmtXaNlMuM+bhm19+g/dN77DakSJOCQ5CY8E0RRpNi0zNTLUPQ5dbRBOyF5dizpL1UCzfiMrqGjxubgtZPxIk+rWI065EbGIG/dXJlMzkCElp+Wm4OrtotOyKf791H6n2r0PWjgRp2jqa2HT1MkRKF+Ifc6sBCJVygj8AAAAASUVORK5CYII="           # "Upgrade" button in pet details
+B64_CLOSE_PET = "iVBORw0KGgoAAAANSUhEUgAAAAoAAAAQCAYAAAAvf+5AAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAADvSURBVChTfZHdbsMgDEZ5nUmTpihNiMFAaNO/vf+zREpuvtrZGiUt28URwj76wGDaYGEF6gmdQNnDnRg2dWii1LMDy96M44gvqtBKQ7GJUHODQ2hWSZ1FVCpXo1NZUjRZBf8rLeI0TXjyUX+i8gf4ISCcw1pXzDzP2NIdPcIl7mrKm/gXpstUbGzREwzJUXqnkqCES1owTqT/RB4YLIMZfdySsGURS40Sb6KV4fTer/WdSCePVkR7lH9/kVfRnxnhGhFvPVhWviY4GWQnRmmkW0K69yvxnsHyfk/ZkCTRIN8mYv+df1BZkjU9SDINjAfNvNStW2DtFQAAAABJRU5ErkJggg=="         # Close pet window button (X)
+B64_SAVE = "iVBORw0KGgoAAAANSUhEUgAAACYAAAAOCAYAAABDwm71AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAANGSURBVEhLzZRrSJNRGMffD2XpnLNtzm2uzVs2teG16WZeunhDISu1tCI1CiLCisI+FZQZmYiRGSnlJUYWmiVhYJElVuQHswtdzCjUcmst79dc/3ZO7cVFn9MDP3if5/+cw4+zvS+zo/QR5hvZ5x+DCc4qxHyEcfWPghVt0jY03WvF4NAwzGYzDEYT9ubls/n/hHFZHg6CmyoS+q9GHDleBM+QtRD7aREYsx5BFqwz/wuhjxqMs9wfhOCoRJDlrtLQ+l9s352Lt13dmJqextDwCCp11+HiGUCz3Lxj6PvcjyWKFez8hUtXcKupmT7LfNWorW/E6OgYTN8HcK68EgIPFTs7G55MCWbBInsQ7Ow56Oh4hpcvXyF9SwYcuDzan412VRTUGi04Ts7w9PZBZ+dzZGXvpJnQVYyJiQlExayhNTnvS38/NmxKpfXV2muorKrCEqEIIeow6A0GHDx0mD37b5hFXD5+I4BALMeJgtPQ6w0wmUwoOF0EnouUZv+C5GTeWtfduImyixX0OT45BUbjNzjyxRBKFJiZmYFEsYydPVtahoetbWxt9bDj8LDQngvGgS+BA18KjlDG4uSqQGpmFrred6Oh8Tbbj45LxpOn7Ri33Ix1nSwsZnOyR2/4Cq5Ijss1OpSVX6L9IE3Mn2nb9er1G3YvcSAui3kiKshwxV5wkvrQ35Un87UhLiUTY2PjbN3T+xl37rZA7qem9aniUoo1F7ivgPGbCRu37sL3gUFEJ6bSvldABBVxU4ays7YoqQNx4QiXUkGG7xkIgXcIvELXIiE9Bx7BqyFShsNXm4Dq2ga0tD2lbwlheGQUurpGSP0jkJazD596+lB4roLNCeXVtXj9rhtvuj7Y9Ns7XtC9Sk08PV8VmQQfdSybEwfiQiQdRe5gRL4REKtWQ524Fd0fezBquSGz+Sf0lm+Yrr4J/tGbIAlYR9l/9AyMpgFMTk7hzv02lFToUHShhs0J8Rl76O3kl1TY9EPjM9H84AnGxifww/J/6/2iR0r2ATYnDsSFCNK3UhIYC7eQRMhWJs8pxIG4EDm+RwAYWWgS5JqNUESkzSnEgbiQmyO3xiwNWw/3VZvhEZ05pxAH4iINirN8/cPxC5FpDeoFNp7PAAAAAElFTkSuQmCC"          # "Save" button in pet details
+
+# =============================================================================
+# AUTO MERGE IMAGES - Placeholders for user to fill
+# =============================================================================
+
+# Portal and Navigation
+B64_PORTAL_ATHENS = "iVBORw0KGgoAAAANSUhEUgAAABYAAAAUCAYAAACJfM0wAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAXwSURBVDhPJZR5VJTXGYevEaKxVA1BQ6V6DCBKUnOMrbFKAQFLAhiEyKZSZB2GmWFRGWVgIiOkYRER2cQwgiJaEBC0SlPtSZSIUYOVQlAobaoUWQQkQ4VpSPDp5/SP97z3/e7z+939Exr1DpYt24wqxoH++2EcSV+FfrcN94/bQK8NxbvWc0JqlkW7Akthwp6T+204rLHjcfcuEmJXmfQpyTtRygPZ4ivn0jlPxMNHIbzxxhqeP1dKwlRkcWtwfscKvcqKu4WWbHCwxNFSzgZHSwY+s+JyoRXOq62Ikq2WNKnMzChZYf8O/+gN4kHPdm60+tLZHowYmUkiq9CLh8/iGCWJ+xPxZBc40nHMgupMC8Y759PXbcHTdgtOp1vQfvSnZOetlLgEiU8w6bKLvBn6XsXgZAIDo3LCotwQraMqbgzLaB2No3Vcxd9+VOL63g50AVbwbK60ihfx6v/zd3PJCHwVF89Q2n9UmPgbI0q+HIrly2EV1/qVfDGooKbDD3FuREHTmJK64TianirQ94YSkhiO46/DWWBuTq5CingpksyxlGqHX73oj6RcWvYLvu6JgsZRJbXDCmqHFJztiyZG64/IuCfn2KiCyv+q0E8oqJhK4AKJhJ3yxN5yCRMtZjCzkP88NMPBxpadJzxokvorjQkmvtIYz7ExBbo2ORWTcgIynHHz2IlIaY8nuCKGfIOCwu/3UkoyuvEgQqKkrBpE5v8LaRtmERX0Nrq4x+yI2IfuaRDHUJv4F7rtFdGk3I3nyHcqsvriyHkcjvj92G52nU/CvziC1D4lSfdCCYiRUbq3m5r8KaIDirh2epaUj1BzeEr63kNAVCyqu6FoJd6/JIKw+kQ+Ht3Ngb4ktL0qdP1JiLRHWj4aTCO2ZR9r9riyeusmyhSdXD40QX2eAU34ca6cnIUmsoz6XAMXcyc4Hv8Nb2/ZxJokF2QtarQDqaT+K43Ux+mkDWjxLw+UjLuLyTPW8X5ZAErvAj7SVOOe6UfunmZajoIuUm8y1kXpTfXhPZ/hcdAPreYUKu9CPEu2kTd1jrSuo7jv/RCfvB3Mt1uMkPVW43ZITrBzMncK4XaeZJatx6l2Iyf2PaBA3mgyLlA0UpHcjVPNRtKzy03cCz7EWY1btoyY7iqituVQGt6CdvsphJgjeP0lO0pir/J16Qxd5XBNO0VIcwBhFSrygxr4vEqQv72BcL100H/6kC/SnvHNp89pK31OqfxzfmZmhzAXhH6gpb2sj5oDHYh1r3sQuF7FRjsf7F9bS03KPUYkc7Uunci/+xLveZC2s4Ik7wwiu33Zm6FlSDKt03SwwuqXbLD1JuBdJeusPaRZziY3oo4/HmyTnvRZA09rjYzWTtOc3oPVnKXcypwif3+ldEt8CH4/mHvVghDvnaQ+8iEvpZy2j38wcY3aLob/YGSo2kB/1ROKYi5I5oKssCrEt5+OcOewgcFKI9Pnp9HH/Zm1C73ISsmhanobfp6buVsp8PPykmp/PtFks9bSS/rbXcJYZ+TRCQOtOSPcL+6jo7iLPR/ksPiVpdLhuWtMo6xf5s6Tk5MYG428NW8z3jGL+esPUWx12sJtyXjrb3xpm47EV2XNyrmuTJ6fZKjSwLvLfyvpZ/E750S+yr7NFd1VrH+yHLFozs+5qGlj0wof9m/JwXDFwCG/RiIy5/P1eBgu0oCGrwQutu9xZySMmKwFfOJTw9ilMVKk2TnZedKobsXq5SVc1v6FhvQG1i13RVxNv0lHRQf62PNstPVg4OIAV5K/JU69BEXqW8Q6C8bHBcpt85AlOyJXW3MpsZu+pj6cbDdTFHmamyU3uZBylXp1A5UpldgvehPRnNnM9YrrqDyTcVvpRc+FHu5k/RNhJgh0FfQ3S9El+PeD2QT5CsRswY2MHjrrO3Ff5U3kJiXNJc3UpdWZTAuji0xbK85knaFEpjcV59RN3Kq5RW3yRcTLr0gm5oiXZiMWLEJY2yLmzZdqM6oSa7ledZ0zuxtMutxdBZQfKJceUwEL51ji5ODC/wDWjE6LD6XIUAAAAABJRU5ErkJggg=="         # Portal to Athens image
+B64_SEARCH = "iVBORw0KGgoAAAANSUhEUgAAADAAAAAOCAYAAABpcp9aAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAYBSURBVEhLdVb5b1RlFJ3/QOhsnbYWuk732V6n09JZugAtbWlpKftSQ9RA5AcSgmsMmmiipNEQUVCJUTSKGgimxKIoSgKKSjCaoAREXFChLXuBYsv1nPvN1AnGSU7mvfe9795z77n3fs8W71opsc6VEu++R+o6lipqWhcqwq2LpLqlV6xZPYpQc7cEGrvEn+iUylib+BJzFdasXgkkurDeI8GmeWLNxPuKbn2Xa0T5jBYF93C/rsEe7RL0QX/0m+JAkBP5KU/wjXf1KRrmrxLb3YG45PhjMi2YkOyqGYrMshrJqqgTV1lYHEUBcRQGDXCdUVAlU6aXS0a+D9cG7tJqcRaHxFkU0nsH/hWFAbEX+vE8KHa8fxf2ERl4xv1qB/bUR8oP/umX/smDICfyI0/yza9uVuRZTWLL9kUlB3CVVINIWJFViSDKIzAGxyDh8oYMQNJe4NfnvHaVWJPgMwZgLyBpgyn5lXgeUltOr4UgDVwlYQ3YDrKEBg/QRv2cXhkfn9A95EGoP/DL8cUk21cvucEGRbY/KrbBTw/KpctXZGJiQs4NDcvqDY9PRu4sTmY2zQH/Xd5qcRTjGkYJB4LjGoPnv8NrMBXBkLinDNlERt1ltQZ4z642GVC6/YBE2xaYAErJIaygTSZEfSNZmRW1Cg+Csz36VL8UWAlIVitW8zypRt2SvKcc0CAMuRRS2SUcXEuC95kwaJyETZaBzDKTfTrzgDyRmVRagylHYPBFkFxKAaqZsu1EwjyVEcmpqldFPCQPMHm2IqsBctVKFuvfV6fwVEC+qjopCjfKzt0Dcm10VEYuXpIt23doKWk2YLRv7Qb58dRpGbt1Sy5fuSqv79wluYGEkm2Yt1zO/nlOlq9ZL7+d/UMuYP+KB9ZjzWQuP9SI93er+mNjt2TgowPIakSi7UaB1Q9ulOELF2UEWAEb5KdlCP9ZKHmClWA7fuKk3LvuETQEairZxJoRSLhrYJ+89f4eyQtEpaFzsZwfGpHHnu5XI1Rj9oI+ae5eLtkoj/DMTvn++AlZ+/ATWi6JrmVK7Otj34kvNkc2btosP5z8STPogrLvIDFffHNMamb3SmG4STqW3ackG3pWCH8HDn0pJZhYT/ZvkVM//4KkIrEMHolloER2BXqg/8XtIDasGXp+62vITEJcIJ9nxTUTxVDBgzIgtr3+thz66qiRNk1iNhxV7N/yqmx64WWtz0TXUrl9+7ZUxuegHyypmdUt+w8eBok69fH3+LjUdyw00640onAjsMbuZdqPRQiKPBqhJBVmSTrYb8BkCcGuzQ1irPml96+Tk6fPyAeD+9VhZHaPZuLOHxXj2KQCLVDgyNFv5caNm8lVkWc3b9OAEl1LZBxE2AcOSE0y7nLUPVDb2qPBsT902nGKEfAbm7tYE2d6yJIogpy8R9MzAFcpJhnA5Nk4QXQRm1sXrpLR69e1ObyRmUpoOkaVqT3LNG6ymWmMtb0PUyw/GMNaUMkTbuyPdyxSxySlYPaSinlrmtW2P9EO33xOMrAPVaNthjDVYJ9F240dJi2lgrsEySAwBGx5oTiiCUtJpFneQFN9duiIlgcJsX7ZA1xzgURlfQsCM9eOIkuuXL0mb763R7LgbH7fGjnz6+8ooVcwwSLSkFTAEE8SBHkF7B9GKe5F4/JkzvHN0H7iaI4lM85BQsKxDqOIHUkjTwbGoIlMTDDbtdHrWnN/nR+SHe/u1prXOY2ZHGzqlMFPPldVWLPMePuSVaoAA1z70EYZGh6RmzfHZO/HB+S5l7bLM5u36nq0zYxD0yuQ3IvRisAJJ66r0NgfJm1z/66BQX0vpRxLOz0Ant48oXkueNBvRBYONds0TB9Kxej/LY+QZtGJQPhcT90kUqdnRno5Yb+RmGXAZ6kmN4T1tGYfYM0A91jjrHfCTvpJr4cbrtNPYj0gscae4aTK9ccVOTyJcwM4lnHz/99CIMRvlOR3irPYL244yGI2KCOQOvQ0y0refNvYi/xQip8ePPh8MnV6hQG+fzLyq/T6zm8hJ/5dZdX/+RbK1W+26B3fQk3yD9it8R/F7r4OAAAAAElFTkSuQmCC"                # Search button
+B64_PET_MANAGER = "iVBORw0KGgoAAAANSUhEUgAAAEYAAAAWCAYAAAB9oOpzAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAggSURBVFhHjZffb1RVEMf7D9ju3b272xb6C6GgAStKTKDdFpHKg4oGJGpMQF+ECAZ48FfQqE+Iom+AT1YQTNRoouFnBZ5QMSSYYJAi0TYQSCm04Wf4zTjfmTPnnrvdGjf55t577plzznzOzJy7VTVRNdVENaxqymRrKBPdQ421EU1siGlyS1E0qSlP+UwNxTXVVJ25R/uyDfpHOShDUZyhbBwlymf5mlbE7ZA95/I5UVyIKS7GlC/yPHzFvan8WcT9Za0Qzy8qv/8v2XqxRpatC+01/L6afa3ynQUOO8n3xUKGWsZH1FSXpWZWS0OWCjG/ZyiZAAqUgpKP2FE4nKgSIJVCyRUYDDsLAAomUG1l/W8AocTG1gooySZ6KOxXNftXzdeqKKeNoixkUQBIgGAwNLJGQXHCBDlIgMDpAEwFOEm0aMTkIQPkABSgOqggytcCIsaDM+ok5jZI2G3JALc+kQDRtQoQWaMBcfbODlAsg6qSRSu51GSmcCKR9lEl5A1G7CLBy0HwkPx7TYtQYeQIGKe4yFAEjAlz8bwGydYcrlPWz+/KgAAQ2iRKuJ/CSKsqWZQ5oZDCUINs8rS43YNJoGgUQOG4OrZBqgTFpNGTpI45j2uuAPE4odxaE0CJ0Ib3YR95NwYQrbccMalc5nstbnAKE5p4YAeokgyQgAmg+MIZOA0gY4ERIHbPdjZ3OirUWcxrDquSvuHa7L2sU6BoNFWGwnLRpmAEDuew3PPCEKreQURBACmYNExBe4bT5tik1olyNRkkgQPl9WpgQmGu0Ek7OVIRC0DOcb8+rwSKB8M2Y6WOit95MBItBoUjhhdV6uwg+129epV27d5F90+9jyewdDDps9Up3AMmILS3z6SbN29ojbCx3fjieJl03pLMuWPnDjduRCdOnKDbt287MApjFBx+VxlOIos61EeBI4AqQDIwYYEzMB2lDlkMBsSu9/b20q5dO5O0sCvL1w8fYRodnV0lGSMcW8dP4JSro9ROd+7codOnT9O4hnpqL82ioaEhGSeJGsAI79MaBcnXId1A2CEdxwTjooZTKZaFFzlq1AHdOSzG0ump+U/SlStXvJMtE1vom2+/lrbhkWHasHEDFeuK4hycH+vno8bkIGnERQIC8/7w4w/0wovP09p1a2nLl1v8JmHXF7+0mPr6+ujGjRt08eJF+mJzjxzpiJ5ZHTPp5MmTtGr1KhoeHqbzw+dpCfdXQDla8vKSlG3PFz0yvwKqoSeeeoKO9R2ju3fv8ncMpwCcFzjue6FztoLRXY7pSQZz9uxZD+b777+jbV9to5Z7m2n2nNmyq2veWSN9kTbo0zm7U8fge4sWUdmz1qk0mFeWvUKbt2ymw78fpkXPPatg3K53z5tLj859lOrqa+mBB6fRkT+O0LJXl3ow6Lt3315Z2/sfvEd///O3i6IsPT6vm+Z0s+24Om+7dNlSSR34PjIyQitXrZRNrtI6oalgcEKnptw/hXp/6qVNn22SFGqe0CzvWie3Cm3Ybdy0kQ78fIAd1egrcPRVBIN7icyC2GHe5Nsm68E0TWikM2fO0C+//kKlLpfWQTqERfnjTz6mDzmyDAxSsamlUdIFtogOPcm0f5hm68X2Q7Gd8cgMiWr4iP5BjdFoUae0COJ34cIF+rznc6rnnAeImVxUK/2O/nlUnJdxWF0ODO4NiEGRGsXKQQDk1NHZLjY4FXdyTXvr7TdT9Q5OzZ33GB387SBdu3bNzUziHJyZ6SJGijLLIgjvoMe62fZg2nbdR+tkbGwqfFi5eiXVcjRWYYG2m+ZEKZVKaSGC8EPk2KmEq9UXcx67hd3DJHgOgcQ8RyLXxiq5gg0w9Q11UjtQkNFmKYcasnvPbmrmVMG3E6AIGD5tDIyBMDAGytvy2lFCAAXClzjWv3//Pjr+13E+TW/yXwLukHYsBINj3I5yu+bp0KFDUmMACc/T2qZS65RWcR75CU2aPEkmWL5iOY1vHMc5/cAoMHl2HPMZIAMTplm7AwNHoEuXLtHWrVsZWpEWLFxA/f39CRiO5hBMOoIitd22lYq8WQsWLaT+AbZlMBH/oX3o4YdoYGCAGpobeE0xii9yL4GD06LU5eqDB8Nip03TH57O5PfIN86tW7fo1KlTNP+Z+QKkFuKJodffeJ0Gzw5K5AwODsrYIg8jVGUwswxMjsGwlr+2gobODdH169dp+/btXCfWOzDRKDA+YthHaIXYnlPbHTto/aefeDD4lkLRtp+cSgZGBDh8jCZRkoYSylLEosSrXuEoCKRQIO4PwT4FRvrqx14CJieLlmhhKBkoC/G3SOSEexNHRSj7q6LfLhDb8lgZGVPHV8XU2NJEly9fpqlt02Qd7lQCDBMv0INxco6Uy8AUasvAsDQyQgh2z+9Yvo375UIBjPxVcHCcEyIPh50sVwBCIDgYFi2JNCVDMJizbXqbRMrTC56h+vH1wX+lQAYmcTwBUR5FgBL2050PhDaWgQAYuZcISvrleM5EDo6TOJCC45yH4/ws8g6Hgk2ldpaDomBUa95dIwUa6cfHdeLU/5EBMShyz46pXAF3znpxn1ACBgrhpMCEQvQAjqqSs4DmnQwcNqlN2k6/h5yNAyNyB4QDw7uOFOCrlz3z1aDo34ZECRA4pgPqN0sgc1wgOLFtAiVohwqB+FngcD+FM9ppyOCloyzsP7ZtJQGQgnF1YRQY12ZQFFI6dTR6FIK1yV8La/dgQsFpu4YgUJvKxOOgr0VNKr28I9wWwLHoysaBwvbANlTEUaQRlaV/ASoOL0xQcqywAAAAAElFTkSuQmCC"           # Pet Manager button
+
+# Merge Interface
+B64_MERGE = "iVBORw0KGgoAAAANSUhEUgAAACYAAAANCAYAAADFVhxbAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAMUSURBVEhLzZRtSJNRFMefD8XKnNaa71On1dRqrDnnFs6pbUty6qZZmdD7GxJGHyqhVwoJ6kNFkVKpVCYFZX3q/Y1UlpJFUS6kyJZlrrQkSy2d/3ZPOMaa36S88IN7zv/cP4dzn/tw8SsPYizCBc3SYizCCSWJSM4sAFvXbj9AQIyaePXGhsFBhyv+13D+oljMNZjhcDjwob0DQTPiodabYP/cSY1Njpj1X+DG8SZCFq9wNjGISzWXkW3OwZ69+1BeUUk5pjOmCANRVV2Nnp4edHZ14dDhI+D5+JLGzr9ra6Ozb2020k05ua6zOkM6rFYrhoaG6GaG14RJ/BG9ufET+ZAr1dTEitXrUV55Bo8eP4HRlEc5Hn8qceFiDU6fPQdhSCQSk1Jgt3/CluIdpMWrNOjv/4mHDY2IjpWiePsuvGi2kuYnDEHXly8oLNoM/4BQHD1ehq/d3S7fkbw5Hl8AhVpLTQRGSJzX+RH1lgYok3WUmyQUIUgcS/twiZRixrGyk6itt9Ce1bJpzJAmUCxVanDj9l3ay1Ramo5/sJhijW4B+vr7ac/w9PYROJsvPQHORxDiNNaT6BcqwdWbd7B1ZwnUumzK+YvioEw1krnnan7ZQrp7rSeCyNlUt2nbbgRGy1BWUYU6S6NLH8mb8w0UO42znMYOTJ2uQJhUg6A4NZKNSynHXm2MOp2KxfJUij1xr/UkIEaFe3UP0fK6Fb8GBtDQ9BQKXY5L9/RmPQii5/x5lZqMxWQcLE1DiExPpC1ci0HnSx2Om5414/yV65Cm5SFMboDckI+Z2lyvte6ojcvwtq0d0SqjV53h7h0qmwdZqhmcIEoGbfYyMg5TLIBImUno8jdSbjhWZa3CrdpG/Ojtw4Dz2tra7chdV+y11p3wxCzctzTRVNhi36Lt/UcUbj/gqvnbuwMcGx2blCjBiIi5uYhMWjSqzDQsx/cfvVCZN1A8TZuPrftL0f3t+1+1DNYD64Vjf9lQ+XyEq0wQa5YgKqVgVElaXESTKthcAol+OaQZa3DqwlU8b2n1Ws96CFeZ8Bt58PzCF9QdagAAAABJRU5ErkJggg=="                 # Merge button in pet window
+B64_SLOT_A = "iVBORw0KGgoAAAANSUhEUgAAABgAAAAXCAYAAAARIY8tAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAALbSURBVEhLlZM9b9NQFIatVq3o0jgN/S5JbOfLdpImdmLHSUEIJAYIMIZ+ggR/AjGzMrCxsjAzIfEfGBCsbCyMFLFyOO9xbkiLm6TDo3vta7+Pz7nXWj6fJ5DL5S4E69lslud41hhh5M3RaOYtoWAWqWiVqGAV6X7/AWmPBgMCCAnDMJEoiigIhvNOd0Q36lHYiWTsRntkmQU6PDimk8PHdHRwwtfFywgCCtox3eifJAw7sazbI8MwaX//gI4Oj1lwLEJtwOEgz+UnhQMlQJiSYK7CMXa4EiVQ4DreA+5zUrBivIJeb4/vxeGgx1+OMeDnIClYBdkrkM3mSAvx4gSwrgTtdlvmoMd9v84yxV73LD3GNCzSmo0GNRtNpkGNBHDf8zza3d2ler0u9zzPJ/8cLb81ooOWMblrWdIcxyHBtv9nuFatVqliV6hSibFl3SHf92VU1Gt1wWt6LPJpc2OTNDx8EUr0jPeJNI3eLy9TuVwW7IpNDa6qVq3JHMFBqx0LuCOxYGM2wbuVFfqytEQ/5+fJKZVEgGAACRh9PYdDFAZt2t7amiZwyGV+LCzQUz4Vv+bm6AmfOLTJdV3ZEwUkXrPJB6ElBCKYoUUDbs8pf3mNRR+5RW+5GtmLckWCPWw64/uecCkBeJPJ0IdUiucOvdjepu9cjRKgCiXA149LZhZ8W1yk5zs7HGrTDe7/H97sh4YhAlWFatF5MlztRMFdy5LT85t7fzoEgterq3EVDI6xSIabjBMFHF7Tl1OTBa/W1ugTn547/OW3WXbLNLllV+nrlSUJVhLgOi7/LzWRYHR5Pa3rkwWfOfzl+nr8o3EIjuc9lqCqm4VComBclOH9m7oHOEkQjEvAeHj8t9dGgphhBQhIClbIzyYBseQyrGCTpwmAeiYpZBIzCwCqOAPuJTD+Tor/Hy2dTkuvxhcU0wKSQFZajzNF0O/3CUCU9MJ5Jol0DlV5QNd1+gsZ71VL6oTLwwAAAABJRU5ErkJggg=="                # Letter "A" slot in merge interface
+B64_SLOT_B = "iVBORw0KGgoAAAANSUhEUgAAABQAAAASCAYAAABb0P4QAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAF4SURBVDhPrZLLTsJAFIYHF4qBDSGsuSpBpVgovbdcZGkwmrjRN+CZ3OvWnYlrX8G49B3UuBDze07JhEJbJITFl56Z+XLm72nFZDIB02q1MBqNMBwOoRsGTMsO1lwz1tI6zimWShClcoWKMgzDXMCyZ7Jc244bXLbKYYTf68GwLLrBoqcNw5zVMhGn4L3+YADP84MzCTtnQcL5nrBth0QvwHVddDQdp+0O1LYGx5mfmXQp7zNaV4fv+wuww2fi6KSJbSIax00kMa4dAEIE/KRSeE3v45ZmHudKKKFCneO5qB1iSo24Vkm+KxTwvrsX8cKIer2OJM7pN5hSOrm+KhbxtbOz4CwjDPp/krhRFPxSQq77moZHSviUz0e8MP8mlDNkPijdJaWMcyWi0WggiXGlErwy1zrJD7kc3tLpiBdm7YbMNSX+phGEnWXWbtilhPeU8CWTiXhh1p7hJ83vOZuFV63GupKVX3kTVibcBKF2utgmQlE1bA8Nf+VGPBolWAOtAAAAAElFTkSuQmCC"                # Letter "B" slot in merge interface
+B64_MERGING_PETS = "iVBORw0KGgoAAAANSUhEUgAAAE0AAAARCAYAAACYRSE8AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAPkSURBVFhH7ZdrTBRXFMfnQy3yFoHFlVVEKo+CQGF5+GjTioYaKahotE20TcBYS2OMta1GEx9fTVC0xg8+KlVbG2tTabGKGqtYtNXEplKohqzgYlNTEBEIb/7OOWHGmfFmd1aD2oSb/JJz7jn3zz3n3jsbpLD4NzCMZ0ihMZkYxjOkUePjMYxnSC95eWMYz5Cb5iMbz5/IqGg0NTejYNlyYfxFgpuWlGIHjR+Ol6mBGzduoq+vT5c8lIy1ReDatT+Qv3CRMP4ioTatv78fzsZG+AWORuJrqfj37t1n2rT/E2rTqEHfHfseuXPnY+PmLdi7b7+uaUEhFhw8/DXa2tr4GRVvK4GXjz/HaP1tp5PX1jc0cDxvXr66NmtWNmpqajEwMMA3WhkjfQMwYeKkQQ+PHRLpkt6HH33Mmv81NWHhondN6Wp1jJBu4507WL6iiDUdDgdfFCXuqlZC17Ql73+APXv34cqVq5g95x1dEd8c+RZfHihlwdT0TL6Jq9d8xjFa39XVhapLl7gJn36+FtXVf3HMNyAIzc33eIN0i0t27ERLy31VV0HZg2juVMVpWKzhWLd+A+rq6jhmVleEonu87EeEhFn5gvxUfkKNu6qV0DWNkugELlRW6oqgebLDrDZ14faSHfjl/AW2KZdOOyLyFfZjXp2MEz+fZDsuIUl3+ulTpqGzs5NtLdq/p52jz0awZQz7VEB3dzfbZnVFKLpUF/kzZmbzjSLbXa2ErmlkU/dXrlqtm4tPTOYNGsf169UcFxWsQNea8uhG0O3Y+cUu3QYURBrGOa1vVleEUTclLYNfCtnuaiWkEd5+SE5NZ5ER3v7wDwrFSL9R8lyGOjd2XCQvHG2xsm9Em2vkZZ8AnDp9BrW1f6OnpwcXf61CtHwTjXkiDeOc1jerK8KomzdvAW7dqmfbXa2E5OUfjJSM6SxCtoJx7vJvv+PAV4dgmxgD78BQRMYkwBoxSZirJXZyChzyhoIsNmFcwcwetL5ZXRGkQ88zKi6Ra6i8WIWtxfLHfjDuqlZC8g2xIe31LN4M2QrGudjkDJSfrEB7Rwd6e3vRcNuJWTnzhbla/ELHoeLsOT49GvTtc9Q3YGnhCo4vXlowGHk0WlsfcMyoq/Xd6bqCdGjQryPVU3r4CILDo9S4q1oJKdAWh6EkPNYub64dsfY32Q+ekICiT9aj5X7rY7me8DS6mVm53HxRzAySNWkmhhJ79nt8qgsK12C8/W1ET83F7tKj+LPmpjDfLE+j+1Z+Ifrk5ymKmUGypeVgqNlUvAfOf+T/MOSNtrV3oOL8ZUzJKxDmesKT6mYtLuI1oph7cvAQ+yGUumGb8YQAAAAASUVORK5CYII="          # "Merging pets" button
+
+# Bag Interface
+B64_BAG = "iVBORw0KGgoAAAANSUhEUgAAABMAAAASCAYAAAC5DOVpAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAASPSURBVDhPLZTrT9NnFMf7oiZEEscgkOa3Ng0UVwoEyqVNkdACK1eLUkoBq4hQbi20gK0XKIKrSBFFBGGKIkjmBRQVb5kZi5tZ9IWJu2ZbXMzsf/LZA/HFyfPiST7ne875niNrrFCxMVvA+81ion+a+RgV7y9moj8XEN0U8VzEhon3q/n8upzLu8Vs3i5ksBFO5c5xFZc7duG3JTIabEb2cbOa//42CUgR0Q8Won+I+AT5uG7ir9v5vFvS8/pKJi8v6vh+cjcbZ1K56JYI1cYxUBaDvzyW9ho9svWn19ncGOGfh1YBySP61MC/qyZ+X8nnzdUsXs2k83JKx3cT2m01d4c0XPOpGa1PIFAZux1HK2JotkjIfP4BFh4/Y+XJfV4sOkVJet4u5vHTTBbPJ3bz6HQKd06quRlI3o6lATVz3UqcBjldlhgCVbEEK2PwWBORBZw5dLhqWdq4z9K9a7xZLub1vJ710VQW/GrmvUrmPMpt0J3BVBb7NQT2xXOuN4VavRxfyU6C5Ttpt+xC9uFbLbNeid7WalYerzF/voOHoxoutEiMOhVMtShZ6FOzGkphdVjL2cMqmst2MdaegvVLOd2WHXiFqg5HAbLo6hf8NvMZP0zEETyQzOylICcbtQSq4zhZm0i4QeKMS0m4MYnLnWrGXCoK1HKMyXL2iEiLk+M/XMKFUB2y91c+51UkicenJIadcoaDdXj3ZxAQ4w7ZFYzUS4w4JYbsiQzWJ9NRqSVDIWe6R7TheDrdNgmDgDeY1cjeXYzn2YiCtRMSk6K0FpsGr8tKV2WqKFMpEqgI1Kbi3aujc38Brc5S2mo0IoFSKFbj26emPF9D/4EiZK8n43k0JLF6TGLGk47TlMD5iI+DVj3t5Wm0laXRutfEqWArC3MhTg+66N6nIlSnIGiLw2GScNtMDLcUI/txPIGNkMTdYypmvNm4K7SsLI8yG3Ez6GtkPBxk6dZVbj+8zrkxLw3WVEozE2guECDDDpqsaYQOWwi7hbIXXydtw9YGlXzTmy2ab2BosI1ba3OsrF/jxr0bjEeCtNoLcRbphJJkavIkmovjaCiVaCzTcrqtkIkuoeyJaPwDAVsPKbnel8HZNjP1Fbk4HGU0O8wcrMjAVZpOS2UePoeBE4dyOVK+m267ipriJKoNiUTaTUx1m5E92gINqlkXfVvs04mPQtqrM8iQ5BwoUuCp0jBQn83xpjzxp2fal4/fkclXucIeGuEzm5rpXgHrFT57EFJtw9bEyiz0ZxLpMOOr02PSxOAuSeKoGP2Q8N3YkSzm+zJZCOQTbssRg4rFLwZxviubqR4jk1uwrV27P6TmRiCTKY/pEywHY4qAib74q+I5e0icGo+G5UAaN4M6sWY6+h16ThzMY8RtJOwx4HUmI5vvSWMlmM68L5eprj2c6zTTV5eNRUzsiFDWL67CuCuJKz0SyyLx1o5e6krBa8/imEtPX5OOpkoJq1GYNiIkX/YZmfKauNBZyGSXmQHRk5IcsYMWJV5xq0L2eLGjCq56JOY9wqg2Be4qLXbhsT0iqTFbTVJiAv8D92vQtggKOkEAAAAASUVORK5CYII="                   # Bag button
+B64_MERGED_SPIRIT = "iVBORw0KGgoAAAANSUhEUgAAABUAAAAZCAYAAADe1WXtAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAMoSURBVEhLddJPSBRhGMfxF0RYEGKgkKSIoA4adFjKSxiRIFHQIdHoEhQSGZIF9m/Z6iBLmURgRUqWQmCh0UpGHSIlBTsUiRRteFmCYmNJ2IswYMKv5/e+88zOrnb48r7O7n7meccxfckEWKo7hfuJZNhEoguFx5fgj5+3q90PJeVvXnP7wlACuTspu9r9g6TNDF/oBCMcBecTHSGqsEW/dMCf5rVLwFQb/HRnCZrt6YJ5cbYNGrEQTLQh15sEZgRRlBMGoF0FjMJEM8kOmMzFZmiFc/tKwt1DQLrJxf2gXGM3ZC/5t2Wf5nfcPnuq2fZf1B9ocBD7GNyA4Mvdq1CuhY7dFnzfckCeaVMDtFxTYxGc2QP8jkSYoCY3IKZg7mCdBZ80NsCkdsbBylEL89jEFP5QVwrLlAoygql4HCa5bQtGdmzCXLwGmaBfJ6ptuOYBw+uBadn/rAEKQZ/l2vN1wBsPSzc95I95yNZ6GK+ttoUoW4UqpimqcIB+qdtQiuqU5SimZMooyHRCrhGUIOvbvB5dnldEy49vUU6q8TEQ7I25guPr0dlcfY2FTWpjDLO1rux2V35/JZAw8k8SWOvmNcHYabdfbq+EXx8L+7qrEpNezKEjW12rUEJPq1zcE2MtFcB+sybKQrR8UgsfD2CuLMCi6MpghY37/NEKhyqYixcxtnRcfhgFGcFIhDAne4kwT0fYzO01YF+b5cPW0vzDpWXrXfkWg6Uu+U6vNC7YN8Fl9bvlRqOCEltoly9fk7v1yHGCiC4n5VjSWijuRsCglXmXIaYtv6uCX/DsGkU1C0Uj+lfeBs2XN4KTRlFOSFTD9xhWRitDlEfWLMoJ10L75R8wedE1e1IexVWDxX75wYQ05co/lGcuny9cLrY4IJ+NSX+L+X8McjNGXqkjBmNnXIpyZZPyGTHG/aw8EgUtOrsaZXZSRpwQp1RcQa0EfCv9+A/KCfX4BBnBcpSPQMEQjYCcOiPfsce/dV7AIdfEPYNnVwweyeRcP8mPF165cvKC/5qX/Wu3FjjV72IL8uxfy3vLTGujQQinHaxNyhsRhRXT1kKvnzD4B3SULF2gJo9JAAAAAElFTkSuQmCC"         # Merged Spirit item in bag
+B64_NEW_BAG = "iVBORw0KGgoAAAANSUhEUgAAAC0AAAASCAYAAADPNlfiAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAPZSURBVEhL1ZRrTJNXGMffD1O5FCi2UIGCFOU26AptaWm5ettcIEiYuIRMhhm7gFM35y7ZB4MTcLqFzeLMBoa6bgxcsg9bZhRFKSxzy7IPwshUNhVbZgYGkVvroPDfOY+0cQ4++MGEnuSX/p/zf845T5/3fY+gLjsEb0NIyN8Bb0NYtbYU3oYQoXka3oYgS8rGoyKn8Hm4x9T0NHp+70PB1u3z5j4MQkh8Oh4VWfklcLlmSMufyIapwYKr/bb/5T0sgjgqCRx5og6t33yHiYlJDN8eQX2DGRKFkrzT7Va89k4VaTerUzMxOzsLWaz6P/P3Y9hQSEW749y8YtrfHW99aRcu9/2Jf6amMDo2DnPz1wiJUXn8/C1l5PNz7h/CY8t8wWlpPQHz8eMIloZCo9Pj78FB7N7zJnmm+iOoqT1AWmcwwlcUSDn2gQGaWwiVWsOKdpEWS0LQZDbjq5ZWj2/MzKb9/APFiFkdh4sXu1G27QXy+Nzw8G28XFEJUVAwDpvqMTJyhzxWtB8VyjeXhcnZpB/x8WETrJ1dpHe9/gYsXzazxcsxOTmJgsIiorPrnr8QKrV2rjf3xujoGNLSjfPmcmpq38e+/dWkE5NVtMbHP5BinSEDTqeTtLDEV4TkFDUlPDh+6+3FEt8AVuAz6LB20u8A667li2ZUbN/JnoyF/IVI0eipGVxLZRH4rPEYunt6PL4xKxc/XvgJDodj7kTgvepa8nxEYjr/lcpXIRJLUP/JUWoir1dYFiBBhCKOFkjDVoLHD6JU63H12nU0HDNj24sVGBq6hYMffoS9+6rnzXej1mdS0e44I2c9K9DpiW/YbDh5qg0yeQzF+2sPElz7BEpxpv0cLl2+gin2zvM/l6BUY6l/EAR/qRycn3/5FZ83tyI6IQUBoVGIVWoRGackLzhcAQd7NFf6/oAkYhXOnrei32ZHaXkF+QuRlrWOiuZ6hSIBjU0WnOvo8vhj7OPjZ/L9C4pLcK3/BmoO1ZGXrDFSHBIZS7Hf8nBGGHyCQiEEyRPBSdKvxakz59k768D0tAs2+1/YWPQceRz7wE18e7KN9M639tKTWcNuA7c/H+nrCiiPj/HxCXx/uh3xmhyPX7n7XQzdGobz7l3yPjB9igN1R8gTRz6Osx0/zK0G3SDX2XVZWl4JQRqnw2IkOjUX4+x6VGblUSyL12HH21UYuTMKIUy1HosR7VMl1OHN5XsQpd2IWEMejja1oLv3EgR5Wj4WK1V1jbDfHIRrZgZjrOtt1gvQbtgMYWVGMbyBKEMR5No8rFCugaDIKYE3EJ35LCL1mxCe+iT+BfBF/TIfjCULAAAAAElFTkSuQmCC"               # "New bag" button/tab
+B64_PET_IN_BAG = "iVBORw0KGgoAAAANSUhEUgAAABIAAAAVCAYAAABLy77vAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAIWSURBVDhPhdExaFNBHMfxB1kCBckkiJPg0kk6CR11EDo6aaBTyCBCqZQK5SEiPoKKZCoWSnBIiYUHofhCqgYbxNJSHYI+pUVaIw4VwaGDhQcx8PP/v3v/y11JdPiQS3L3zf9evFo5QK3kO8JFV+WRq1Z2VcsL8CrBwshQMK/x4Vb42NiMlp1QMD83CC35s4YEOPah4ePL+4qS/Kor3/deGhxVEy36MybwcLYIv5g3gSROpQGBP7sGx7rtgEI38lh9cA3+9CWF10lcAI620DsIFBzc1g6r9HkH+N3VvpaUpFPQITuCb3SQIoyDKhpPaRw7GYrzOlS4PGkinxozToincUIy0c9Is0NTE+NuhPQPaw5zLZFeyQndu34eR9UcejtXgf05Lb7pSn9A+VwEPtKUYt8H9ujvXytdcCJqvTHp4sPi3RVgh64pJNSNaGMaYMfNCSA6N4jwuj3uhtq0h3GIp5KQRJyQjUMcEPZE7PVFeAhzwNszA/UsEJ5yNcaAbQoaFBZvztKeXBriwxJ6Qe/5MP0BCq83Trv4sHhF36+MpaGqpwOMYy0KRzQF47UEeLKQ9kaEA2JoiPFh2/9CfLVkPYt+k75onfCcrKbqZP0fnnkjQhx5alkmK2RYhNkhialXOyKhYbEnpEQk1FsbhBJ+BqNCTK4pEdIJMvCat7LYvJvRDzHVpwM2LFl4D03Adu9nlB93svgLjHdCpnhBp2gAAAAASUVORK5CYII="            # Pet item in bag (for right-click collection)
+
+# Close Interface
+B64_CLOSE_INTERFACE = "iVBORw0KGgoAAAANSUhEUgAAABgAAAANCAYAAACzbK7QAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAF+SURBVDhPdZHNbsIwEITzECTxX+ilEu0BTrSlVIi2iDZC4v3fBAk4bHfGNqTFPXxax96ZWcfV13YpYLdbs24+X0jfryLfb2S7mZPVciqL+YRg3fcfsnl/kvXiIfL6KLOJl+l9Lc+zO6mM82J8ENTGWKlbw8o9gvNI65y01mlPS9CHb9BAR21kVDekYoOag/P5fGmIISl8QGthegV9AFoGXfRG6qaWilMk88zvkNuA4a2y+V9tDqvwS06n0w3DxmwOM/TnENSSNmtQeQOIDofDDTEk3gLN6MN/zSElTR4mU3nbCAi+LQq80/OEs7XYdkRKvV3nEj6hN4BxDhiPvRyPxxtgjIDgjdIUe7pgo/mgBoUBw5CuK//XHFA6o2km3yKtiwH/hZTw0KhZCIZrTH0N8xqgBwzghAhIEyglwyHOjjgYBmKAS8OmN+t0r8qHOGCAri8hui4ZA+/0XfQ9aAr9kOQFGPA3ZL/fs2KKkjmAOR9ddQgB8KFW9zBcCEZ+AEIshRu8dvTEAAAAAElFTkSuQmCC"       # Close interface button (X) - generic
+
+# Mount and Travel
+B64_MOUNT = "iVBORw0KGgoAAAANSUhEUgAAABQAAAAWCAYAAADAQbwGAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAHdSURBVDhPrdNNSwJBGMDxiW1hQI0lpVwKU1hKDxZCIEISCQUKgkkb5DHzEEEEHb1YRKcugacO3SLoGl36EF26d+1jPD3P6EwzvtT2cvgrsrO/fdzdYfmdY3D8K1V0IHev3+4FpA7voLLdUF12WgDvTXh9rEC76sJ9JwdMx6ipjSMjp3yqIlgHKcIkSA2BPFsxKzRUhA6ChNCUCuTFJlD2clXEkzkj21sT8VxdZG+1gftdValcgrfnjEqABFkLeZE96xlZ8UWRhK08rtdQAiX60MV7KDHmpERWZMaIhR2RRFm6YqBDoJxMgmySm/VBiRKoo0Mgm8ePmIcn4DQEWHavCav3zRj+jRCwEB6nC8bxPnnrwIpHInez18utKxoNEiYbB+Z8A7zurGogYRLUMQnq6BjQ36/1QX06SgKDBQZpgZPA9yeKP74A6WJhPCGG65P4tLM1YIUmuMW66Kydh6cbPBYY5PSkx4OEBQdpugAgTTkM6g/i1+A0giEE6cRvQdxNCdzjSyWxtzNpF04OPOieZ0T/AkrsT6BEq1sJAdGUFFPYD0Ad1bEe6OCiMGJ8ajxI25FebEIjuD7a34KYX05Au5VSMQMLCmoox4FWsnMCIxzfFMSCgKNQjMDPXPgAkCN574BvvWQAAAAASUVORK5CYII="                 # Mount/dismount button
+B64_TRANSPORTER_NPC = "iVBORw0KGgoAAAANSUhEUgAAABUAAAATCAYAAAB/TkaLAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAUoSURBVDhPLZRZTFRnGIbnrlc1TaO2pi5NekfSNEabmqrRm7JUKwgiuyCLLIKyw7DNMOzMDDAMwrAVRBSqgqAgiyAClaURFCycMzMsyqJWrW3ai15gfPrP6MWbsz/f9n5H8cvsHNaNWkKStxGftRNDyRbUCR+RFPcxyuxPqGrZS1LFUR69sKBvMVLRUUd9bwuGGw3kGDwx/eyDsdqLqnpvahu97FJcfSzzfGOAp+/aGJyLo7xyDxaqWdgwEVG8n4QyZxL1fiTrgknTR5FS7EV2VSgaUyg55R5oa0IpqQ2hrsmHhsv+1F/yFdAZGevqTdb/HWJS0pKd/BnP6BeBeonU7SfR4Exq2XEyDf4otRFoxLmyNADVhWDGn8rcfnSfXGMY+ZWn0VWHUt8ajKLPItHctpc7d+Loun6W3LjNmJ+08cDSzXnDQbJqj6I2eZJTGUhqcQSqkuOo9G7kGb25tyiTbQght9ydtFI/8qvPkFcfiaJbkugSmp6qYeJ+I9rMTdSWO5CSepjE5B/Izn3/8dCCRF5VLOnaIDK0rmQUu6IqCxZ9PWmHJuk9yDadIqchBMXwosTggsz6+jQTY7W0NbthlTrZAP4TqmnS0C3LdEtC85I9M2WhB2oB1NVG2oGxemdiCpxJq/AgwyQGNf3MwkOh1bUxZmdu0dsRjtXSyZs3Cyysm2nv1NmDDolsR5dlhsXRBiwyif5e8CdT58VdUcUZzSHOFTtyvtIbhfTnAvIbKzMvLUxMldHRkc/Vi+401zgx0FvMoFWixyzbW9QrMh6wyu/Lrg4TLgghVuNmDxSk+o5g9ffEVJ9AIf9lYe61hVkBffjcwuiIP/2dAdzr9mFkScI2yK65eW4J9Qp4UqEfGeWBdiUU+XMu14dI1Uku3ijGN303EVUuKOZfm5l7ZeGx0MwLmY7LjjQ27GDkiWwvq19A+8wS+aZIEgsjiMn1JL7ImzFhp/NqX2ILAojI8qKxvYgkbRw5NekobFk+fmW2AwsNAVypOcz0MzNTa2Z+WzUzvmJGXeVFhsGbzDI/lLpwRkUFNo+mFAQSme5NlFoYX0DVFSmiLWkoJldlJlZkCow+VOgPYNLvo75sn7g+itLkREqFC0llR0gs+Yn0Mm/SS8LJLj0ubOUmrCYRnelDWLqXHVpYn4HGBk0oPUBqqaN42ZWcrG+oLtpBacHXaPMcRHl7iNIdJMHgSIrBlexKPwprYoTxT5IpvKosOMaEyDgo3l38I9RoGz5Ao7XfEq8/RKbagZiAragStpEcv52U5O2oNV+K0hxIrnBCXe1hn3yfGNaAxUxRVaAdmph7TPT4FHXX1Vy4kkH5JSWKSO1uMnK/IDpwEyE+m4kO3kJU1FbOxH5OeJq4r9mJqv4IA8KrNnsNLZpFT81Mil7blFbsKQJ7cVbjy+lU8ddqFdDxpQIabzpheWdC3qggLPJTgmJ3YX1bx8wrIxebXOgTGQ4uCfM/MTMmQLYZ3BdlDwu4bSlGxLPQNA9Op7jjeVZYanapkdaOE6y/62Vto4vVjQ5WNtp5/nYA6x9tNJl+tG/SyAfZzseE3WzTn1iRRBCJSeGSqz35Auz5Hjo4ZOTaNR+WX/bx9HU/a3/fZf2fe1hXOhnoScKYv0tALPy6bGZYAIcW5+3QB8Jy0+sWpsQqTwkL3hhUYmxNpLIlFcUtyUzDpa9o73KheyCQwdE4RidVXLl2gMmxGnpua5kSm2bTyPIct+cfioX43b4c4zYfC9myL2oMQ9ccjqEtgf8Bs01jwnhNk54AAAAASUVORK5CYII="       # Transporter NPC in Athens
+B64_TRANSMIT = "iVBORw0KGgoAAAANSUhEUgAAAEIAAAAKCAYAAAAAX4jpAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAU/SURBVEhLfVZpaB1VGE3SLdiKVisWxC6gthCTJnlv3ps3b5Y3856YFhtsTZs0TdOkiVBoVQRpVcyPolhE64IbLab2nyIirr9EEMW6/HMBNUIrbrWQlkpCbdPleM6dmZeXtvjjcGfuMnPPued8M3WlMEJAAHVXRFguI4zKKLO9EqIEV+oT/LAMtwbFUkSEvI7gBCUU/KAGPhy2RUKtUPDYCsm9xlzC41q/JIS4e10RY2NXY2SkmXuNqoiIgQEb5841oMK9COVKusd4PJ1bV65UODiNoWEbFy7UT/dxkYQQSiQSJBBBj2RK6q9BYFq+xLxsGhLUXHOsFIbwSMINErIUoCoC+9RvoDlmXjxX0Dqf6wNCz6klLZQFvifF0FDe8DEiJDD7SdalMEJE5Rja7LZkoSGWuGXrYB7Hj8/Drt0tOPZ3I079Mwe7Hm7hJnmyQYhHR5pw9Oh8TE3VY2JiNt55dzFP3UfeC9Hbb5k1Tz2zwqw7dWoOHnmsiSct4j523N+CsV8W4Pz5epw+PQv7nr/FnPqWgazZx9P7bsO/Zxow+voyvHZwOc6ebcAbb95shNiw0ak6V3ONGFXC/+PyS0QwQni0qk+k7cC2WAhZTifhsVXf1FQDvv/hGnRtdPHyq7fiyJH5FII2pxDD2zMYHM7Ai3x03mPj57EFGNmzAm22iw297eZ5h79aiKjDxouvLMNvvzci67jIuR5OnJyLPU+sYFQ8dNxVROd627hj89YMLl6swwcf3Yj7Hmw2In78yQ3Y+UAzJidnoUghY3jo59x4z9yvnMM+x3VRKLro64/fnwpU64YZ0dCJy/KxtSsYnOGIOAYSQpta3+UyDmX09Dkkdj1FkBDKesTNR7C9CDm6YPTQUuwfXYaM46O7TxvhKdxZgFX0SLDNOEdCWNzoX8ca8dbbN2FNp1ONiU0ivSSgd3aszWNTX5u5XrM2h01b2sz+rIJjkOdzerfEZG0+z7JttFk5tGayaM1a6OldlQgRR0atiCtWQhqxujQW5aQdGoprRGiiUknEifuCsMJ8VugSFr0ghkMMbbfw7XfX4gwtnNpv/+hSCuGhO9mkRLBcnwRjy+d4L+jkv/5moXHc4S+v43gGeTpFQph5PNlNyXWe1ylpzcmTuJD25ShKNl+gEHkjgtp0zDiBEHG5XMU2LbgB7+skQC0uE4KoCkGXyBGKg+2VWANU9SNTAz7/YhHKq0W2hAMU4cDoEnPqPcYRiRDENCkSIWzaW1jdWcD7Hy7ms+aZ/tp56bURJSVNAQTLKfIdqUuKyNoOMokY7XkbvX2KGItlRYVdJSCOvPn61AohssYVSdHcViUdu6FWCIngyg01KNARk5Oz8R5JFFggdzLPf/zZaIQQ8Z4aR6gm1BKUAIP3tiGoMHKRhxdeWo7xE3PNWOqINCa6FvHp58UiZBmP7sT+EqGdIrQyGqsylnFHx+oiP5/1eHJvE6I7QqzrKphPsoq1vkISwURDRKtiXCKEEWOGEJUZIjiE7Yd4fO9KnGTRU0X/9LNFOHhoiXFFzg1IPIkCYyFUhUiccPTXq8w6fTV+/GkBtu9o4SY99CUFUBtOhcjyxLs3x6ev64d2r5zxNRAmJmahqbUdtxM5zglZA599biXGx+fhAp0xPj7X/JcUCUWjWiPSU0+jICgC+k8w/wyJIBJBbpADBAmgaOQYBRHOs43v/SQGbNmvsXic4MtT2IT5SeKp6GdKooj05YgjpFpgqQaQXEb2J3StOFi6z8VFUk5obs8aZ+j5ikP6U6jT9xlrfRH9JBYSIYwi/AcSJSi/Hj992gAAAABJRU5ErkJggg=="              # Transmit button
+B64_TRANSPORTER_SEARCH = "iVBORw0KGgoAAAANSUhEUgAAAGIAAAAWCAYAAAA7FknZAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAABEYSURBVGhDdZmJr1xVHcffvwBvtrvN3Dv7zJu3zNv3rcujLQ1lC9LaUmgwKBECKIZEwyrBREEgIigYMIKlICkkAtG2EJBiLJoIlNZqytJXlmKr6aItbfn5/f7OPe+9Epnklzt3O3fu93N+3985Z1o6F+WluSQvldFICoOhdE4XZPicsvQvLckAYhTfJ5ZXNEaXVWTkHLMdQ/QuLkrbZF6iIV/CkUByg9z6kh8NxO/zJGA0fXHrrlTGclIey0plPKvbaCiQoN+X7EAg+aGslEZzuCYrRRzPop1gwBN/wBGvH9EXb3sdcZquOJ2euO2IDhNOw4QfFRB5SftZac3g2mwo6SArmSCn3zVyobi5yJzzA0k6Hq7NxOHE4UoCwXNpL9D7vTAvQaEkuWJFgnxJ3BBtoC3bLq+xz+I2hbZTuDfhuHJWKq3t8tz8s3OS4X1xtLRPRVIeiSQPCOURCDtRlPpYXo8Vh0Jpnyio6GPLqgpgdAEIAmsCBgHkhiEsxCsAQg5g3B5X/F6IQ9FqBgQh2Mjj+mwfwAFEcRiQRgEIURjE/d0+ILgGQBwuIGgAhEJo+BDfRK5QlCwiUBAFFciKYsJ+XwjF7BMGBUu6PkTzFEBrGjBsEAjOEUSuVNEIS1WFwnaSnq/3q8iA44YGtgFuAPEagki66DC4h215+J2EkgliEDn0yvwgKHVmNIpDeYWSB4QConNqHgSzYXCmrABMdpSlZwlEAAgGAZQgsgcACgLhsdcCBAFZCGVEARmUxbNz/YEUhnGc2RJnRNgDEJ2+ZHoyGk7PPAiPbTY98brmw20HeAgb5AEDAjGyRbM1UVRACiEWhwAWAtLsgOAUK+lYKMgWhUERfVyDd0M7bNMCJ4QUhKaYHrLRz6Mz8Hn4LQTDDkEQ2i6Cz+O9tg0GwbTkB3LCiAYgPoDYCAdzEsIymrAqA8JkAi2rb2lRBmaK0ofoXoJGB2gl/lw2ZJpGMAXB3lt1JRz2pRjDIAh+9yl4L7IC95R5jjCQFRHgBADhQ+BUMy1phAMgbl9GfFiUBjOF7RMEskLFgnhzPQ4iMOxLh+WqRAieo92oaBQT1xswsBMVNdDz3J8PQIrFZC9mVrBNB+3TgnjewXG2yeO5Ulm3BEGAancASptSu9NOkDPPwpZttkT9FgS2AJAdyIrbjxfs9xQEo4e1YCKS5qKCRieia7GpLV0I1gPaUxFCur3wcAUBsShUm2cyhnUkhsFsIJAQNpSG1RhLQzbheGnE2BNBeBA42ZUyMLrTaJsgEANp2FVGn+Eg42hLGWQEX5DCqWh4YX3R+KXVjmLLoC1ZgVVU9l6IYYW31/G7ERrH46yhcLYnqzUxU3DOws4WyxoBMpLX8Hfxd2jmxdB5zGaWiSJAAEB5JERPDNWrs+jZPgslQPA7QbCYFhDVsVBqANI2GUkDtaUDhZ7hQfwQnh9BSGaDi/BpI93wcxTq6niomcLzRdaBGAQzyMG9HkBGKPIs+nnUjKgPttVlQLR2JCWBYFa4EJ4ACMMDFBbuDGsExKQVsEdaAQ2UM4MWMm8/xirMPgLnVDhaCfb12jj4PR0QggFl2rMZRMvCe58hrrFC7vP3sD1anV6HmsCs5DVabwAvh5rTwoJcHeeIJSclgIjQG9lTc4SAbTQIG8HxCiCURnIAESqEegykfRogICRBsOdrNnTHILoAAvWhjHuDQU/yMQhaETMjD/Et9NwQMwdbPDcHyyKIRGdKkghmBK2JoyaFwZrBbED7GR0xOdqr1Z81jD8vtB0rIIUz4pnMUbuI/Zv7vKZcb9Otvd4IiHoCsW1mac/Wto2d2X2e1yLMZ8fP5zG1RFyrIzJA4XH+Rv5WQmshgCp6p45qMIQsQ2xmAIEwC77sw8xgpDvTak0cvgYQ1IuzgeF2oEgPo+ijTQ5PfcIAAGtTzALaEu2MWw3CQHtuEz0fx9k2Afh9sCNkAQGcEV3IjHYU9TZEzZF01UBhj+PL04YoFAW3olNUXpODhfAaikLBeW54bEJOfPaZ7nPUY0Y2RnCC0MC+DR6nsLaom+eg0POYir5wH3UM7eq9MSg+n5nTQvFLQxw+xllBj8bIhUCYATzfhiw4b/1SOXX6FPwbY349zkwyIFioaT0UTmsDswFb9tQiRkR5tFdAxngQmllBS2JEgEHhaU82AtSnEEPXXA9hoC0UbK8b2YAa4TOYGdh3AIqwdLTXQACEDQLJEEhcMCk8YVBoCpKCVVBAZ4GYNlPGpxfJqVOn9DiLPYFxBGaBmewxYro8BjEXwjg7jfmIbk3wuTYz1Q7xDLU13DP3Hde0FFCc8yjYtCWFAsEY/F4FmDog1OHxK9cZEHmAiHBPET195boZ2f/xfrn8hstk9qN9cujfh2T9detMNnQ5csU1G+Tv7+6Rz9DDDh85LE8++7jUpjBHmcjKinWL9Z7v3Hmj3nfwXwflihs2YBLoAIQjX7nqQtn5t7fl5KmTcvTYUfnuXTch29IyffGEfPTJh3L9zdfLwUMH5b0P3pOxc0clXUsrgHJ/RZ569ik5cvSIHD58WB7fuBHj/rKKNQaRZ/fvl9Vr18m+ffi9hw7JmnXrJQMx2Pu/7EO7I5B6Z5dsevo3cvToUb33gQcfUpEp5vg03gdtr1l3Gdqe1fNr118RZyc6BDKLAO285Iy6gTZawh70zF6Kb0BU0Nur2Nbg68wEHotQQFesNSCKsKsQw8s8hrcrAOfEiRPyxps7pHd5t9z241tl9z92aTZkkA2XXHWeXLBhhTQmCzJ5waC8s2enfPuOa6USg2B7L21/CWBqctu9d8jeD95V+8lhePrpwQNy3c3XSNSDjBxpSPdkj2bF9EUTet/zW56XfG9efrnxMXlx24uSqLRKspaQzS9slhe2vCD1wTYZGBmTt97eKQ/9/GHNjMnF5vf+accb0tXbLzffdrvs2r1bRaJPM6aXzmhGaC1AWHtiRmx+7jnZuGmTVBsdMnPuuXLgwAH53i236LmpJabtHW/8WZoDg3LzrbfJrl27NRO0HTzfC1m8jdXpRE63OI9jLQGKYoSxfAWWpFkAyyEEEyZTvG5Plq1ZogLQlkxWBLJ8zVL5/PPPpWd5EwI6Mnr+kGx9dQvsAiBQpOsYBNR0bsAMC+Qnj94r9z5ytwGxfomcPn0ataMiaWTP9CWL1ZsztCG0te/DD+TRTY9giNxu5iJ1DARgg5MXTuh9UV8oiWqrrFy9UrOptXS2RN2hiti3uA/Ph03V07L+6vXaUykmxeLv7R4cUnEGR8dly9Zt+t3MO/JzILQ4o6ebLTpqra7HG81uhcPaQ8Cvvf66zjsmFi3Wtrt68WyIy7Z/v3Wr9nr2fmZNxocN4lpakcJHtviRGVi0+Bh5hPDmMu1oQTbUCAVwcoDkdfuwhGkFUYWwzAba0zmrTZY4rAkIWpJCqNOjXVnzjVXyl7d2yPHj/42TXOS+R+5Ra1oeZ4SDIS5BjF80pfspej/qwMyl0/LKH1/WXrbtD1tl6rxpSbYlZeL8cb0u3UhKsp6QifPG9RpmxNDyQRUjXTE1gjAWrVqE5x/XkQ4zgmLa4r1wpETxKPDUUnONWQIxwvG6kfGJ+A3O/Lyza5feTxC8z9qOqSUGAkMHAwyA0Wdjy0zQ4WuxwozISBZFsYihJ7OC2wIijxFQgGFoph1DR8CaWW2EK6P4cjTFrJi+xIjHJQjakbUkZkNjMkT9mJWXt2+V/mUNgEVG/OIeuffhu3XitywGwYlgBjDGYhBJgLD2xOieaZdfb35CZj+clQSsZ2zlmBETUFJtCVnz9Uvl/X3v6/f6WEXF6Znu0WwgiMuv/Jrs3QvLgy3Y3m4KpBGLQuuwlKKzjkxNa8YRBDOFi4geBGs0m9p2oVozgHAt2+D9DNYftm2yKC7qmg0WNuuQGdYSDGuFHcqyrZYsxKboBJCDkAGEYLgdmM3qyyYBIiNLL8WDIBRrBCGE/V8AwckbenZaRyyutAPEkWNH5JnfPqkrtFfe8FXZt/99uednP8IQFtm01oDgyMnHSGn8YtNWhnMQFOxla2cw14h0Hep21J4Dn36iIEZQmClU52SnVIbL8vqO7XL/w/fp78wgS7bveA114hmpDJakd7pP3t65U75/1w/U/xfNLJ8DMZ8F8TIIiyqi0miXz06elKu/ea34sIxm/0BsRaH6/xMo/m0o2gRHG6q2dyg0m202k9TSsFVrAghmIfdpR5zI6WQPbdpoybPnUUj4L9M900jpC1kItAMPIGZWGxAcvoZcBsE9UxYEJ3HIGqfdQOBSRQOF/qY7vyX/PPSpHD9xXLa88qI8+Nh9cveDPzQg1pmaE2IiF2CUZKESBBf39uzdo/dx1PTmO3+VCzesUstjRvDDUdGx/xyTXz39uC4sJqsJnE9K93SXvPTqNrWjgwcPyf0P/FSy8ajFimV7sRWLQtuREWvFjTfdJB9/8okC55bXsH4MjIzK77ZskWPHjslJwNo3OyurLrpYQS5dca62zZVZLnGYmb6ZXNJ6aEHcN8sf5rxmCNpWEBFswMPslRBsWAAMfvchNNd/mA2sDVy6ZhbMRSeyAZO3TBsiBsHFuyxXYXFvgAJc5joTRHdgdSHmFYTBSV0wyEkbQCLYVgrXc6tAeC++Z1l/kG0cng6vGNUXPqvYOh8ljJgAwqmjE9XQmRYEbUALJV7Y2Inx/IXWQSg8zt5McSgMryco3svjOqqKYdnhqBWRkHiMPf3LgmtP3Nr1KF7PNs2SDKwp7MGMtSPOgi9AYKSRIawVXJ42thQABEYwODYHIv5zhrUh6o8X7yAyJ1yc8KXbU5JFASYQZhJn0FwS4VYBxFlg/3ewUCwIhtthQIwsNzXirGJiDsTZpYSkqvitcRCI04Z3wtbUA2MLFMwExMa+ejxEoNA8xsxQWCywgMSiymv+38SPoRkVw2O77OUUnEIzMwq1NskjokotLsoEYEBq4HrC1YzwIRR7KS2JgqUAYyGIjIroQFj+V4BCDRCOzmwhFhfeCITrPXUXRRw9PO79Jfb+GESSkNEOg+tS9h84u3aUQW/nlgBoUwYO2oYlejjH4CydIMZWYNQEEK3FJIasiDJ+Z4W9H+0DAu3Jxbt4qHH6btpjuRhnBKBNGQsyyx8UmEJqj0cQBgsuRddMirPJFnMLiH8gGVCEbOYanGnb+QKfRQCEUag1JF+dB6LWpdmADhHXnxYXEBgOQcQQmBXMBG4Jgj0yQhYYe8IYmBAYfRQLtaEO0WFJeYjrQ8Ai15QGcBxCWhCMBEY2fp9ZV9J/4FCfmAGaVQCqQ2Ac8/rRLjKIIFl3XEJAfUhV8ZviSFbMljNqp47r5pY48D4NEz7fg9byBbEVAgWn9agtmSULkxW0JmM51qq05xISMwn7uqyhYLhUYVZr+Z3tWtthPdBn4l5aEo9zlTUEDJ7X5+hvMJ2hhT3HgdgZ/ugYAIMAUvyOLcXlfwu0HbcLL4m5wrwtQXD+AxeLH3GtCD2a60FqSwoiIa1tsJBaq9YDQrB/8LD3c2thuMyGPvwmCwKW5LTNg0hjWOpA5Lmg+MgUB/MGDX5n2JeEQOzJpjAbv6fIFJ+929oMrzHZYyyKQjFsNui+9nhCJAz++8a/SgNpRTt26UKBKmzzj6DeT6hsE/eqJSFsh7AFHRlhIDAjXNQKhsOageMWit9E74IoIXoz13s4TDXZgC0KtIdzPE4YBEFYaQ5/2QYi0QCEugkLwNYCGwoC2cX/pLVttT0EoQOEioWXTldho+j1CkEzGdcwI7QHz8dCASku91MszBCcxygEjxkLMqBULL3e1BK1qbgde61ubWCmnIj/VjWTNsI2VkjvZwaZiOHhHm71GLf6nc+J5H/DupfhLsKfMgAAAABJRU5ErkJggg==" # PLEASE FILL THIS
+B64_OK = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAQCAYAAAB3AH1ZAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAJQSURBVEhLxZRfSFNhGMa/i8TUxFizNdIwZPPP3KzVTG90jIXtv25t6Zoa1dgKooVSwcCIrmY3BdVNFxL9BSFTBoktikAqicDYltetblq5GumabDydfdFpZxO2ux34wfs97/s+5+HjcMjIjQWUEiI/NoFSQpr1Z1BKSKNqGKWE7NynQSkhAkk3NkJrd+PFwiJW1xL4tbqGV6/fQTPoZvuDrjFknj0qC6vdnHyI2I+f6NLaWa0QpLapE7kYjrqRXF/HvalZ9FqPQ293YebpcyQSv6E0DdGZIyc9NEB7j5Ge3aPjdMfkOMXxKgTZukuCXJaCYfjnAhyN1yDF+6Ugq1uGXTRA6wEVerRWGu70qJezUwxkU3kFstndKKLGeqOJo2cYO38B8XgcZZsroTMY6ZyiswufIhH4Jq7mzRcDE6CSKf6jUvdSY1GzhKNnMB+20R5fIGQCmGgdDn/E/LMAE6oqb74YSFlFNbI5eEhHjcWtUo6ewWwdoD3ediFzQ/20nn4yg5VYDE0SWd58MZDy6m3Ipm1vBzXWGM0cPYN3/DKi0W+0NvT/vY2mNjnevF1EMBQGT1Cft1MIUsWvQzZbausR+fwF9x9NcfSaHQ0IhZcxefcBPffZHDSAWKaASLofX6NRTM/6OTvFQGrqWpCLy3ORmt+6fQdK5gvXWIYwF3jJvOQ7WhRKOmNxOOnMv7POOoJUKoUrvmscr0IQvrgDG+E858WH0DKSySRWmJ/LY/885Ko+tm87cZYGkHXrWe2S7zrS6TQGnB5WKwQRtqtROtT4A6dxsrF/RK+sAAAAAElFTkSuQmCC"                    # OK button (confirmation dialogs)
+
+# Destinations - Thermopylae path
+B64_PARNITHA_PORT = "iVBORw0KGgoAAAANSUhEUgAAAGAAAAAOCAYAAADQZhkSAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAybSURBVFhHdVh5jF1VHZ6tw8y97779zdv3Zd6bN2+Wt8z2ZmtnprO9uQUKsS222NZQFgdESCRBIYKKAcOiqahJ4S9pIBIlLEWJkjRBEI0hMQKagCihpUJLpWVv+fzOufe9DgP+8eXee87vneX7zm85r8m+oEFRFAxNRqDoChQ34VIwn/dBL4XRt8lttCcI8XQS88ZzfjQKfTqO8rzf6BNIEVUiqqC724PBwQARRKkUQbkag7rGRvNYEA67MDQURXbcB2Uz2x0KKpUyCpO5xnqy6RRGykUMlwYNDA2jZ7zH6LcT48Yz151EciBqtK9fL8eJF8NG2xghfse5kqluRIpxo12AbaIv2G/arhnH1xM03gVHCwRt49mk0bZm30qJsCnwB0IIhqOIRBMIZ8w50sQswfHE3E2eQRtcDivmJ9KwrKjG4ooKN+lFZsYBq2hbtxC5oZCC8dkoRmo+eHQNvnkblBG2LymwTPI3ywqcE1bkdD+KOgnWA9ioZxGpdUkbZUpBZqkTx99txr572o2xBbw8DJUShqplBLfzm+vRqhq6p1NIEfquBM6cbULPhClAfT18DvTlkB0zCamvN6hAXTD2ZV3iYTPnUAaN/mh/HP6qSaxAgIiTvLLZtmbf3qwPap0jMSfHDg2E4Zx2yT1po1a5b2UTUVAQ6AsjwIMXzaWRSGWRqNFO9E8S5C/cH0NTZagDQJPE+x8047FnWhHf1SkntdRURJMkdt1ClDnj3aJb4K7ZEZ/xwO21IRJ3w111GxsWtusgFu9bdsE5ZZM20Z2deOGVFmy7vMM4GcKOp2rTpiy2b+vDxx83Q93EsVbMPj5HdlikAGFuXLZ9RoAe5EZTRnt9vXXUiBlCECxOuSBCtIt3nuby6jkeTn/QhMf+QB4uJQ9r9q3OqbBN2w2CxZoIjREkFIvCWjH2JG1FH+dTR1VYp6zwJYOYmYvK/WgViiTWSxvLsoUCVDpx5kwT9Mlu7FhJ45nDnXji8TYZlgQ0i4pqgSGG78OlkHw6nRyET1VVoWkavF4HCoUgarU8lpf7kc1m4XDYoUY4hlgQT4riIai6Su+wLKmIJ/ywWo3wJ+eJWRqEbNrUgy9fMoCzZ5uRz+fhsDvkXMKuvt5EIoqeXEa2ZVIJ+RzI96AyUECWoag+7v9FmKgLwO9yuUOOK96DwU4cOtSKRx9tld+hEMMzn1YrSeY6HA6nfBdtBgdWGU48XV5YrNyHas5h9ttsdmyej8jxhZ3LxbBu9jWt7oxwoxRgqpvxPIsbro7gg/dboM/we2MKt33Hj3+/1o5PPmnGe6db8OQhKy64gH16H1ZXN+Kttzpxyy1lHDvWjnffbcWttzIv6MNY/ZIdR99swdf2t+P48WacPNmKm2+OoLAphvTuzsZpEyTreglVhqc6IfW+9VB1FaNXatIDbrophhMn2vDOO224/toY4pNh2Jdt2H7beXj5Xy3ytJ061YqHH3YynOYxSO8ITwZgXbbKcbRlMxxxvhDzhvAAMa6lZoF33I8LL/PSE5rhmexCOpNFsZTBr35tw6n3mvHf0824/zdt8G7h6R4JYmk5gSNH27DnCj9eP9Iqw+rWm86THm9dtH7hXgTihRQF2BU1BJgmqXT9G66J4sTxNuhzOSKN6/l97WoUW8/PYu/uFF59tQN33RUgab0UIM+NtuCll5zYvbuK++4L4rXXOqB327G6ZJPjPvWXVgSTnThwwIs3jrQjrHfBu8BYyBNw5ZU5U4AKBehrELKwsCDFFX2x2Ri0FY2xNABb0IaKboj39HPtmJvtxY9/FMArr7dBI3H+wS7MMGyOX9QJx4UKSptV/P3lDnz7RibDaR/Jp7fmPdD8GtQ+M1wIAfpZIJgCuCpGCN18tYpjb7dIG7fXg8cf13Do8HmIbFcxuNmJF/7agnvu2yBDydjFdnz4cROefalFHq4b2P63f7QY82SNECpshAek0lmEB2PG3Ax9TatfOSfAzgvT+NNzFjzCU6PPU4AFYrmHBNWRw4MPuvHAAx75vbqawqefNpH8zfzWsW9fBX9+egP0NAVYschxfdsYR7mA0Ws68NEnTXCsWCmIm9WPh7/vNQXQKUB1jQCzDQHEafUWSRpDXbY7hYu2puS4/q2diMej2LEzLcftGnTTxoJ0KobefAbuMRdUxtqf3N6Oe+/1yNPo6XUxdFiRiMVJuplDpAeYApAge8qBCHPTk79vw/4D50kbH0Op6Mt/VYGj4ILFYsGePR688UYb7MNOlPd1SB6yvfQq7rUwx98/2Qq/P4hoLNmw+ZwASSHAnmjDJU7TZZ941IGttSz0JUF+DtddF8eLL3bio4+aG3YHDwoBciQpYRI4JEkUqJHchbQNVzDBCKLkRIz9lSkzxpIUy5QF8/NTDZINAYprBBAe0NP4vepRkckkMTpSwo4dPfKkinaby4rzd8bkt7BJkfxLL03ihRcUfMhEWl/vT+8yiBQ28ShzR7YH0aJJAucLmwLU7U8yxPz8QBuJMsrr/opBcH2MQDCMmp7Ahx82I1Q0wxf3FulnLjJt/MGQJFsguMbmMwIwsVOAmNyoPkfSBcTJF+SvCGQZ2zfg+ect2L49LUk/eNAtoesZkmR6D9tFHF+M+7ES92Ah5sIVcxRAEG5OtIuVg/jOsAISbYGwxt+PmAIsrfOADK66Komz3LRlC9tYdxcH+z4ngKIp0C+JGt+06e/L4siRDTh8WMNsxUjq3/v+Btxxv8Ow5/0m392Nvp48kmWDLDGfayLVIKhR/7M9YL6HU0bY695Lb+Y8sXgaV1wZwj+ZG0OlWOO34T6TWGGTYNnM3CEFKEVRvKpDcpXKZNYJsNskURA/TwEWCUk+Ucvhvfda8NRvbbjwgjSTaBBHj26gAC6SliaBZgKnGDpP8FIihLmoHwsBO/ZOa58RYJ8Qmt+VWcZYhhXFwhxwudsUoEwBzPpdCtCLbduy+ORMM/be2Q5bVsHiYg8FKDcEsC0YVchF25KGALwI9VGA0ywUHnmEVdm4BVu/2cGc1Yyf3c1xxdj0xHw6w2qpF75pb2M+lRXYFwtgXk75/twfO/HQYYaVYieq4zFGhQ7cfkcXuniBHL6MpTF/G8umDXuuZa0AnnEvghdozJdN+MZ1fsQrUZkrTA8wSVwk4eLkCwGWiRqTci2De+72yQpGhKBnn7XgoYecFIA5QgogvMcIISIMVUJW6MUI9EIYqxcH5bhyQSxDd11MQfjtWmL8vPHzlc4pCi1tWadPLsY5Xjf27/fizeMt0hOOvdWKgfFeLO0JSsK9/R5Z6m7bljEEWGT5WPThW9/1yarrg4+a8ORTbbjz9g34xQ86oLEaUSZ4mYrYEJjywbbEet4kV4tpDQGss92Ndisrwfr7WDWO3z3fLsd9+2QLfvhLL6xbUvIwjW0xEmyYXqrUGLa4Fk/Bi2ghCbf8h4Gla96Fa77eiWP/aZM8HD3RbAigTydYcvIEi4QrTr0gf4nkL7NNoMbQsyJOuCg9RRgSEAl5hhDEVwn2jTMsVb3QRwkmTX3AjWrVaWyAEH9B2BdVhIY1OO2M1wEb5+Wt2Oxfj9lZIUIao7wRO0Z4D+BvRSJ1LNpJtF/W0N2ZBO8FfShVepnoWKObNu5ZFcmcBRbW40N2K1acDozHGIZ4kVJYJXWNWGDNm3+fkFxf3me8kxBX+ZwHqFPnwlQ8ycQ+VYQ6xnE4j8J5FIZZNWvcDYK8K0gB9BEoJa7DXIsmPLVq3J/EXxNJekRobQjSJ2Ikglf8BUFwXQSTfAFJfh1rBRgkhADz/D0JZ72sV/msEH0MUYNCBA8vcVwwJ69fPFwkPxO0YiLngD4mRKMIZv96GHMx+Y6WEY2EZAUjxyCh2WyK9X2/FKBSLqBU7OWFyQ87+wXxXZqKYQc90mWH7rRLEXJJEuFxyjGURBBO2ot5ct1ZJOLGZS4UCsPvM9p9rKaUakG+J5JpOGYq0Kp9rII0WQmJcTSuyesLMNTkTAHGKJgNbk8XLKzc5FxdLLttGi+faSmAFCFMEThukz7Fi9MMvWCemxXVDy9E8tQvE7wZnyNdgEJJISiSPkVQgI0kcZEhaYTPMlESAvApPGJMCMPnEAUZd2KGpaI+4cBi0YV5lnMLwq4ihCMYk/VhP+fmepaJWpjjxzAxHsD4+DC9aQhjoxWZB0ZHihgZFn/K9WOIAghUKgUphE5x9RjRRQ9zk3wBIYKLghOujYOSpK7hHqgkIJNMoZDLo5dIDfTBOTvEy9goPXZMok5oMsXk2V+AujzC8raCrmoRkd5ekplrIFQXgILHExkpSqONY8QpYl0Ao0LK4n8C0dleuLiknQAAAABJRU5ErkJggg=="         # Parnitha Port destination option
+
+# Destinations - Larissa path  
+B64_THEBES = "iVBORw0KGgoAAAANSUhEUgAAAB8AAAANCAYAAABRsLWpAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAQBSURBVDhPdZRNTBxlGMcHRUKMUTFCUT5qsdD9ZHZmZ3Z252NnZ2dmEXZ5KbawsBQjNo1Nm5VoPCjH3o1JTx48N/FgsAfSNCSYXmjszWDtUXtp5AK1SSVtaP8+7ztAqMFk/5mPnWd+z///vO9IZVZByEaFfDYCh3lQq0PoNk+itzSEeC2N4eowjNE0vCCJwE1h3E6COWkwWyYpYK4G5uXAgjzYSAGsaoPVHLDxIqlE8kg+3SONB5FqASSH/qywqgB/0szh2bMWyG4Gbx3vw8BQF5JKDHI2Dk1JwJQTCLMp1JQUmEZgk8BFncAGmhdkUcvGCDxOYEZg5pIIToYYIyALD6kCCfxH0vNZTM/E6AUS4vFBvNf/NpKpBORkAmoyCSOVgisPY0QhqE7QPLl1yK1HbgMTzU+VCM7dvgA9GszGCZ6Ix5BMxAl4CtVaH3Z3JcROdKO3803IaRnacAZGRoGtqPA1DWM5cponqEXQEkXsW2ChRXA1glcPwylmViYdhnMwHWsEj71/DKcGupAY7MbpWpeAf710AltbrdjebsWXXwzC0g14BsHKOazd6MTOPy/j0d+tWP6hB6crFHPFQfNiBP/2mxgePmzD5mY7mk3jAFyve1hbewc7O1T76BUsLx+HlNEMmqmBtJrDh1NpMYL19dfhegquXu3H/fvtKOZN+KaFn1c7sbpyDHWa6+KFLLa32vD9dydpzh6al3Oi9vbtLszOerh5swd37nQeOL51qxurq++iPu1h8TODjLVBUg0Tsl6ArOUxOT0sZm6XNCh03Tgn4+nTFjgmLaCKJZzNTVDMZZpj4OH6j33Y+LVDxNhsFvD8eYtwyGFLS5pwuO9a1M7xkUQr/vpP/ZC0gg01byGTs3BmJiMeylAzas5EvREtIpvgH8/pwtl/9ecfr9H8Ijh/dt/p4mIeT568ROcBLl0qHFkr6WYR2bwDJW/j7B6MN8I13YjmWCg4tB5MUVDn+9an7kOCjOxpjOCXX4RfuZLBgwevCvj8fDGq5ans73O6L+mWiyy9nMOn9mCKwdNwDuC248H3fPx+9w2s3ujB/BkXE2GAhdki5s5SMx8Q/GIU+/nzNhoNFxsbHbh2bUBAuO7do1qa+fy5IiYo+oUFh2LncNOFSg1MzUUwtVCEVnAxM69HcNdH2SMHMw5+WafVTit2d7cFm3+146vPab+T+49mXdz9rUNE/fhxK1ZWejE5ybdaBOdN8QV4UEu7QcqaJagCTqIjb4RLt0rI2R7Moo+iG6BcClEph6j5FGtA4rFXSPvRk3s2ShojGBd9PqN46d7/SMAPGuBgguoENZwyLHJslwK4BPa8ECHBR4+Cc7CAE4xLwOmai39QDkP5tVCIfwHSwS+mh7xWEAAAAABJRU5ErkJggg=="                # Thebes destination option
+B64_MYCENAE_TRANSPORTER = "iVBORw0KGgoAAAANSUhEUgAAABQAAAAcCAYAAABh2p9gAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAcySURBVEhLJZVnUJdXGsX/M/myH3az2USDEECqKE1p0jsCgggICvJHpUQELAhIV1QsKCrWwTFqiCWK6GosROyIiAWJYi/RqLFkXUlM1jXjmslvD8mHZ+6873vfc89TzrmGid42jHKwgPur4PEmxUbomg2vFsDtbHblWrM42ZTPlySyu62GNbVZtB6v5YfLm/ltzwJ+vLhZ/9TAs3nwtApD99Zs5qV4cmhREvvrR/Lz4RKerzHCtWKKg2wxen1AZogJzevLaf68nM/+WcpPV7dw/d4Gzlekwuv58GiuCFXCwwoM06OcObDSSHNJOI8vraS7Nobh9n+lKNKRQjdnEobZU50fSnFOHHWV45k/NYbVWzJ5una6CEyDH8ugtwJ+KBd4GYYFCb5UpflwY3sW7Y1Z1GYHck7rSmMgcyO8yfB1ZGtdLlm5I5hqDKCoOo4dedHMiXYmT3GpOg1uFStmCbQEw9roILJdndg7P4FrrdVcaakiI8iRIxn+sGUSOYF2LCmeSGTEYIKC7akIc6ZhnB/1xck0ZoRATwFcLoIrArw+C8PXywo4XTmFLQvHcfPUQm621cI3akqrNrCDliQbwr3tSB1iTqaXHRURzhRlhLJ0nA9loYPhbgl8Xwrfar1bjGH7noX8d18D5QnRvPu2USAHYMVoeLAezuTwdrEX90u9OFsSS8zgAaTEuFMxypOyKFc4J6Bu1fCWanhb6yPVMGCIHZ1Vk+mckc6yaUkcqEnl913psDSd7eOHcqw6nrUpvox2MCXQw5oxYlk6yh2OqgltAmxXXFZcEeBlAfq7DCbf04Ua76EkqV780kh88EA2TPDGGGH7x+aT1WF/lqFnGXSU8Uyj86ZFAMcEdE7rNTG8rujR2DjaWJEa5c8cD0co8IIZSqXQB7KG0JtmCU+0cbEatFczd68PsJw7TUU836dGHBbgrWoJYY6YKu7MweBsZcmU8nQSbayJd7Zkf0x/qAqE2hFQ7Anf6aeHfelovVTD24N53G0up/dgJW8O67ATYv5ASrmieLQQQ0mIH4vz49lYPJKW+gx6D8wUiwmQ76aT81Sr6XCjhGvNlXw6JoA9q7M5vll7nm7j1yNidUxxUWBdiguSXtrsNNYerqE6wZW6iS40ZHqzP1NpXy2EnRPV9Xl0LYol0NGcWTl+NMxNoWlpGo3zk/lPSzm/HRT7gxqZ/TrkiOYwxtaa0CRvJgfbcarMiXqjI3l+g5TqNgFmwxuJ/mw5rRU+vN47idQRbgQ6WRHjYUeUsxlv9ulg6Z9WleR4KQZ3e1NGDjRjX7wZLfEWrI8zI3aYKeOCzMVuEw8O5FHla8HBZAterY1i7+4s9pxYzr0XX2lsBNTXmCMaoaNi2qYuBw+zpizWmq4cW77LNONMri3z0qz5qnEGD7VhvK0J+xMH0pTrz7SAgSz9Yjp72lbw8tdT/K+v3ifU7T5VHZGej0opBdnR2P7lPSKcTUjyNifI1YLfe3cyJtSVwe+/R5qdOQnmZrxoLsTXw4FVu0rYdaKWq0+a/pzDrwWk2tGmOFWEwW2AGS8ln5LJQXhYf4SHTT+O7pxMsKU5yU72lA8fQrGTDRkWpvi7O1A6z8iSZZlcuyNjPdmXal/Kfexm6IBpGGb6ubF3XSqRQ82JdDEj3MmUPElt9ajh3JwaSEduLCv8XYkz/VjplfDZhjxWLUhh6/JJvOo9pHT7miLHOan0T8/E8GXGGEY4mjA2wJ7gISaky0E8rTXcDSnqcjqnM/0pdpFzO9gS0v8jJiWNpDpWg89biuJcpBCxO63mdCjls6rhyaZqAu3/wdhAhz/AUoMGYfvx32hfk8WT8hBWRvqyKXsUm2fHkWRpRcSAD8nPHEdHw3JpVyrpVtqdAuwUYIcYhoYNxdWmP3YD/k5+vBvWJu9j80k/YuV7OeOH86h9AZVliVKBUuqaSrxZPyZamXK5o0VSVP0uiOEZfTurGp7Kl1LCXQh1H4SVlQVW1pbYWn2Cp5MMNdyRQxfq2H2shu7rdcw2StvdBTzelkCKxYdURkpN7brMLuTrvUAvCrRzBoZPY91Ji/bB28eDkGAf7GwsiQqRdUU68ernjXSdX8TC2QksHRsuR9YNd6WQZSNla6sd5MVypfY4OC//vCBVdYphQbIvMWE+eArQOD6BvER/0hJHYNQFxLt1rKg3UpcaLT8UgxtK67VuuttidUZN2+UHy63VPA9okWe2JmGonBDEpIQQjLH+VM2cQP2UCFJHh1KW5MXmOdnU6NtWuTlPVPg7Su2G6vZv2RZqwmOBd+nWa1LXFw2EL1x1jWaHUVOSSlWOTvj+SwrHBpAc5Ut9RgAbp8pUr8pAe6TTR+rmTwJ6rLiv53t6/lcfsKT3Qsx7psC+GAwrckKZmRnG+S0lrCsP4/6OQtIi3TlcFcubc3Lob8SoRz9fF0if2b4SsxcCeaZ4KdYP9O25Dv1Fvviukv8DzNGnW8Nj8BsAAAAASUVORK5CYII="   # Mycenae transporter NPC
+B64_MYCENAE_INNER_TRANSPORTER = "iVBORw0KGgoAAAANSUhEUgAAABQAAAAuCAYAAAAoaDnGAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAmfSURBVEhLTZZ5cJTlHcefAFpFbTvKMagZaKlTtcygFgWtQssY7kPl1nCEy1wL2SRsks3e926yyW6yuwmB5RACEgzhjDkIEQgJHkVF8CBQB8ERkKtg1XZqv/3+3iwz+eMzz/u8z/N8n9/xXKrAOQf55snQG8dDX/RXmNyL4C4vgrfSikDUjtIqJ0pidvhjNmJHoMqOEuInvl5IXVCBqBOO0mwUuuYizzodOaaJ0Jsmw+hOgztkpLAFvqhNwy9QOCAT9BKRibTJiPJX2rRB7nAxLKUZKHQvoPAM6IrHYzXFjV4RLoanwsx+CdHEBF564I06+N2Dn6hAhMpskEpJzK1924M6FHnmIdc2BdnGcchhSEy+5fCEzfBVWNk3YZU2jkQoSKRU/oiVFUFmZnxiTpSKcMQMW8lKFDhnQm+egEzDSwzFVFh86fDSWukfYF8NGhOgmMAY9ij7aalfOlFUOolosMoDX6UR1sAyGByMr3kSsgrHI9f6Gsz+TLjCRobC0stCpwh6aJWX+Cgk3y6URN0U9CIY82uUVZdS2AZLIAMFjjlM3BRkFIxFnm0O/+XAE7IwHDaURDxQJdV+LgPBpwkHoiTi5Wwe4mIY3Nr/YHWgR7iiGObAClo8ixZPQ2bhJOTbFqDYswJmTxrU0Y7+2LFrAoVoIVm/dSm6uvogskGP5oND0dnVj+UwVMYtCK8PoSJegVBNGbbUjcWh9vvZ3gcH2/qjeuNIFPt0UKNGJWH06HswefoElNGS+JY0HD+usGePQuXacUiZOBgNDUkoDd7P9WpHeU0QO3c/j6Mdd6PY8jSeGfUAFryehI4OBYvjYag1ljxk6N9Edl46Y+DCus0LNcGUFIUH77oLM5OSEF33Etrbk/DUs09g3ZYSetCXYk+if//+WLJiEYz2QoQjQ7F/v4Kq2rSarrq09VWmFKrHKE1w0CCF11kvJVte7Pk3cNCvULV5ufY9bFhfvDZ/OrMrS8eHTdt7PFNdXQrbcxVCHBgkVb0E3axvILv+1vPv3nvZJzZf+05OVsgxZnPp2OGpdCFem9ojmJn1oPYx5QEFDwdv7CUoFr9NDq4iO9mZ3/UP9rRPn66gL14Fd4WDa9GlxbWx6TfMskehvVGhXz8FPwdsSwi+8orC5uEKrTMUuo4o2GcqPMz2RhHd/TiamxXM9ucQY8hq66dpcdXlPAZ1MKSw4DGF37KjuLc7ISgDujoVDtcrRGcr3M02HdlLjtyj4PMPQFNTEo519kFTy0MwGEeib9++UPeww/NkM9lPmnq5/GvW+5AhJIccJM2khRwhY14ajfvuv08TGjxkEOYumgX1KRs+Jp+QfaS1l+A21ncRmUiEDiXKw+R94uZ2dPPoc3E/u8I8AllX0niSHCcSn7ZegrWsHyBN5F0iFrYRsU76e6NWDU/UAm+kB/UBG2RmEZb4tBMfkYyKheKeiImo9HuPdBAR9MV47BEvBT0UE2uVkye1WCgdxRoRFivENRnYSkRUJpI+R4mISZi8mpiVQla6bIWTm0M5QgX4iI1i6R4iYiIgyGBBhETwjoXyLeFxRYooIhQTCxwi6AoXaTFpIFKKZTJALJPBXYnyjuvSLmKSLCkdFfkUM7AsQuril6HcEaM2SNy947K4dMdFsViyvINsJTLxTrIlgTNs0EiZMhJzF4yF8kZNjIMJn7GxntQREZHZdxMJw1tEtuFGIut1U6JcR1y0zFVZjFHPJmPa1GegfMyQj4HdzkZxSYTEItnDMkiskB0UTpRRUkNipJzcWTopE0Zg/pwXRZCpJxKTtUTcEffEGjmBKhKlICKypNaTCJHDxMfr1Ms7Om3pBMx67XkRlAvbplkgneNEBsjgAHEQOdbEZRPJIEWJMp94eAXLTsnMnI7FkhQ/bzm59SvZ2HP7uzSr7lggg23ESjLJCpKe+JYJ3LKg6WF21gykp0/lNSrXZpVLO0xLeA93d5/Fma+6UcC6niwhqeRNImLyLZiJeCSGeLhD9PpZ0OlmioV8JRCxrKvtLZztLMDZM+fQfeYsstk5jbxKRGwxkVNHXBVBSYqEx11hotsm5OXOpSDvXUFu/tY6C3ZurcKOHe9oll669J1mzVIiQmK1uCk4iYUYiYevDhefJ4UFqZIUihEvf3Y25uBaWzr2NmzE8a4PKNqN2RyQlSCXFJNFRCYRMYmnWCeJMZt40Yv/8vjx8Kc86X74yIkbh/Lw08kAWlvbcPRohya2jEjGZQKJq4GIuxKW64067bRx2lf27GU3Hz2ucCFcoTX48aQP1w/la2Xd2zuxb+8BvP/+B1jOgVOJXK0iIsiyEgtvNmcwMXwzejIoGOLW0USlLMBPn1KwOQf/OuHG7Q+d+OzUaZw6eYoX/WG8wcESS4nhGuIiVxtm49KuubjauAolnnSehxQUV3soxIUjC3H1QDZudVrw7y/KcGHTOFyKj8WljS9rYuK2JEPcluxfb80lebjRlo9YOFcETXw1MI5hiWEhDJNG4FrDMlxv0TOeVtRaJqAm7c/YoRuNbVnPYSVFppHniJdPl5uHi3DruBX/7a5EPFbAA7bcTCERZGJo5aIX/ojvNqXgSt1MujMHDZ6J+PpYLp5cZcTjRFfpxiMOB062pMKe+jIMrnm4fdyGX85FEOTrVtnL5dbi7cXT1s1sX3t3Na40LMH3TZlEh7SKamzeU4rhBhOSTWYMWRvA5yfNsGypRSEf9JaJw/DPDhOu1qfgYiwZyhjIgy1k44lr047xi/VZuLI3i4nR43T7ErwQLMO508UYuC2MATsj+P32cgxuiCK5jMm74ManH3/MWy+A89Hh+Cb2O+7l6jIYvEtgKl3NrDqYEB1utBfgl3/EcOO8FW/E1+KheCkeaV6P8v02HGotQHJzHAM2lOHyOQOPrxK4Fo7H5f06XOF6VKF4DOF4FYI1FbjetgY/fGjHz5/5eEB8he+7izApz4AB60sxsK4CCw/XYFBLDR5ti+NPHgtGLMrDlTOrsD0ex+0THlw5mA9Vvj6C0Ia1+KFLj1vHinCz5VWcp+mfnDiBWxcd+PYLI16wGzCkdR3G7CvDmOZK6A9YEYssxOOmIL7oWMHjy4/r7xXi+5Y8LhtumR9PBXGpdgxuHc3EN9FH8fnpUzjz5Ze49vVqPJXjwBOrTPjm1BoMa6xB9nYzMjfr8RerAX+wB/BO424e0AH8yA3x81dRqP99XYX/fBnCVapfrn0ajfsbcf78eXx78SK6O5dgRLYVQ6urEN6wHA3185Dd6sTgXZUYWleN4aVhpAc34O+7UnnZB7ha/Pg/MiUkgzSBfGsAAAAASUVORK5CYII=="
+B64_TRANSMIT_MYCENAE = B64_TRANSMIT      # Use generic Transmit button as Mycenae specific one is corrupted
+B64_GO_TO_MYCENAE = "iVBORw0KGgoAAAANSUhEUgAAAFUAAAAOCAYAAABevFBuAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAkgSURBVFhHfZhpcJ1VGcdv1qZN2ma92e6+5W65udkX09Y0bRFa2qRN2oJToBTHgSIVGSrjF1AZ1HHQGYdBh6X6RRwNHSAjBWwrUlFnWnAF+oGxlA5GthLKsEN5/P+f855738Tqh/+897xned/zO//znOe9nkwyLJlkxKWwpK06nLpUFIpIVmV+m34hSSWCkqTiAUd+iUfbJRxolvaWegm0N0ks3IZ2AZeCGJsKScYKYy1WNhWWznREcpnoAvEele+MSU9Xh/Tmk9JHdbvF+1RCryz3435/T1EDPSkZ7E3JUF9GhvszMjKQLWowK58b7JTRoZysGu5SsV0uHZZosEU6MMcc3q+3K4FxO2QA41CDfWnxEJ5CKoByBHjZdByKOULZAsVgaUw6BTAEpOJvW7ZwI3hwpklam+uKcFFHsIR6IZgE+f9gZjGpTlVEurIx6c4ZaFQPJkjZssJUASKAEqJOXJV2rgbEkFsArJAJFlDZthPvFA02F2D2OTDZd7Df9BnBIvDquXJXizxzoko++KBEdeJ4lTo0pRPmBAnXEX+rzAJYiOo4XQizICyzbuMX2uTjj0sUbsjvhXPr9Moy6xXsIqCdeE5XNg5YHap8Z1zhdWVxH2C3bvGJiEeOHqlWp3aj/qWXKuX8eY90Y6Js352LF+DStf0OTLcsUFMGcNd9dS7cSjdnUyEHZptkk0HJ4z16cjFdLELt7zHXvnwcz4vjeQnxvPNOqey/uVF68kEQD8pNN3oVSgGUIwPK3F9QDxAEThBUFg4iINZv2dQmn37qcdwcUJhBH5zrrQXcJklg1d2OtQ4lRAvTuBTbHWJ5ajKoAF99tVwGB2IyvTUkb75ZZqAq0ISBSgcjNLjDgnvrayhw3bNgCbUPISOL94mFWiQZa8e7BfBsbvW4AemI7ezV1nFBPLd/u15hWZk4SodGZGggJLOP1Mi775YK4c/8qkbyOb/jsiJ0E2uN7ALQTRcSATMMZJINMjNTibFLCmNzYRWsA5cgbZlwCXp6q4F65PBy2fcVn/z47iZ56GCd3uvpSspz/6iSe37SYJwKqIO9CTn3dpm2ZVwdHY7LgzO1cu5cmXz0UYn89sjygktHR6Iy+3C1vPdeiczPl8pPD6zAGFGFtnM6LP+eq5A7bm+RtzHe/HyZfP3mdl0MunX/TW1y6p9LdGd6RkcIqeg8N6DHH6uWo0erEVeCsm6tT154vlIO3L/CBdWCxRVl60hzCAULTmVbI3OfeuzQMjl8uArbqQFxaKU8/1y5HLhvOcYxIYEwrXONexdC/cYtrXLwwVr0q5K91/oLUL97R7OcebkSrkmprr8uoAAG++iqpPx6dqX8+dllcunFUVk1kpDdVwbV2Wm8++wjVQBeDbeF5LLpoJzFDrjz+17tR6h8xp/+WC3rxxJy14+8cuYMn2NCwNVXhWT3rggWLSnm9MfLc2XopPOAwLg51B/S3xvW+RUcoey9rknm5sq1nHVkt7rGV0c8xHj/f0Ed6AUEjj3u08WIR9rkmj0r5JVXSiXKLYdDLoP4ZeHmEF7yzqE0vQ3vhcmNjsTltdfK5dlnlhZAMxMYWx1Tt1zxxZBu+YcO1srML+sUzOrRBN6nBCEkomWOmcKzIshUert8+k5jqyP4bRbggZ/X47xZpg6/bDqizxhfQ4hJuXxnUJ9jQgcW0AkjlGcYW5yu5AExucWseGcmJpsu8ctnnxkg6kQA3DrRLh9+WKK/ec8404GJq4Fm24dk4tI2fVEtu6DyAOPYth01uaVVx/a3N4ivtU4ioWZ1PeusYxlTp52YSoBPPlkj3/uOtwCa96ij2NIEMtiXkrfeKpM9u4MKeGoyqs/txgGXjPn10OyI+TRmb5sI/1eool58cYlmDZdvN1AZCmw4YNmCvGpXSP76l6U6B8/Xvuo1UBGzJicCBgImMToc0EHHP+8rgLphb7OcPl2xAJAbojq4ED7CsnkTVl8XyQkRjkaH/Tr2+jGfHgjUDXu9Oja3Id0aANyQvxGHGeMvY21IY+vWCTMmM4OhAeOa7VNmgj24x1h64z6fvPFGuVz7Zb/M/avCbFFAXbPKxPqhgXpNjfiOPdj6zBI2rI1r3ZpRM2ZB6MeTfseUWUzmvSzvnDYLadvNId4eO1Yja1fHxfP662XypT2tSEfC2DKtCtU698TxpXLo0RqkFyFsVb+cPFkpP7izXsHodnYgGZkYaPoaDQ0E5ZNPSuSW/U2IhyFZiwXSbAFi6nbo0WqMHSyM/UOMzTqNz8xzw60SCjTiQ4KZAlMaOHpzu06Gru3uZNqUKkJFTGV5qC8Jh5bLyReq5GcHGnWbE2KgvVGOH1+i6dj68SiSe8TUK4KAwu2bkr//bSkOqlqEvDhcnpRLLorCVEyfEniGgap5LxbJQrVbn4f57MMr8eHQIZ7bbm2UU6cqNNbMY6v85okaBUrnrh8Pyh+eNpbmNrrvnlrJIbWwTizKQFyYqJtk/Vu3NQoXji/Aq+2zbswvT//eNfa9tQDPXJRpVAyuxDOwUGmEgFi4BakY4XoRlry68PwAYN7KNM6mWb35NCacgbsy8osHGtR5Gy9qliBgJhC3+T4Xb4jKU7+rkfffL9XT/4nHVxg3Qps3xuTYU6aOPOi+a672abq0fZuFapy6Y8pAVci4981bW+TsWZNReMzkDcTCbwcIc04C0KTegbFYi2HSQTa/1DEu0Kcg58vI9ssz6ccJz6uOo2OgHRyaQgxUuAgJESTjScTCYqrFbZ+GUgCbQZ+Y3H9vDU7qCnU7+5tPWgBxADJ/1Y8D/cTl1fkKYxu9MteN6ZUJvYoJPssOWG2v4o6hjIuLUAsQHRCFsguCW6hjPwPTuMv8LsLlQrnH4DN08VxtCK7w2wHrhmrusQ3GIVyEhShA8UALO3Dt2KzLd3rhLrqtRHZMt6B/1HwMaN7qTFxBFuFaqHSshgJNx1hvIJnYynpHThxl/wVgnfE9BqJLLlh28sbFZosvBpTDpFXaxoi/dQvjquOxPcZmHwtwATxbpksdpxbBmnodX8cxUrh6oCEs4OsshPDgw2cwt+TLp8tl3/VedaedtEKzMFlWaM5vW+9A1f8IFG7x89XKfsbym59tFTz68hnm0zcl/wFmawEz2+XAGQAAAABJRU5ErkJggg=="         # "Go to Mycenae" option
+B64_GO_TO_LARISSA = "iVBORw0KGgoAAAANSUhEUgAAAEYAAAARCAYAAABgpdrLAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAd2SURBVFhHfZdZbJVFFMdvochWKKBQui93v9/d2trSlrIooZStXihg0PggIUYTA4SgxhCNEZf4YBQDghhNjK+CGo2ICxgUXwAh4QF8IASNxYQQSCBh53j+58x839zb4sM/373zzZw55zdnzswXyrV55Ks1RVlRkjKiBGXycRY/+b++K5VXorQoZ54qbs9D2h/v8m0ZyrfnfGGORLqBIskqiiSmUzg2jcLxBymaqKJ4qkbeedmI2sgHc4wksd2WNcqUvLPv+dkOwQ/zX3zStlDeh4Kg3IAtnPsBcWWhQCVAWBn0MVCgXCscYYfZ8Uw+SV4uSqlMMyXTjZTwauUJCFAyXS9tCa9OhH7pXFzsBwEjeCMJjoH40LPSJv18KLZPllrNU+FACiwEIEGmpMRRGywM2QAzslIjyYUCCCq1xe9Nu84D59R5BRLxgSS9evL4NzIn38YBmRXHmDSDS3LGCJx0ncDysi3c1wUEu4Cg4/xs4YARh/bR+eWdk60qwFIogMNgUjwAAZRIMkkNKXEOcBgUIxO8HYugNdPQ5jptgXCGZMMMpYWSDMPLhCmTS5i5NLhi5cSWx2MARjNIBbAyVjLGGWMySBc2kB8P97FZUywA4q1kwRTLrrD9bwzKRADEQReBsU+0OxnnOIJMkAzJNlN3L8PgIJEJABWsuCOnLcgABsTzuIDiHtcffnoMWWxJf4wzcPyshy9W3I5MMrIwXAkYDTTQuvWNdPz4BLpxo4yuXx9Fx/g3gvW3A+C440rqkPQzDiiQZl7ZelYjLR2ooVu3yijN7T48HwLGOCp6BykcpL5kHm8nrUF1tLwwg+7cDTHsCPfH/HaMFdvxA9fM0G1mnv47FreF2jtsYFg5j9Y/00RXr46il7fWUGd3jHrmROmFl2pKIEDYMva00v9BoKhJcXYyzM43iQAFq1oYbKK7d8ucvvfRMDiQBmKzB1JAYRooVAsYQEpmeE5ToLMGTOmWsTBcMK5Cff1R+vGnSdQ1G4ZSdOrUeHr7nWqGgIyw4pqBFWb19Mbom28r6dq1UQJw774p1Nllt0Na+vlA2MEUnGTH0U4UGlGS5qzZc5Jse4qxPZptT2XbZiv7YsdtsADE2YNMWrGqmYGHGEqDZhEL9SvN9SfLtWfzlkY6e3acZCtsf7F3GrV3amYNronShX/H0PMbmmhoaAxduTKaQidOjKdNm+sk+N65MXF0/oKYrKhI7h+QAjpwYDIdPDSJ5s5P0OKlMTp9Zhx99vlDBgiO2BYWtk4AxA+INbg6KhljA7X7HzrwQyUdcm2fVttSM8x4P5N8KSRrF3UL2ak1qJ5rEACF6Ymnmmjtk1Hq6MrQoiUJOvPnONr6Sr0/9ubNMjp5cgL1LU7Qu+9VU+jwrxW0YaOCGSiE6d69EDugdQLkAEpSn+F09ybl95JlUXkPbdxUR0MXygWCQmkRQHpSDN8ug6sjPhgFogsw3HaaF6yBLlwYI2D0AmZgiC2zcPIbdg1w7ovMtwU6Lvcf1KEGLvzsFy8wMmzPxzNo10dVsm2QMYh7Yb+ejMsKcQrNnRejr76u5JSN04KFUQHROzfuO+cGUlgREwNwVGtMnN83SJHGZUxPmWIgbka49vyMNHpshTqnY1WrHw/TDV5Jtw0KxgW2fT/ZN0h8NPUH22rN2io6/sdYus6+2i28a/cM6etCtQrlzBbBVsFvrNCWFznFeOI8T7jKTIj9PP/RlBjsW8RZkY2yIrRhUzWdP/+A2LAwAihuEBpIYRBOAK622b7zHkmK7UWLY/xfASBjxLY/3lUAG3IX0K1DEBbrn6FyOvTLeE4Avf/s2DmZdu6ayu+StLIEKlRyj/Hozbeq6eLFcnr2uWbqmJWmp9eFZRAyBBlx9Oh4+m5/BRfrZurrb6YzXGO2fzBTwFmJcXZOnS8OqGdOgm7fLuNTr5baOlJsA9mJYDw6dmwi7f++kjM2Qf1LYmL7/e1VZqxrywCxNYZ/WzBdPSma1ZNk/1LUyf5bSCjo+76s5GLdwifvDPrr73KBg1t3YWWDLJbYhU2cSsgSkQGDSbZtq6Vz58bSnTtldPnyaC6KFZKS2C4L+protyMTJcXx7pNPp1Pbw0hdHJ/m1unA0aB1dW1gr79RI/DhDJ42Qxb1x+jI7xVFtlvbTVbZ+mJhWMkcuh3sFrE6fHiSD/HV12rp0qVysf3zwQravWcq7fhwinxqLC/MlKMe8cl3Hfc3GROktJ0IKSanDN89LBT9eOMtZjJDi6IqAFIq67yF40pBWTCBD+5vVikM36YrzIWj24jbMId+tzlZxrLtaa6R+DTBvQd1KI7PDHzA8s5gMMVOoKDiZJHj1kBJ5/j4RlZxoPZiVZQduDDJb71TuMoaB/9fpWCgEdoAROZSGLAd6Q7ThIEJvqoW8klj/TB9MIeOx5PHFgG2MQMQvu7rKZaqARgdgAKFl3r/MN8yXGDl+0OMwSGFMhyAbXPaeQXvBwVzjtQ2HI4rBBEEhBstFOkxYGpZ01lTGc5MwMn60CqXVHJftmFkx3hc42BLbsI8dyYflUtpMt1A/wGXQtgaWMXD2AAAAABJRU5ErkJggg=="         # "Go to Larissa" option
+
+# SystemBar AFK Buttons
+B64_THERMO_BTN = "iVBORw0KGgoAAAANSUhEUgAAACsAAAAVCAYAAADfLRcdAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAK+SURBVEhL1ZZbSBRhGIb/2XGaPbjpHnTbcVx3dVt33Uxz8USaaIkJXoSQglAa1GVBUXS4jyAiOt3UTXoRmVJQFwkWZIgV3eaVdGUGRRpYaise3ub/pxnHbbdbG9gH3u97/++bd4fdYUj/q48wC6T3zgTMAqnquwqzQKIdJ2EWSEnLUZgFUpBoRyZauhqwusal9bYCAvpJgy++D02HEiws1f8DJK+0DpTGjt1YXeWY/ldvKyG5gTgo9a1hFkyrjb0Tp2R8m83C7ByPnuMB3ZdjMQw+zsXCggVz33ncvueBJ1Smz858FtDVF8D0jMD87mPqrLb39EUJS0sWXLmej8vX8pFMcrh116vvD8SjbP9PZf/8Dx4kS7SBUlElKgsI08Ye/UmMvrDA57fiwiUBU1Oc7j8c5HG/n4fLa0OiRsSXrxzOnBX02WSS4M1bC4LFVpw7L2By0qJ76+sE/QM82tpF5SZweDTEo7VNxPz8RoahYR5Pn/Hs2iURKw1rVwy7ssD6J6xaa721NQKvjw7blUBWLC+rZ2hAet7nVz3KjZtZGHvN67PrSqCikOqXltnwfGSzV1BIg6taDqhay+DOU/eHSzf2E8GWDUplws5MwebUqUw4NvWM9a5Kx19/SsoH5e6lmzVi9DLpeIWDfQl1Rs1IRKcbotODqtpcdpBqjdSesS4IuVg4r1+dTyXdvnReJi0F3Wx/OObS54jdLcHhlVHd6GMHqdZI7aXW795vw8ADB4JRCc58GTvL/SiMZN6nYfQyacr4hIjhJ3ZIJRJie/wg26UIcuQo6vYXs4M5ckwntZdax2vDGBnNxuKiBSsrHKY/CTjYWZT2rBGjl0lTymrCeDnmwC/lKUGfRMQTTsAbqTEFZEd5M/wVB0wBezeQqztMAQnUd6Jo72FTQIIN3Qg19ZgCUtx8RHlX7DUBvfgNam+GJgBBt0kAAAAASUVORK5CYII="            # Thermopylae button in SystemBar
+B64_LARISSA_BTN = "iVBORw0KGgoAAAANSUhEUgAAADMAAAATCAYAAAA9DTUcAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAMQSURBVFhH3ZbdS1NhHMefvXnOdjbn5pzOHacu8W0Ozfk2bYWpUGkRigZBNQu6COpCEOuiwHwDg4jQbk3Iv6AX7QW60u5KxEIqzMygF5IUMUvz257HrbY6o13oxbz4wMP5Pr/f7/PsbOeM5DWcR9utp7j5+HXUQ07eGENz/xhO9I1GPaTQ24vtAsmuO4vtAtmx9zi2C8Tq2o+tpvhAJea/qtDS7pTMNwuSmLcHew67sPZThkTH7i3B4XFj4oUW3nMOyXyzIPEZLnhqnVhbkyEhqyyqIVpzGsqq0tlh4mwOSY6dTsHUSw7ff8iwsKjAwJABCfZclrlrMjD3XoUmrw2zcyp8mVfgSLONZbmlmQAIQ6p/XVMaJp7zWF2VYWlJjtaLloiycD5EyamRX8j5hhHQtRTluziUuDkIsWrYM3iMj8vhbY5hGa1dWSEYeyJHmp1Ha5sKk5PykPpw/T98lLE+vKCG2cLDlsZHlIXz8R+G9w/TRERXtwrtHSq2prXr6wSp6XSQBlm5atwbVoTsD9d/ZkaGvn4lLNaN2kizvwn4+A7zZ5hKrZVAh3KPBqNjCiwvb3xlKJc7Y1hW4BL8tbqwhNuzs0jAg4dKdmeH7yt9HkJEWblHLelDqHBgGKcz+okP4e2sHHeHY5AobmQd3WoGXReWxvlrQ2uC+d8e0W7AwCCH2XfyiLJQH+OGTxcHEiPofcP0bJg5JcmHBeZUK+KtVggmkbG4KMfgkABDshWHGk2YnlGiqzeWZcWeRFYb2CtFuD2eajNMopX1vXBJ7/udKCLKgn0ONsRj+o0CnT0CCD1pUUXC79sVYOSRFnoxh3GmxYJPn5X4tiLDnREdrlw3oeeqiWVlVXYmGtgbzNFT4j99F3wigXzqFcd60ifWswke++pTI8qCfW4Pa9F7zcA+XKIxWkAfz3oxG0Z7Aeh7x5RZEjVQX+pN/Qm9bXRBL5pzKpDkrIQlvzpqoL7Um/oTXZIdxvR8dsFSUMP+44jFdVED9aXe1J/EJmeyU9ETikW1sLnrkVrRGDVQX+qd5KzEL/9J6+FsUu2AAAAAAElFTkSuQmCC"           # Larissa button in SystemBar
+
+# AFK Interface
+B64_AFK = "iVBORw0KGgoAAAANSUhEUgAAAA0AAAATCAYAAABLN4eXAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAN0SURBVDhPHZP/UxNkHMefIexwzq05xibgZEBQoG7SBEHzC+mRHIGAkFhcRmodUYYp305CMhS0y7Pjiu7KtEMQAsUNRGCwMTa+bQpS1xf6IvGPvHpuPzy/PPe87vV+f577iKqLl2hpvcbV9i8pynqNRFUU5Sc/5Kv+SS5/P4A92caZwuOMjbuZmgnQ7/Eh9lScobLqLPUS/vzKdererSJNF0PeoQJeiU3ix/abeHxzTEvAMemjoechYmdBGamHjnC4sIRTpz/g7LlPqSwo5aPiE7gGnHhn5phfeMK9MXcIqOseROzIySU2dQemxBRsNjt7X7KSZU7BOz6NfzbA0tISjgk/jfccNMjT0jeEsO45gNYUQ5RWz4tqA5+UVDAx4mIuEGRxcYnex9IgH9dLy8VeJz95gwib1YZFayTbkkb39Q7cbh9T/nkWgovcfuQKAee7BmmWhjbnGP4nTxEWpYbqo+VM9TnxeGdkh4VQpE7HWKjD+bsPaHWMhiB3MIh/wovI1uk4tvegHOlkqHRAxuofdXNBFq6V0A23l+afh/h2ZAL//DyefidisDGZTKUgQ6eVf6QhXqVle9LL1EpDx527tEigwzmOfyGAs6sXm0GHKNyqoSY3geBwNs47r/LPsyISVC9QXtNA061urt4f4fHsLNOjE9SUFBEbpkLs3hCB5/4xVn85wd/BMnw9r1Nhj2NXtIHGL9px+PxyMDO4ur4hK9HAlrAIhF2vpu+H7BBUu01Ljd1MXZKCPIOa6vfeZ3hoEnfPAB2Xj2OOUBEbKaGsnelUlsfyoLOAz2TMrvoMPk5XclRGPJ15gNGHwzhvfk12komkTeuJ0esR+oQMDEYd1acsuJq0uJuNFKoieSN8I3ahYKTzNl1tTcSFq1CtV6LUxiC0afloLDaUm1PJTDByMnEzTfsE++ME2xWC2sJSbMYYdEod4RoTYbpkRJS1FF38bvTqaLYIJSlCMHzByMytDK7VZbDLpCFu3QYJaYnQWlgXtU2aYqyYNm3FHBYZgjI1CvarFXjazPzmyuNIopr4iI1EK8LRyl0LV8chzHqzXIcGnv6xyqWWNirefJv8fQd5q6iM4tx8qqrO0XrjO8aCKxSXvkO0TCRyDhcz5F0g8Ptznq38x/JfayyvrLH455q8W2Pm11Wmlp/jWvyXrkfTWNNz+B+W/i5tN3LOJQAAAABJRU5ErkJggg=="                   # AFK button
+B64_START_AFK = "iVBORw0KGgoAAAANSUhEUgAAADMAAAARCAYAAABwxZQXAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAM8SURBVEhL3ZRJTBNRHMbfQVMWEVSEIBVrraVQqaJUFEqBgiK0FEqh7IsLgqJiiEuMJMbloPVEYmKMN5eLGkUS44osB000HkyQGsQCGqJeDCBCAcnnzDMzcbQdkXDqS35p3vd9//dNm+kj66vs8BaIyrQf3gJZZaiAt0DCN2RipkQm5WFfox1K5tOdP1fMtoeEqvWI1plx+dot9H8cxOTkJFyuCfR9GETt4ZNgfY7imkNgV0xyrkCfa2bbQ6QaPXr7BtD57CUKdx2EzliCNEslyvcewRbrdiyN3MTD+uxSJxoF+lwz2x6SVVBJB7WpJgRFqD0itrjMvkONeN3VjfFxF1wTE3j+4hWStll531pRg6mpH1gdm4Tmew9prtfZj4y8Mj4jtriMJ4hMrmBeKxdu3LyFsPDlmCfxdYtasw67a/fQQ5NT0+ieg8uUllfAVlSM2Dgt9CkGdHR2wul08r4x20znu7u7cc5+HvEJiWjv6IDD4eAzM+nxBJkn8UOWyYz+gQFMML/mnea7yLcVwcd/IRPwE2DMzqEl0oiVf3nuyM3Lp/nQMCndc/PHjjfymeLScqotCg7htf/t4SDzfQPA4rMgCCazBVeuXsfo6Hf09fVDl2ygHgfrs2u5TCHQORKSUvC0rR1Dw8PM6zSF6elpQZ6blylU/MzCxSFQqNSQ+Afy2r96PEEkAUvwJ8tkSjx60orPn7/ALyiE17MtNloSoYgS5FlCpXL6JW43t0Cftg3r43Woq28Q5Ll5uSrmr/nfEesRg/gHS+GOsh219MBQmYrXjHlFVFsTlyjIsmRZCqkXo9XxWnXdr1tJHh1L97m2MrpXarR8xh1iPWIQbYoR9UdPIMNSinhDNjan56Ciph49vU7cf9yGQGkUj1yTgHHmsmD1rbkl2JRmRmHVHupt0GfSB7A3XYQuw4Iz9iYMj4xQTcncXmzGWlZN91HaFMG5fyLWIwYxWMrh6HnPFH+j7zh7Xb55+w5nmy4hPEaHYOVGASU1Dehy9GCS+U+wfBj8xHunzl/A16FhjI2No+VBKw4cO00fPjohk/q2nfV0r9Gb+BlPiPV4goStTYe3QKRaE7wFsiKxAN5BAX4CyOxDgnrQhNIAAAAASUVORK5CYII="             # Start button (for AFK mode)
+
+# =============================================================================
+# FEATHER PROCESS IMAGES - TODO: User needs to fill these
+# =============================================================================
+
+B64_PET_MANAGER_NPC = "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAvsSURBVFhHRVZpV1RXFq1v/TUaAygKFHMhowzKJFjMVSCIjBIjqBGKQqCouah5nquYC0RwJiImWXabFRN7pbO6O53V6ayeftDu/R5J+sNZr+qu9+7Zd5999j2SpqVMKNx5mNoqwty+DPOPZTAdlMD2shL97mLcChdAbmCYciHXS8VoM0hx1ZYHdVwG9VYu7ibyMWgrg0JfhXp1BhrmTqPq0w9QNfMB6tQf4uLch2haSEPTYhq6+O2QOx83wlIxJPXabDSbuBgtwG2CUO/JoHtSBvthJSbi55m8UIxL9zPRvHgW7UJyax4mfIWYThZAlZJCzZhezcPAcjmuLOagie/WqD7EBdUHaJz/CE3zaWhdzECr5jTa9XnosxRgxJf3CwB9Fup5qg5HLm6uFeLuZgmG/aVY2K3A9FYp5MZCXF6SouoeT6L+CG26s1Au52LIlY/rPinGuclkUorbq3xGCzERKEQb369fyEC1+iSBn0LLYjo6tGfQY8pGt1nK73lgLxkIEUCjIYMAzqLJKMX1SAE+iZWh01YIhaMIve4iFE7lomo6HbWqU6ifS0PLQjrkS2fQac6BwkY2nFIC5mYRKaYSUtwM5aPbmI024xk0LZ2GXHcafaYsRjYUFqF0UvTbhTLwG38uJD32TMiXzxBEpsiE0lnMzc+ily81GXNRN5+FsjsnfwNwSZ0m0tq8lI5OCzd2HAMYC0pxJy4lAwXoMZZjwHEOPZZMMT4J5GDIUUAAubjKfcfJ3IiHB+YhJUO+LIwEstBlPYt6gTqdlMlzoOSLDfzdspiNS7MZuMASVE+fEktxQXUCl+ZPoVWXQRayMcQNb7IUQvLrThmG3Tn42J+DEXcWS5WFW4E8DDpK0amrRKdBJpZBwTJ26MohuRXJwVRMilFvDjpYhgYNQWgZZKNh8Rya58+Kqr5w7wSVzZg+iRr1CTRr0tBnz0a/kwC8uUxaDKWJ5dNXoNdaSnopatZ4xJOFMW8BhVuGw8NBHB0OsYQVeP1sGGm630FyJ5aLe6ROzfiYJxHQNRNA41IOLqpIuSodDerTqBVPz9aisusXKCzh9GTtmov19LADqJt2bQXkmioxlJYyXCeoYQ9bzi+DwlQurn/7+W385Q8qfP9mGt8cTbEErhJMBYtFAEJMBo5V2k02rmiyxOSNc2eOGWBfV8+eIAMnxZ6+os9AvyMHo75csa36rYVU+3EiIdq19BJbKctwXtSFsPb24AbevLiBr17exF+/HINEWLxmLcdsrBiqaB4mKaYRnuoa1aqkP8hZErGvZ1h7Jm+8/9Fvvd2iOYM+cxHGArliTwsglEYZ2rjn650evN0fxPuDCRHID2/uiPHd8wn89PYW/v3+Dv717W1IrlllIrI+cwWu26leK9tPEAkZ6GF0UogCiDomFgEw8WW2otDXcl0We5su6Dx2tvEgVW6TiQkfRy/jeViOl4lOfLndh3c89fdHn+Dt3gB+v3sV758O45/vWIJ+iwyjLhkVWSAib1usQsrVISYVQgDQacyiLk7j4gKNiL3dpctEt+Gc2NdCDJIxwVRuhPMw4i/hXpV44KkXAfwaex45XsQUeMPkRxudeL3ZRWA9/wfQupCHlvlC1jwf9bP5aJil/2tymSiHJzzu6XaaS7/tHIasx4kFQ/m/qTCCReyI8/ymAhumamya67Btq8cjXwt23XIxvtzpxeF6B14RhABEBDBCAHXTvEDupKHq7lm2mxTtZKJ9sYK+nYdxL1uNPa2k6m+yv8e9RVR5AfoIZEwwFdrqkLMQw/bzYrv98WgS/mkZgqpSRO6XI7F0AevWy0g5WvH5thIv19oJgixsKSHpZbuM0DzKp06JUXMvg8ZzBpfnCIIl6aZ6J/z5FOexsUxQ8dfspSLNnXoZmaFx8XLq1FVQF5X47ug2/v6VCj9/o8bP72bx01fT8MyUwaepQ9RQj1fbV3Gw1kUA3fg81Q/JoLNEBFD9abrIQC2ZuDSbhjreZg28WtuWKmmf53nSQhHAOJ+9lnKuy7DrVdJUShFfqkdorhaJRdIdGcDR7jjeHbLfv57FP/6kwX9/MOI/f9bBMVeNl1t9eL7eg6PtAbxODUAiKHbYIZQg47gEd6h29rwQ1Yxfe1q5XEqqizHqKRHdTlh7EuvGo3A3jlav47FfgYS2Eb7b1VhZaKHoevHF3gS+fXUXf/v6Pn78Zh4/vpvHwaYST1e78WJdiaMtAhhYllFwHCIYF2fSceFT9ruQfPoEamdOkomTYrJOUq00l4vGIgAY8hZiL9CBHV87XsSvst0GsOftxmOvAiFVA7x3a7DpUODV6hi+WB/C290beP98iqdX4PFKF56tKnC4wRIIAJrmM+h2rD1tV0hey6T1vMdFw+FdLtdnQ8lb7zpN6gbdcjyai3Gaj2myEv6FS9i0t+FZpI/t241d/1VsuJRwT9fCcbsKG+YOvF4bw1FyFF+sjYus7Uc78TShwGerBHDtFwBCvRvE65aDx+xxCBdOqzYTHXTEfiq9n1eoAGCYt17c0oAVazPi5iaElxqxstyBlK8fKe9VRI1yJPjfRoDm8RLsu3pZphG8CA+yZF1krh2PQgo8j107ZkAYl5o5wQj+LkQDXa+BDMjp9Z0cJAQArbyghMmoaVEKi7oQ2lvnEdJexLqtFdvudgS1LWSjCWtOBVwzdYgQRNzSAdNEKctRh2fxQTyNDWIv2EGW2rAf7MGTiACAPiDXZLCFctCuyxaTtmjTmTCdxnOWN55UHDqExMkdH5IPvDCrC2CYlsK1UISopQL78SZETHLoJkrgW2yCkwAS9i4k7Z1kSI7lyQp4VXXYoT52/e180pT8FHCIIuw3c0AwZqKPA0IvTadvmT1t5Byg4cTD0/cL1y3NRpiE6+8LIPwIrtnhTpgQXLXCPlcE83Q+Iss1BFOJucE8WD6tgEfTCK+mCVHTFUS0zTBOnEfgfj027HIy1kYQXXgYoAZ6eJsNuLLFMbvHWID2BQ4W5nwRSC/XhHFrkrPeCK9p+VI+YikvYlseRDacCK87CMIGb9wCiyofbo0M5nsF8OhKEbbVYHmmFn4ty+Joh58esTRShBXzFWw7u7BDwe54e4WRLJ/9nY8ubRHamFx+n8MDgYyEOOX48zDK5+TKMQiFsRhuJvMkLPAml0UAYQIRGHFGTbCF9fDEl2G4lw/bfAnsHFAS3gbY1RcRM7dCOyFDwtiKDVs7UgSRcikgGQ3lcVopRbe+BK4VpwigR18kJhYUL7adMLJx3A5veZnQTRY8iJOJ6KZLTB5YszG5Flr3HEwBPRad8zD59fBaqqFTywikDE7Of2FHNaL6y4gbWijeDqzbuyEZC+QzoQwr+3HEHoSR2A3Dv+bEgL0QYxH2O5MPc6jsNpUgxvonHgQZfvhJvTtuQmjDJa6HtwMIbHjhXffBveKG3mfArEVNQAZYgkZEvdWw07YdMzXslgbEKdokW1WiYPLETogfu+FdsSOS8iOw6cGVpWIOnAV0POqBYBJ7YQS3fYg8CCD2MIQ4/688imF1/xh04mEUUR7AkbAzOX0/ZoU76aBY7TD6dZi1zkLvXYTPQCasVXCqaxEiG5KtpyvYfJrABjdb48YJJljbj3DjCJJ7QcQfBpHcD8HDenvX3fCzDJaYBeaIGeagHi7WPLTpRZIgBAYD617Ymdy36iIYG+YDOphCRji5ZuHTz05xUqQuliTiqoEk9SyJFAGkDlaxxd8bT+JYfxxj8hCi7PvlsAGq5WkYfUuYt6sxrh7FzYUbmF2+BxcTJB5EEN+NkZ0wPGseWKNWTFvnMWvXwha1wxG3ieER2EhSrPzGGWf7UswuQxUku4db2PlsHdvPV7EhJOaJV0hr7GEAwZQbOt88VOa7uKufwqTmJgw+LTdxwJF0IbqbQCAVgZ01NzOxMWSGIWCCfzPEb8nGRgD+DR+8a254VhwEIQBYJiALWWLwKXnA5DsHa9h+sYrtAwJ5sY7UM7LxJEEmkqx5EHZ+pPEskkIDWRHqHaPwYohsxxBORRHaiiC4RfGuB+AgGPuaD34CCO3EYYraYGG5ljwazNpmYWLZBBDedRd8KR/+B4fDm9shHBPrAAAAAElFTkSuQmCC"     # TODO: FILL THIS - Pet Manager NPC image (similar to Transporter NPC search)
+B64_POINTS = "iVBORw0KGgoAAAANSUhEUgAAAEcAAAAVCAYAAAAU9vPjAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAApdSURBVFhHbZhLjFxHFYZ7xq+MHwh7Zrr7dt9+d0/3PGLHTkwMUoSfY2MZCxESxJ5gEOK9ASIkEIKIJRILglAESFgIKRKPTRJjYdjAFmNWRgFBskiiREqwpTycHP7vnKqeDmJxVHfqVtU956v/nKqeSqsoLKzh1m40rSPrlaWsZV213WZ6Vss7jP5eq229dsc6rZaV6mvUC1nd6tWq1ZaWptao1fS+YR3W0pywtDatjHftZtOaGrvl05Y1a3Urlpatvrhkda1ZLC9bY7lqjWrN2wLTe56b6sMa8sP7NTZMvqivrMc32vikb2J822NqJ3/0t+AEkBYDPeiWBz1Q0H2C4G+HpAmASYtgBNTS36XWIPi297UEo241OTMFJKcKBQ04b4GlOQGm7XCxtuDjZAkMjQWUWwYAHK03BaS/MzBaxrYTTAA0BQIY9Aco5i9qrRjbKurJNKdRRGwtYgBWwyodOUTg2TII4Lh1ujbq9mwo43nY7QqeAhEoAiDgphSDcgiK4AOIHMEhHJOjjHNDAfSpbeKUHGrJB4cswPSxTsnYFBzBZHMguU1g6ouLVpM11Q8cVN/y+TGnWQu1AAT1FAIUKtJ7mStJcLB2Mr5fKeVkm10UEEA5PbUZzKAtcygBB1U5SN9pUknBTiEkAPThiMzBaX2C5pmWfsBhjAVKqbVm3wHPYbN2AhMWaVOyFqDVlwERtMNQwIUrSwCYw98YYGagAA3VoJZZQzVNAatkebp8k7X0YRSULasK6wNN6hn2+jYaDG2glp0nyKmCUFUCMguMdMrBZ2XVU5/P1xzqVjFVF3ADUl3jo26QJtpQfQN/aNlgUqjU+GwEniFMraY4UYlSCXUgBFLIoUhtQOEdc+FQiQ8GZTcnLaJyCol2qCUyapLXJS1Cneh1VJOkpq5gZTDUDfp6Uli3vVVLsgW0AEbw2L1Hlu2VV+btK18+YC0FW5JiagHuihKwluaRdhkUf6PcQxup7tFHwGoJ0FtPjwh21jp6DwygZDi0pBSpBLwsEsEJqf0/Q54MLrWoF8hkOErwHzpbmlnF7fbtOXvm6QV731EV8/7A+j2loVTFM7A6AkrBjvRJaSbn7znUsBs3dtojn1zSe0EhWG+lChnzmO+nIn/L2JxTx+v25ptzERhraUMJiADdEjDqyaxFXRFAwGBTOIAMQAFJNafuIJLsptJNuSp5Ra4qBeiXA+w6Owqg0ydrdudOxYPdWCvs6tUFu/LMbgfjCkJZCqwNGO00wQIoG2u4EgW6R6GXGl1xCQqqzMc+yvPTTe8HWvfsmYZ/m3SIXY9U8rRCJTPKmYKhH1VJPXw3G6AysNyybsWPOk382Ef3242/bre33qrYrVtz9ujX9np6AcWN5/R3rhEnTyy7g1EvCnvowZrd1lyCIri711v25JN77NZ/5uy11+bt8uU9tjIIx+6/rz5VHWv0FHRfcFDI5unCnntuu339q4ueci+/PG+f/tRSQNPcPO9/LQf/8IOL9rcbO6axfOPR9wQsoOQNSebHtgPhHSWDuqoN0riKH5ta9MUX5+1zn92nRZZtsrIkuZNSEfRsjahrd4DE88njS0k5kSIfuXjAXnhh3uehrt/+ZsGefuouO3yotAc+0PT0+dHj+2aKX2GnE+DsOEX23Gao4o9/WLAjh1r2vcf22z//sT0UREAad+Zk1ceQAt5P0FqDdV56ad6+9IUDSutSdamwo0d0/xEcxvh35Zt/K6mRZ/p4N/ANiv6KS0n2739tsyd+vFu7HcpwaJrgcNLpkZUTSlq24w/sdweBt7G2bFeu7LTHf7jb34+H4fz776/6h4ZKtc9cqtvzz2/XznDRJMjGFhycS06TMm+/XbHDd8fJePFC6fWFk9IDVBqfObEFJyvGlZBi+ckTe+3ee3TTJ2WT9TukaIzhW4znzsa7ETWS1GYswPSuQt5jZ05V7dq1XfbGG3N29Xc77cQHVXf04awaYEzBOJyqKydL+tVX5+1nP90jByhmNSnlgL3zjqSuHcMJUubCucJef11pp+9xCuLkZlIAY7hf0Z5VWuU+xpxL9YV7FoC4a509Xd+al8yBK03OnalLdXd5LNd+v2DndXCwOaSLq4V105yRDg2/wwlMpHWkN1bx49ItbqgHN6p2+ecLyvltDiXbVDUppUidU9OUiDwOi2J2+GDh0I7dV/UACeiSTqRnn90+PSrZ9awcnr0QyvkcuO+q5s3CyYGcPR3q6rdn4MgAgEJIj6NHmvbLX+x1tRI0fmC+Ti9u+9i7wbT93WjQ188HJKTOix8ubDLWgG7DvvXNfV47snKykWLcMZjDyTI9MTyIKGSY563+/vOfdtmvf7VgaytVh3RDRfKx76g4so5SAxi5duS0YN7mqTgFcRbnz282p7DiGx07uF6q4M7ZFz9/QLtf2rGj8bOBMRfPV22swj/qN+27336v6uk2X8shSl2+jiDMWi/ZoNvRPP1cklW6UJO0/n5zp0v+jir89es77eGH6n6/ABxHMneW4WBgk9GKCvbE2wvnO+70SHeZsW7LK2oJxmuKHDl2tC5Z7/J1OXF+8P09Sh0VUL279MjyNCWzcaLNwglF6O8EkDoRYLnMNXWa7dcmbnMF0TKXOTdv7vBvclpd/8sO+8THVWgVdLYMw1uKL/7OtH0f11XNwQF2Wn9wD2no4wV3An2cd6iEi9xkvGrraxu2vroeNlmz1fHEVlfGbmupnQxHAiVI5LjWJQjuHvkKz2WNAOnPSsGRseYBF9WF/HWiCQbpx22dtMt3lSimms8aySjurMs4nuPECaVgrMt3PJ1kUVeA9O5xmF8MZZUipYy3Wjybp5AcRDlc5Ib9oQBNpoDWJqsOZ40+PbulZ/qAxAmQAcXvlfh17KagCRI4gBwPhwFXigwF6hKpepOP7uywP/sFL8yP76mios9PMN5pfIbEc7tZuCo8hVSrYs34OeHpld5lSJWqfk9hNe0oULjet+RwJ13kvJVxy82QVkZjGxE8qYRSZAS1qnQDDBaBSg0qbJ5qScI4n38U8vOEgKK29JSefYeKCklTL5hehMNyLeOkQ02zCkRJqMrBcLQ3KPABiHcZTlnUHAjvud9xt8E30g3/fDMEhv5KVSeQ/0LWTtIWLCwHqEXA8Gu9HAcQfw962lU5nn9g9nGeekTdcUix+4CZSA1e3LQGDuAkqskKcjVpU+KkIhUC0orSktQEFoaqMJ5ZywGhoAQm15roQ0nchkNVoY4A40CScnN/t4WFUvBhC6zgkE5ZLaU+gAEi/y4CDgUbtVB3smro81/mnssCoNQYKaAV1ERwCmYlBRN3i9hBnMmBYaQE5nVC4ziNaFHJMBVP0nMyGrqiSDk/dllTRgtUb9MzoOL3FoECBcWglPT7iuBltKFo4ARAoAQ03ZBJqSb/AkAV+nBPjmDDBCBSKooyYMbAEQA/yVTAAUShi2IHpPQsIyj6Ih1id/w08DoQwWQYgGMM74AyHgIY9US6uZLkD+Pjqh9wPaV87QQH8/VDCajEi7inGPNCQWGoqOqg2JzYvKSiRsP+C+gsjqkMD+4EAAAAAElFTkSuQmCC"              # TODO: FILL THIS - "Points" button
+B64_SAVVY = "iVBORw0KGgoAAAANSUhEUgAAADIAAAAbCAYAAAA+nNxPAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAnNSURBVFhHZZdLjGRVGcerqnv6Nd1dj/s6932rCpjpAXQnuFB0CQ7jmCjomJFxBHVBNCyIxMjKmBijILjQyNM4jWvNjE6iG11oogtCCGEkZAwiCQ3DQCa8QkI+///vu6e6uln8c+49596q7/e9zrmdMBxKHAUSqUbC+5mCoc5xPQwHuO9DHAcyGvahTVUw6uOZkbgkVCWt/G8mSSRpmkjqEr3mfBLzmUgc5nQNylKn0ue4judchN+EUtxnLpIii6SE6iKSpoxl2qSqTkDD1PAWAsbPg3D0MDTW5gfC94KRARFEofEb+mwMQwES48/5Hq+di2cG67UCwGgV5pIYxgMMyrCWZ05ywvFZvh+PADNUZclAcjeUKgtmQB0aENDgdhzBODWyvaex/tobSwPpVX2H6wqEyOA9g4jUeAWg11spnDoEoschzqeA8M+kkIKkBpDi93IXSpEiGmkACML0MfYlh4p0qDCdKEng5QAA9KwZZVGwP3NYL/IcAAHWPBA9z7TZTR8fKYsQ04/QQ3gfhmX0fmwOYNT2KcZvJ5DDOkE4OgBkBMhipFIMg0MABQpTuJFGhCAK4/rSidNUQhjESDC9IoQ2wg/Rq3mWSp5nCsJ7TT9AKAyvvSF4X9OIhgLKImTpxghRCjx7HobjHS+CxJhPoFktMAItBGvCxGtGJ5BSNYKGEEACGkZv4kfU0/QOc9Uxd1PkstN7znvxORppIGYgry0l98qaAyLJ5jDY0DHCvRYyHQZZBBgNi0KuaQTDc0SijYYXI1EQAPXBGqmykVT5EKkFI827ZiSNZgEyEmVRSFWWGhkrRuY408M/i3SJ/PsE86ln6bk31SCMBKHY3YrcwVA4TNMpmIEoTKtdANYK0skNkEoDRMGrbxGJYSBTiUC8TlATCpJZShGmxMh7Ronr+k6bKlq0MITjrPjnjScYaiscYn6AhoCmEBJEDTeAnHXUAuwHyRLUAwp8FgmkUkEAhTEIBXHaDiHt362QUvMgHHlvaUYIK3JLRxY1O5HNscA9kAJAWsxc57OAo2I8pxBoAqVGBk2FaeTHtkvlKGwWt9YEUqlEKhGmytCtsoGOFcaOGjpnbI6R15zTaKi4xnrhRkXvt0JaEcJqxteLyRvPUSMHzeoCDYFyENPJ14RC6MjCDlsZAGuBqUSjCdCgLsZlIJMqwoj2y7SpYCxVFqXWBI3/zE1Ozp9flbfe6smHH3bktdd6cvfdfaQRa6XdvJBmGaLH3dhvaDrPEZAE4bUvZr9P6P4wJ6aSbXRMod3WSm83ZQhDQ2mKEYwHQDGQMVUOZVKOZFqFMq0BUpeF1DCeIgSBrprksrOzIPffP5CtrUyaupAbPpFCVjtmvKWfRiwv4FU0hBZCBTBudNzcMt2hUXu6SwNEayLGO9yjHN5nJGyPoPfrIjTlMB4Ak9qMpdETACgIxOtJFSgoQAxiXp/+VCoiHbn+OkQL93vEqMH4b94VygsvHJAPPujKlSs9eWp7XSYNoXK573uBvPLKAkBRby3QI79ek3NnV7A20jUaryoSeexRrJ1blqefPiAP/fygHjnqIsAZaihvvtmV03dsGAiAGAVCMDKMUI0Uu+/etb0R8RrXpTz77JI8//wB+fa3QkToo898/piTo7ckcvW0kE/emMlzzy3JPffAi1g7csjJ++935QvH6X0a7DTCd90Zy5HDia4dP4bug6Kukd87Oz35xtf78oPvr8vFiwvYF0YajZMnNuTyG12ZjlEL8Pq05iEx0bposM56KaFrD6Fr1fAuPczRoExHDufy4AObqI0FuXy5Jw8/tCnXTHM8B5B9YpS4/rOfbsL7PCelcvbsmjz5xIaunbg9kUuXeoionZ/+8PslefyxFaRXILd9cUPXJk0oH7t2hAh34CC8h/rYPrMsv3lyuQVDys3E1Iswz2bAmkLX0g5FMd+5CepGiLaLORpEb566YyQvvriI1FhV6Ao1cexoLP/657K8915X05B68IE+nFCpTp+K1AmTppbfPbUOww/iP1gP+L2v9TUKrIft7RWsrbaGBfLHcweQhsu4HwIQUb11XTdASvcS3U9QTxk3SqsrNoiO7hvwIjsQxXsCZI6y67LIkCaxvPNOdwbyv5cX5C9/XpHr0AyqvNToGUgNI2qkQy1vXFqQUycd8rwnR2+OkbKVXD2ZIh251pOTX2UNYO0WeBwgJTx8+tSG7Lzaky9/aUNe/m/PANDBeHT3SmMo6rejqcNWmsLogp0HKmDU1uEUHg9l6xCNTOXj18dy5rdr8re/LsMTuUJeudKFp9ekqZyc+EooL720OAMZVw0iMUFq9eXChSU0hSW5ajyZ01ieeHwdNbgo/76wqBuePz816EKMxDPPLMgvHl7VeUZiBqEjjvKQA0CCDz6qwzZqrZI7KlMrlxtvcJpKb7/d1T3kVXho+8wqcpgRwlElTuS739mU11/vaeGe/9Oq1ghBmhIQ9RgRmcrxWwtNuZ/8GP2+4TwgEZVxVcrnbg517Uc/XFUD7RxlQI8+sqJrn70JKdWmDsXnHCLhQkaD3yXcVHEAVRCmjwpRgZElPE4gSy+b56jpx0NiyI2O4Fzjc6inzPYSplhd0NAGBo8VaFLjugIAux1qjxEuUSsFjiZ2lmq/+BQG3oZ+9ctl+cffF3FvAF5MJUIkFD67Y8hGgFhBW2HT6FKjYnVAKIrzLsLxBBAEyVqAIkUqKsh+mPmOhjmtKzrJAApsiHYopLcBotEYytY1A7nz9EF5990uIrahh0UeGu3gCBCmUrAJw6HRpkSqFsQMty5F46v22kN4EELkLkckmIrWDDQiKnMCI+qjSih2Q//bJc5qBCm5m/M8pV97Idos9hmNTqBp/J+LPWyAB3cLuf1OT5FCDinEKBgAT9EmwthZi973aj2rIwyi1+l9FUAsElbwll57AcwZ/I05CG3rKeateSgQASCC2PcGPc8zFkY13kBY0ARgHRhEK3wKqNp7RITe4p/thSgUhPelwjCdVIwGZAB8l8+1vzH7LW6c7SYLeRBNrVl97BaxplDrdd9OdwFYB4DwAPg8oJhO9klgtdJhO1XR0zNjDGBXlUIkqBNf7A5iE+A7PgpMSxreoDYaFLcXi1zV1knpj+38+iOQRoE1MN9SzUA1WI3fjQA/zDhyLcF3jXYttlOFYOH6KEDcTygPw5RiwSsI5HBMT9GGtW2jURCExe2NZ5eaV4NjT1MSiDB2/jI4vIv6YdrlPB3jY0tbqo+CB5lLI18X2rUAweexszNNLCJ764BggFDhWueYXg6pZecpArBVWxRo6D4A7BcqQsBoiiA+QhWlaUdn4qjPjy54mIVMCHo8xlflfvEZWzMYFw3l/3YvYB1QgRGxAAAAAElFTkSuQmCC"               # TODO: FILL THIS - "Savvy" button
+# Note: B64_OK is already defined above and will be reused for the 3 OK clicks